@@ -0,0 +1,126 @@
+"""Compare Jump Point Search with plain A* on large grids.
+
+Usage (from the python directory):
+    uv run python benchmarks/jump_point_search.py [--size 301]
+
+Runs corner-to-corner searches on an open field with scattered walls and on
+a maze, 4- and 8-connected, and reports nodes expanded and the median time
+of several runs for each.
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from aoc2025.utils.grid import Grid
+from aoc2025.utils.pathfinding import SearchStats, astar, jump_point_search
+
+
+def open_field(size: int, density: float = 0.05, seed: int = 0) -> Grid[str]:
+    """Create an open grid with a fraction of cells randomly walled."""
+    rng = random.Random(seed)
+    grid = Grid.filled(size, size, ".")
+    for y in range(size):
+        for x in range(size):
+            if rng.random() < density:
+                grid.set(x, y, "#")
+    grid.set(0, 0, ".")
+    grid.set(size - 1, size - 1, ".")
+    return grid
+
+
+def maze(size: int, seed: int = 0) -> Grid[str]:
+    """Create a perfect maze (by randomised depth-first search); size is odd."""
+    rng = random.Random(seed)
+    grid = Grid.filled(size, size, "#")
+    grid.set(0, 0, ".")
+    stack = [(0, 0)]
+    while stack:
+        x, y = stack[-1]
+        options = [
+            (x + dx, y + dy, dx // 2, dy // 2)
+            for dx, dy in ((2, 0), (-2, 0), (0, 2), (0, -2))
+            if grid.get(x + dx, y + dy) == "#"
+        ]
+        if not options:
+            stack.pop()
+            continue
+        nx, ny, hx, hy = rng.choice(options)
+        grid.set(x + hx, y + hy, ".")
+        grid.set(nx, ny, ".")
+        stack.append((nx, ny))
+    return grid
+
+
+def astar_on_grid(grid: Grid[str], diagonal: bool) -> tuple[int, int]:
+    """Run plain A* corner to corner; returns (cost, nodes expanded)."""
+    end = (grid.width - 1, grid.height - 1)
+    expanded = 0
+
+    def is_open(x, y):
+        return grid.get(x, y) not in (None, "#")
+
+    def neighbors(pos):
+        nonlocal expanded
+        expanded += 1
+        x, y = pos
+        for n in grid.neighbors(x, y):
+            if is_open(*n):
+                yield n, 1
+        if diagonal:
+            for dx in (1, -1):
+                for dy in (1, -1):
+                    if is_open(x + dx, y + dy) and is_open(x + dx, y) and is_open(
+                        x, y + dy
+                    ):
+                        yield (x + dx, y + dy), 1
+
+    def heuristic(pos):
+        dx, dy = end[0] - pos[0], end[1] - pos[1]
+        return max(dx, dy) if diagonal else dx + dy
+
+    cost = astar((0, 0), neighbors, heuristic, lambda p: p == end, returns="cost")
+    return cost, expanded
+
+
+def jps_on_grid(grid: Grid[str], diagonal: bool) -> tuple[int, int]:
+    """Run Jump Point Search corner to corner; returns (cost, nodes expanded)."""
+    stats = SearchStats()
+    end = (grid.width - 1, grid.height - 1)
+    cost = jump_point_search(
+        grid, (0, 0), end, lambda c: c == "#", diagonal, "cost", stats
+    )
+    return cost, stats.expanded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=301, help="grid side (odd)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per search")
+    args = parser.parse_args()
+    size = args.size | 1
+
+    header = f"{'grid':<12} {'moves':<6} {'search':<6} {'expanded':>9} {'ms':>8}"
+    print(header)
+    for name, grid in (("open field", open_field(size)), ("maze", maze(size))):
+        for diagonal in (False, True):
+            moves = "8-way" if diagonal else "4-way"
+            costs = set()
+            for search_name, search in (("A*", astar_on_grid), ("JPS", jps_on_grid)):
+                times = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    cost, expanded = search(grid, diagonal)
+                    times.append((time.perf_counter() - start) * 1000)
+                elapsed = statistics.median(times)
+                costs.add(cost)
+                print(
+                    f"{name:<12} {moves:<6} {search_name:<6} {expanded:>9} "
+                    f"{elapsed:>8.1f}"
+                )
+            assert len(costs) == 1, f"searches disagree: {costs}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compare the priority queue backends of dijkstra and astar on grid graphs.
+
+Usage (from the python directory):
+    uv run python benchmarks/pathfinding_queues.py [--size 300] [--repeat 5]
+
+For each grid a corner-to-corner search is run with every backend, reporting
+the median time and the peak memory traced during one run.
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+from aoc2025.utils.pathfinding import QUEUES, astar, dijkstra
+
+
+def weighted_grid(size: int, max_weight: int, seed: int = 0) -> list[list[int]]:
+    """Create a size x size grid of random cell weights from 1 to max_weight."""
+    rng = random.Random(seed)
+    return [[rng.randint(1, max_weight) for _ in range(size)] for _ in range(size)]
+
+
+def searches(weights: list[list[int]]):
+    """Build the (name, search(queue)) pairs for a grid."""
+    size = len(weights)
+    end = (size - 1, size - 1)
+
+    def neighbors(pos):
+        x, y = pos
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < size and 0 <= ny < size:
+                yield (nx, ny), weights[ny][nx]
+
+    def heuristic(pos):
+        return (size - 1 - pos[0]) + (size - 1 - pos[1])
+
+    def at_end(pos):
+        return pos == end
+
+    return [
+        ("dijkstra", lambda q: dijkstra((0, 0), neighbors, at_end, "cost", q)),
+        ("astar", lambda q: astar((0, 0), neighbors, heuristic, at_end, "cost", q)),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=300, help="grid side length")
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs each")
+    args = parser.parse_args()
+
+    print(f"{'grid':<18} {'search':<9} {'queue':<8} {'median ms':>10} {'peak KiB':>9}")
+    for max_weight in (1, 9):
+        weights = weighted_grid(args.size, max_weight)
+        label = f"{args.size}x{args.size} w1-{max_weight}"
+        for name, search in searches(weights):
+            costs = set()
+            for queue in QUEUES:
+                samples = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    costs.add(search(queue))
+                    samples.append((time.perf_counter() - start) * 1000)
+
+                tracemalloc.start()
+                search(queue)
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                median = statistics.median(samples)
+                print(
+                    f"{label:<18} {name:<9} {queue:<8} {median:>10.1f} "
+                    f"{peak / 1024:>9.0f}"
+                )
+            assert len(costs) == 1, f"backends disagree: {costs}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Benchmarking for day solutions.
+
+Runs each part several times after a number of warmup runs and summarises the
+timings, so sub-millisecond days and noisy slow days can both be compared.
+
+Runs can be saved as named baselines and later compared against. A part only
+counts as a regression when its median slowed down by more than a threshold
+*and* a one-sided Mann-Whitney U test says the slowdown is significant, so one
+noisy sample can't fail the gate.
+"""
+
+import contextlib
+import gc
+import json
+import math
+import os
+import statistics
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from .days import run_day
+from .input import DATA_DIR
+
+BASELINE_DIR = DATA_DIR / "cache" / "baselines"
+
+
+@dataclass
+class BenchResult:
+    """Timings for one day/part, in milliseconds."""
+
+    day: int
+    part: int
+    samples: list[float] = field(default_factory=list)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        return percentile(self.samples, 95)
+
+    @property
+    def stddev(self) -> float:
+        return statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to a JSON-serialisable dict including the summary statistics."""
+        return {
+            **asdict(self),
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "stddev": self.stddev,
+        }
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    """Calculate a percentile with linear interpolation between closest ranks.
+
+    Args:
+        samples: The values to summarise (need not be sorted)
+        pct: The percentile to calculate (0-100)
+    """
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return ordered[0]
+
+    rank = (len(ordered) - 1) * pct / 100
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def bench_part(
+    day: int,
+    part: int,
+    input_text: str,
+    warmups: int = 1,
+    repeats: int = 10,
+    disable_gc: bool = True,
+) -> BenchResult:
+    """Benchmark a single day/part.
+
+    Solver output is discarded while benchmarking. When ``disable_gc`` is set,
+    a full collection runs before each sample and the collector is paused while
+    the solver runs, so one sample doesn't pay for another's garbage.
+
+    Args:
+        day: Day number
+        part: Part number (1 or 2)
+        input_text: The puzzle input
+        warmups: Untimed runs before measuring
+        repeats: Timed runs
+        disable_gc: Pause the garbage collector during each timed run
+
+    Returns:
+        The collected samples in milliseconds.
+    """
+    result = BenchResult(day, part)
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for _ in range(warmups):
+            run_day(day, part, input_text)
+
+        gc_was_enabled = gc.isenabled()
+        try:
+            for _ in range(repeats):
+                if disable_gc:
+                    gc.collect()
+                    gc.disable()
+                start = time.perf_counter()
+                run_day(day, part, input_text)
+                result.samples.append((time.perf_counter() - start) * 1000)
+                if gc_was_enabled:
+                    gc.enable()
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    return result
+
+
+@dataclass
+class Comparison:
+    """A part's timings compared against a baseline."""
+
+    day: int
+    part: int
+    baseline_median: float
+    current_median: float
+    p_value: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change in median time (0.1 means 10% slower)."""
+        return self.current_median / self.baseline_median - 1
+
+
+def baseline_path(name: str) -> Path:
+    """Get the path of a named baseline file."""
+    return BASELINE_DIR / f"{name}.json"
+
+
+def save_baseline(name: str, results: list[BenchResult]) -> None:
+    """Save benchmark samples as a named baseline, merging with existing parts."""
+    path = baseline_path(name)
+    try:
+        baseline = json.loads(path.read_text())
+    except FileNotFoundError:
+        baseline = {}
+
+    for r in results:
+        baseline[f"{r.day:02d}-{r.part}"] = r.samples
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+
+
+def load_baseline(name: str) -> dict[tuple[int, int], list[float]]:
+    """Load a named baseline as {(day, part): samples}."""
+    path = baseline_path(name)
+    if not path.exists():
+        raise FileNotFoundError(f"No baseline named {name!r} at {path}")
+
+    baseline = {}
+    for key, samples in json.loads(path.read_text()).items():
+        day, part = key.split("-")
+        baseline[(int(day), int(part))] = samples
+    return baseline
+
+
+def mann_whitney_greater(baseline: list[float], current: list[float]) -> float:
+    """One-sided Mann-Whitney U test that ``current`` tends to be larger.
+
+    Uses the normal approximation with tie and continuity corrections, which
+    is reasonable from around 8 samples per side.
+
+    Returns:
+        The p-value; small values mean current is significantly slower.
+    """
+    n1, n2 = len(baseline), len(current)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+    combined = sorted(
+        [(v, 0) for v in baseline] + [(v, 1) for v in current], key=lambda t: t[0]
+    )
+
+    # Average ranks over ties
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tied = j - i + 1
+        tie_term += tied**3 - tied
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+
+    n = n1 + n2
+    mean = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    baseline: dict[tuple[int, int], list[float]],
+    results: list[BenchResult],
+    threshold: float,
+    alpha: float = 0.05,
+) -> list[Comparison]:
+    """Compare benchmark results against a baseline.
+
+    Args:
+        baseline: Samples per (day, part) from load_baseline
+        results: The current benchmark results
+        threshold: Allowed relative slowdown of the median (0.1 for 10%)
+        alpha: Significance level for the Mann-Whitney U test
+
+    Returns:
+        One Comparison per result that has baseline samples.
+    """
+    comparisons = []
+    for r in results:
+        samples = baseline.get((r.day, r.part))
+        if not samples:
+            continue
+
+        baseline_median = statistics.median(samples)
+        p_value = mann_whitney_greater(samples, r.samples)
+        slower = r.median > baseline_median * (1 + threshold)
+        comparisons.append(
+            Comparison(
+                day=r.day,
+                part=r.part,
+                baseline_median=baseline_median,
+                current_median=r.median,
+                p_value=p_value,
+                regressed=slower and p_value < alpha,
+            )
+        )
+    return comparisons
@@ -2,23 +2,92 @@
 
 Usage:
     uv run aoc solve <day> [--part <1|2>]
+    uv run aoc solve --all [--jobs <n>]
+    uv run aoc solve <day> --profile=cprofile|sample|memory
+    uv run aoc solve <day|--all> --timeout <seconds> --max-memory <size>
+    uv run aoc solve <day> --stream
+    uv run aoc cache stats|clear
+    uv run aoc serve [--socket <path>]
+    uv run aoc solve <day> --via-daemon
     uv run aoc download <day>
+    uv run aoc download --all [--refresh] [--jobs <n>] [--rate <per second>]
     uv run aoc new <day>
+    uv run aoc gen <day> [--scale <n>] [--seed <n>] [-o <path>]
+    uv run aoc bench <day|all> [--warmup <n>] [--repeat <n>] [--json <path>]
+    uv run aoc bench <day|all> --save-baseline <name> | --compare <name>
+    uv run aoc startup-report [--day <day>] [--top <n>]
 """
 
+import json
+import platform
 import time
+from datetime import datetime, timezone
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
 
 from . import input as aoc_input
-from .days import run_day
+from .days import (
+    available_days,
+    get_day,
+    has_parser,
+    has_stream_parser,
+    parse_input,
+    parse_lines,
+    run_day,
+    run_part,
+)
 from .scaffold import scaffold_day
 
-# Load .env from project root
-env_path = Path(__file__).parent.parent.parent.parent.parent / ".env"
-load_dotenv(env_path)
+
+class DayOrAll(click.ParamType):
+    """A day number (1-25) or the word "all"."""
+
+    name = "day|all"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int) or value == "all":
+            return value
+        try:
+            day = int(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a day number or 'all'", param, ctx)
+        if not 1 <= day <= 25:
+            self.fail(f"{day} is not in the range 1<=x<=25", param, ctx)
+        return day
+
+
+class Threshold(click.ParamType):
+    """A relative threshold given as a percentage ("10%") or fraction ("0.1")."""
+
+    name = "threshold"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, float):
+            return value
+        text = str(value).strip()
+        try:
+            if text.endswith("%"):
+                return float(text[:-1]) / 100
+            return float(text)
+        except ValueError:
+            self.fail(f"{value!r} is not a percentage like 10% or 0.1", param, ctx)
+
+
+class MemorySize(click.ParamType):
+    """A memory size in bytes, optionally suffixed with K, M or G."""
+
+    name = "size"
+
+    def convert(self, value, param, ctx):
+        if isinstance(value, int):
+            return value
+        from .isolation import parse_memory_size
+
+        try:
+            return parse_memory_size(value)
+        except ValueError:
+            self.fail(f"{value!r} is not a size like 512M or 2G", param, ctx)
 
 
 @click.group()
@@ -29,33 +98,376 @@ def main():
 
 
 @main.command()
-@click.argument("day", type=click.IntRange(1, 25))
+@click.argument("day", type=click.IntRange(1, 25), required=False)
 @click.option("--part", "-p", type=click.IntRange(1, 2), help="Run only part 1 or 2")
-def solve(day: int, part: int | None):
-    """Run a specific day's solution."""
+@click.option("--all", "all_days", is_flag=True, help="Run every implemented day")
+@click.option(
+    "--jobs", "-j", type=click.IntRange(1), help="Worker processes for --all"
+)
+@click.option("--example", is_flag=True, help="Use the example input")
+@click.option("--no-cache", is_flag=True, help="Don't read or write cached results")
+@click.option("--refresh", is_flag=True, help="Recompute and overwrite cached results")
+@click.option(
+    "--profile",
+    type=click.Choice(["cprofile", "sample", "memory"]),
+    help="Profile each part (bypasses the result cache)",
+)
+@click.option(
+    "--profile-out",
+    type=click.Path(file_okay=False, path_type=Path),
+    help="Directory for profile output (default: data/cache/profiles)",
+)
+@click.option("--via-daemon", is_flag=True, help="Solve using a running `aoc serve`")
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Daemon socket path (default: data/cache/aoc.sock)",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Kill a part after this many seconds (runs it in a subprocess)",
+)
+@click.option(
+    "--max-memory",
+    type=MemorySize(),
+    help="Memory limit per part, e.g. 512M or 2G (runs it in a subprocess)",
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Read the input lazily line by line (bypasses the result cache)",
+)
+def solve(
+    day: int | None,
+    part: int | None,
+    all_days: bool,
+    jobs: int | None,
+    example: bool,
+    no_cache: bool,
+    refresh: bool,
+    profile: str | None,
+    profile_out: Path | None,
+    via_daemon: bool,
+    socket_path: Path | None,
+    timeout: float | None,
+    max_memory: int | None,
+    stream: bool,
+):
+    """Run a specific day's solution (or every day with --all).
+
+    With --stream, days that define ``parse_stream`` are parsed straight from
+    the file without holding the whole input in memory.
+    """
+    if all_days == (day is not None):
+        raise click.UsageError("Pass either a DAY or --all")
+    if all_days and profile is not None:
+        raise click.UsageError("--profile can't be combined with --all")
+    if via_daemon and (all_days or profile is not None):
+        raise click.UsageError("--via-daemon solves a single day without --profile")
+    isolated = timeout is not None or max_memory is not None
+    if isolated and (profile is not None or via_daemon):
+        raise click.UsageError(
+            "--timeout/--max-memory can't be combined with --profile or --via-daemon"
+        )
+
+    if stream and (all_days or profile is not None or via_daemon or isolated):
+        raise click.UsageError(
+            "--stream solves a single day in-process; it can't be combined with "
+            "--all, --profile, --via-daemon, --timeout or --max-memory"
+        )
+
+    parts = [part] if part is not None else [1, 2]
+
+    if via_daemon:
+        _solve_via_daemon(day, parts, example, socket_path)
+        return
+    cache = None if no_cache or stream else _result_cache()
+
+    if all_days:
+        _solve_all(parts, jobs, example, cache, refresh, timeout, max_memory)
+        return
+
     click.echo(f"Advent of Code 2025 - Day {day:02d}")
     click.echo("=" * 40)
 
     # Get input (auto-download if missing)
     try:
-        input_text = aoc_input.get_input(day)
+        input_text = None if stream else _get_input(day, example)
+        lines = aoc_input.get_input_lines(day, example) if stream else None
     except Exception as e:
         click.echo(f"❌ Failed to get input: {e}", err=True)
         raise SystemExit(1)
 
-    # Run the solution(s)
-    if part is not None:
-        _run_part(day, part, input_text)
-    else:
-        _run_part(day, 1, input_text)
+    # Import the day up front so it isn't counted as parse time
+    get_day(day)
+
+    if profile is not None:
+        for i, p in enumerate(parts):
+            if i > 0:
+                click.echo()
+            _profile_part(day, p, input_text, profile, profile_out)
+        return
+
+    data = None
+    parse_ms = 0.0
+    solve_ms = 0.0
+
+    for i, p in enumerate(parts):
+        if i > 0:
+            click.echo()
+
+        cached = None if cache is None or refresh else cache.get(day, p, input_text)
+        if cached is not None:
+            click.echo(f"Part {p}: {cached} (cached)")
+            continue
+
+        if timeout is not None or max_memory is not None:
+            result = _run_isolated_part(day, p, input_text, timeout, max_memory)
+            if cache is not None:
+                cache.put(day, p, input_text, result)
+            continue
+
+        # Parse once (if the day has a parse hook), only when something runs
+        if data is None:
+            start = time.perf_counter()
+            if stream:
+                data = parse_lines(day, lines)
+            else:
+                data = parse_input(day, input_text)
+            parse_ms = (time.perf_counter() - start) * 1000
+            if stream and not has_stream_parser(day):
+                click.echo("⚠️ Day has no parse_stream hook; read the whole input")
+            if has_parser(day):
+                click.echo(f"Parse: {parse_ms:.3f}ms")
+                click.echo()
+
+        result, elapsed = _run_part(day, p, data)
+        solve_ms += elapsed
+        if cache is not None:
+            cache.put(day, p, input_text, result)
+
+    if data is not None and has_parser(day) and parse_ms + solve_ms > 0:
         click.echo()
-        _run_part(day, 2, input_text)
+        share = parse_ms / (parse_ms + solve_ms) * 100
+        click.echo(f"Parsing: {share:.1f}% of {parse_ms + solve_ms:.3f}ms total")
+
+    _report_cache(cache)
+
+
+def _run_isolated_part(
+    day: int,
+    part: int,
+    input_text: str,
+    timeout: float | None,
+    max_memory: int | None,
+) -> int | None:
+    """Run a part in a budgeted subprocess and display the outcome.
 
+    Exits with status 1 if the part breached its budget or failed.
+    """
+    from .isolation import run_isolated
+
+    outcome = run_isolated(day, part, input_text, timeout, max_memory)
+    peak = ""
+    if outcome.peak_rss_kb is not None:
+        peak = f", peak RSS {outcome.peak_rss_kb} KiB"
+
+    if outcome.status == "ok":
+        if outcome.result is None:
+            click.echo(f"Part {part}: Not implemented yet")
+        else:
+            click.echo(f"Part {part}: {outcome.result}")
+            click.echo(f"{outcome.elapsed_ms:.3f}ms{peak}")
+        return outcome.result
+
+    click.echo(f"Part {part}: ❌ {outcome.status}: {outcome.error}")
+    click.echo(f"  last progress: {outcome.elapsed_ms:.3f}ms{peak}")
+    raise SystemExit(1)
+
+
+def _solve_via_daemon(
+    day: int, parts: list[int], example: bool, socket_path: Path | None
+) -> None:
+    """Ask a running `aoc serve` daemon to solve each part."""
+    from . import daemon
+
+    socket_path = socket_path if socket_path is not None else daemon.SOCKET_PATH
+
+    click.echo(f"Advent of Code 2025 - Day {day:02d}")
+    click.echo("=" * 40)
+
+    for i, part in enumerate(parts):
+        if i > 0:
+            click.echo()
+
+        start = time.perf_counter()
+        try:
+            response = daemon.request(
+                {"op": "solve", "day": day, "part": part, "example": example},
+                socket_path,
+            )
+        except (OSError, RuntimeError) as e:
+            click.echo(f"❌ Couldn't reach the daemon at {socket_path}: {e}", err=True)
+            click.echo("   Start it with: uv run aoc serve", err=True)
+            raise SystemExit(1)
+        round_trip = (time.perf_counter() - start) * 1000
+
+        if not response["ok"]:
+            click.echo(f"❌ Part {part}: {response['error']}", err=True)
+            raise SystemExit(1)
+
+        if response["result"] is None:
+            click.echo(f"Part {part}: Not implemented yet")
+            continue
+
+        warm = "warm" if response["warm"] else f"parsed in {response['parse_ms']:.3f}ms"
+        click.echo(f"Part {part}: {response['result']}")
+        click.echo(
+            f"{response['solve_ms']:.3f}ms ({warm}, {round_trip:.3f}ms round trip)"
+        )
+
+
+def _get_input(day: int, example: bool) -> str:
+    """Get the example or real input for a day."""
+    return aoc_input.get_example(day) if example else aoc_input.get_input(day)
+
+
+def _result_cache():
+    """Create the on-disk result cache."""
+    from .result_cache import ResultCache
+
+    return ResultCache()
+
+
+def _report_cache(cache) -> None:
+    """Print this run's cache hits and misses and record them."""
+    if cache is None or cache.hits + cache.misses == 0:
+        return
+    click.echo()
+    click.echo(f"Cache: {cache.hits} hit(s), {cache.misses} miss(es)")
+    cache.save_stats()
+
+
+def _solve_all(
+    parts: list[int],
+    jobs: int | None,
+    example: bool,
+    cache,
+    refresh: bool,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+):
+    """Solve every day in a process pool, printing results as they finish."""
+    from .parallel import save_timings, solve_all
+
+    click.echo("Advent of Code 2025 - All Days")
+    click.echo("=" * 40)
+
+    inputs = {}
+    for day in available_days():
+        try:
+            inputs[day] = _get_input(day, example)
+        except Exception as e:
+            click.echo(f"❌ Day {day:02d}: failed to get input: {e}", err=True)
+
+    # Cached results are reported straight away; only misses go to the pool
+    tasks = []
+    for day, input_text in inputs.items():
+        for part in parts:
+            cached = None
+            if cache is not None and not refresh:
+                cached = cache.get(day, part, input_text)
+            if cached is not None:
+                click.echo(f"Day {day:02d} Part {part}: {cached}  (cached)")
+            else:
+                tasks.append((day, part))
 
-def _run_part(day: int, part: int, input_text: str):
-    """Run a single part and display the result with timing."""
     start = time.perf_counter()
-    result = run_day(day, part, input_text)
+    results = []
+    for r in solve_all(inputs, tasks, jobs, timeout, max_memory):
+        results.append(r)
+        if r.error is not None:
+            click.echo(f"Day {r.day:02d} Part {r.part}: ❌ {r.error}")
+        elif r.result is None:
+            click.echo(f"Day {r.day:02d} Part {r.part}: Not implemented yet")
+        else:
+            click.echo(
+                f"Day {r.day:02d} Part {r.part}: {r.result}  ({r.wall_ms:.3f}ms)"
+            )
+        if cache is not None and r.error is None:
+            cache.put(r.day, r.part, inputs[r.day], r.result)
+    wall = (time.perf_counter() - start) * 1000
+
+    save_timings(results)
+
+    cpu = sum(r.cpu_ms for r in results)
+    click.echo("=" * 40)
+    click.echo(f"Wall clock: {wall:.3f}ms")
+    click.echo(f"Summed CPU: {cpu:.3f}ms")
+    _report_cache(cache)
+    if any(r.error is not None for r in results):
+        raise SystemExit(1)
+
+
+def _profile_part(
+    day: int, part: int, input_text: str, mode: str, out_dir: Path | None
+) -> None:
+    """Parse and solve a single part under a profiler and report the results."""
+    from . import profiling
+
+    out_dir = out_dir if out_dir is not None else profiling.PROFILE_DIR
+    stem = f"day{day:02d}-part{part}"
+
+    def solve_part():
+        return run_day(day, part, input_text)
+
+    if mode == "cprofile":
+        path = out_dir / f"{stem}.pstats"
+        result, summary = profiling.run_cprofile(solve_part, path)
+        click.echo(f"Part {part}: {result}")
+        click.echo(summary.rstrip())
+        click.echo(f"📄 pstats: {path}")
+
+    elif mode == "sample":
+        try:
+            profiler = profiling.SamplingProfiler()
+        except RuntimeError as e:
+            click.echo(f"❌ {e}", err=True)
+            raise SystemExit(1)
+        result = profiler.run(solve_part)
+        collapsed = out_dir / f"{stem}.collapsed.txt"
+        speedscope = out_dir / f"{stem}.speedscope.json"
+        profiler.save(collapsed, speedscope, f"Day {day:02d} Part {part}")
+        click.echo(f"Part {part}: {result}")
+        click.echo(
+            f"{sum(profiler.samples.values())} samples over "
+            f"{profiler.elapsed * 1000:.3f}ms"
+        )
+        click.echo(f"📄 Collapsed stacks: {collapsed}")
+        click.echo(f"📄 Speedscope: {speedscope}")
+
+    else:
+        result, peak, sites = profiling.run_memory(day, part, input_text)
+        click.echo(f"Part {part}: {result}")
+        click.echo(f"Peak memory: {peak / 1024:.1f} KiB")
+        click.echo("Largest live allocations:")
+        for stat in sites:
+            frame = stat.traceback[0]
+            click.echo(
+                f"  {stat.size / 1024:10.1f} KiB  {stat.count:7d} blocks  "
+                f"{frame.filename}:{frame.lineno}"
+            )
+
+
+def _run_part(day: int, part: int, data) -> tuple[int | None, float]:
+    """Run a single part on parsed input and display the result with timing.
+
+    Returns the result and the elapsed time in milliseconds.
+    """
+    start = time.perf_counter()
+    result = run_part(day, part, data)
     elapsed = (time.perf_counter() - start) * 1000
 
     if result is not None:
@@ -64,20 +476,96 @@ def _run_part(day: int, part: int, input_text: str):
     else:
         click.echo(f"Part {part}: Not implemented yet")
 
+    return result, elapsed
+
 
 @main.command()
-@click.argument("day", type=click.IntRange(1, 25))
-def download(day: int):
-    """Download input for a day."""
-    click.echo(f"📥 Downloading input for Day {day:02d}...")
+@click.argument("day", type=click.IntRange(1, 25), required=False)
+@click.option("--all", "all_days", is_flag=True, help="Fetch every released day")
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Re-check inputs already on disk (with --all; a single DAY always does)",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(1),
+    default=4,
+    show_default=True,
+    help="Simultaneous connections",
+)
+@click.option(
+    "--rate",
+    type=click.FloatRange(0),
+    default=1.0,
+    show_default=True,
+    help="Maximum requests per second (0 for no limit)",
+)
+@click.option(
+    "--retries",
+    type=click.IntRange(0),
+    default=3,
+    show_default=True,
+    help="Retries after a transient failure",
+)
+@click.option(
+    "--base-url",
+    envvar="AOC_BASE_URL",
+    help="Site to download from (default: https://adventofcode.com)",
+)
+def download(
+    day: int | None,
+    all_days: bool,
+    refresh: bool,
+    jobs: int,
+    rate: float,
+    retries: int,
+    base_url: str | None,
+):
+    """Download input for a day (or every released day with --all)."""
+    if all_days == (day is not None):
+        raise click.UsageError("Pass either a DAY or --all")
+
+    from .downloader import download_days, released_days
+
+    if all_days:
+        days = released_days()
+        click.echo(f"📥 Downloading inputs for {len(days)} day(s)...")
+    else:
+        days = [day]
+        refresh = True
+        click.echo(f"📥 Downloading input for Day {day:02d}...")
 
     try:
-        path = aoc_input.download_input(day)
-        click.echo(f"✅ Input saved to: {path}")
+        results = download_days(
+            days,
+            url=base_url,
+            refresh=refresh,
+            concurrency=jobs,
+            rate=rate,
+            retries=retries,
+        )
     except Exception as e:
         click.echo(f"❌ Failed to download: {e}", err=True)
         raise SystemExit(1)
 
+    icons = {"downloaded": "✅", "unchanged": "🟰", "skipped": "⏭️"}
+    failed = 0
+    for r in results:
+        if r.status == "failed":
+            failed += 1
+            click.echo(
+                f"❌ Day {r.day:02d}: {r.error} ({r.attempts} attempt(s))", err=True
+            )
+        elif r.status == "skipped":
+            click.echo(f"{icons[r.status]} Day {r.day:02d}: already downloaded")
+        else:
+            click.echo(f"{icons[r.status]} Day {r.day:02d}: {r.status} ({r.path})")
+
+    if failed:
+        raise SystemExit(1)
+
 
 @main.command()
 @click.argument("day", type=click.IntRange(1, 25))
@@ -93,5 +581,225 @@ def new(day: int):
         raise SystemExit(1)
 
 
+@main.command()
+@click.argument("day", type=click.IntRange(1, 25))
+@click.option(
+    "--scale",
+    type=click.IntRange(1),
+    default=1,
+    show_default=True,
+    help="Size relative to the official input",
+)
+@click.option("--seed", type=int, default=0, show_default=True, help="Random seed")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write to a file instead of stdout",
+)
+def gen(day: int, scale: int, seed: int, output: Path | None):
+    """Generate a synthetic input for a day at a given scale."""
+    from .generators import generate
+
+    try:
+        text = generate(day, scale, seed)
+    except ValueError as e:
+        click.echo(f"❌ {e}", err=True)
+        raise SystemExit(1)
+
+    if output is None:
+        click.echo(text, nl=False)
+        return
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(text)
+    click.echo(f"📄 Day {day:02d} x{scale} input written to: {output}")
+
+
+@main.command()
+@click.argument("day", type=DayOrAll())
+@click.option(
+    "--part", "-p", type=click.IntRange(1, 2), help="Bench only part 1 or 2"
+)
+@click.option("--warmup", type=click.IntRange(0), default=1, help="Untimed runs first")
+@click.option("--repeat", type=click.IntRange(1), default=10, help="Timed runs")
+@click.option("--keep-gc", is_flag=True, help="Leave the garbage collector running")
+@click.option("--example", is_flag=True, help="Use the example input")
+@click.option(
+    "--json",
+    "json_path",
+    type=click.Path(dir_okay=False, allow_dash=True),
+    help="Write results as JSON to a file ('-' for stdout)",
+)
+@click.option("--save-baseline", metavar="NAME", help="Save timings as a baseline")
+@click.option("--compare", metavar="NAME", help="Compare against a saved baseline")
+@click.option(
+    "--threshold",
+    type=Threshold(),
+    default="10%",
+    show_default=True,
+    help="Allowed median slowdown before --compare fails",
+)
+@click.option(
+    "--alpha",
+    type=click.FloatRange(0, 1),
+    default=0.05,
+    show_default=True,
+    help="Significance level for --compare",
+)
+def bench(
+    day: int | str,
+    part: int | None,
+    warmup: int,
+    repeat: int,
+    keep_gc: bool,
+    example: bool,
+    json_path: str | None,
+    save_baseline: str | None,
+    compare: str | None,
+    threshold: float,
+    alpha: float,
+):
+    """Benchmark a day's solution (or all days) with repeated runs.
+
+    With --compare, exits non-zero if any part is significantly slower than
+    the baseline by more than --threshold.
+    """
+    from . import bench as aoc_bench
+    from .bench import bench_part
+
+    if compare is not None:
+        try:
+            baseline = aoc_bench.load_baseline(compare)
+        except FileNotFoundError as e:
+            click.echo(f"❌ {e}", err=True)
+            raise SystemExit(1)
+
+    days = available_days() if day == "all" else [day]
+    parts = [part] if part is not None else [1, 2]
+    # Keep stdout clean for the JSON document
+    to_stderr = json_path == "-"
+
+    results = []
+    for d in days:
+        try:
+            input_text = _get_input(d, example)
+        except Exception as e:
+            click.echo(f"❌ Day {d:02d}: failed to get input: {e}", err=True)
+            continue
+
+        for p in parts:
+            result = bench_part(
+                d, p, input_text, warmup, repeat, disable_gc=not keep_gc
+            )
+            results.append(result)
+            click.echo(
+                f"Day {d:02d} Part {p}: "
+                f"min {result.min:.3f}ms  median {result.median:.3f}ms  "
+                f"p95 {result.p95:.3f}ms  stddev {result.stddev:.3f}ms  (n={repeat})",
+                err=to_stderr,
+            )
+
+    if json_path is not None:
+        document = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "warmup": warmup,
+            "repeat": repeat,
+            "gc_disabled": not keep_gc,
+            "example": example,
+            "results": [r.to_dict() for r in results],
+        }
+        with click.open_file(json_path, "w") as f:
+            json.dump(document, f, indent=2)
+            f.write("\n")
+
+    if save_baseline is not None:
+        aoc_bench.save_baseline(save_baseline, results)
+        click.echo(f"💾 Saved baseline {save_baseline!r}", err=to_stderr)
+
+    if compare is not None:
+        comparisons = aoc_bench.compare(baseline, results, threshold, alpha)
+        click.echo(f"\nCompared with baseline {compare!r}:", err=to_stderr)
+        for c in comparisons:
+            status = "❌ slower" if c.regressed else "ok"
+            click.echo(
+                f"Day {c.day:02d} Part {c.part}: "
+                f"{c.baseline_median:.3f}ms -> {c.current_median:.3f}ms  "
+                f"({c.change:+.1%}, p={c.p_value:.3f})  {status}",
+                err=to_stderr,
+            )
+        if any(c.regressed for c in comparisons):
+            raise SystemExit(1)
+
+
+@main.group("cache")
+def cache_group():
+    """Inspect or clear the result cache."""
+    pass
+
+
+@cache_group.command("stats")
+def cache_stats():
+    """Show cumulative hit/miss counts and the number of cached results."""
+    result_cache = _result_cache()
+    stats = result_cache.load_stats()
+    hits, misses = stats.get("hits", 0), stats.get("misses", 0)
+    total = hits + misses
+    rate = hits / total * 100 if total else 0.0
+
+    click.echo(f"Entries: {len(result_cache.entries())} / {result_cache.max_entries}")
+    click.echo(f"Hits:    {hits}")
+    click.echo(f"Misses:  {misses}")
+    click.echo(f"Hit rate: {rate:.1f}%")
+
+
+@cache_group.command("clear")
+def cache_clear():
+    """Remove every cached result."""
+    removed = _result_cache().clear()
+    click.echo(f"🗑️  Removed {removed} cached result(s)")
+
+
+@main.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Socket path to listen on (default: data/cache/aoc.sock)",
+)
+def serve(socket_path: Path | None):
+    """Keep solvers and parsed inputs warm and answer `solve --via-daemon`."""
+    from . import daemon
+
+    socket_path = socket_path if socket_path is not None else daemon.SOCKET_PATH
+    click.echo(f"🔥 Serving on {socket_path} (Ctrl+C to stop)")
+    try:
+        daemon.serve(socket_path)
+    except RuntimeError as e:
+        click.echo(f"❌ {e}", err=True)
+        raise SystemExit(1)
+
+
+@main.command("startup-report")
+@click.option(
+    "--day", "-d", type=click.IntRange(1, 25), help="Only measure a single day"
+)
+@click.option(
+    "--top", type=click.IntRange(0), default=5, help="Heaviest imports to list"
+)
+def startup_report(day: int | None, top: int):
+    """Measure the cold import cost of the CLI and each day module."""
+    from .startup import startup_report as measure
+
+    days = [day] if day is not None else available_days()
+    modules = ["aoc2025.cli"] + [f"aoc2025.days.day{d:02d}" for d in days]
+
+    for module, total_us, heaviest in measure(modules, top=top):
+        click.echo(f"{module}: {total_us / 1000:.3f}ms")
+        for timing in heaviest:
+            click.echo(f"  {timing.self_us / 1000:8.3f}ms  {timing.module}")
+
+
 if __name__ == "__main__":
     main()
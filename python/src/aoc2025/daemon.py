@@ -0,0 +1,208 @@
+"""Warm solver daemon.
+
+``aoc serve`` keeps day modules and parsed inputs in memory and answers solve
+requests over a Unix domain socket, so repeated solves skip interpreter
+startup, imports and parsing. A day module is reloaded automatically when its
+source file, or that of an ``aoc2025.utils`` module it imports, changes.
+
+Protocol: the client connects, sends one JSON object terminated by a newline
+and reads one JSON object back, then the connection is closed.
+
+Requests:
+    {"op": "solve", "day": 1, "part": 1, "example": false}
+    {"op": "ping"}
+    {"op": "shutdown"}
+
+Responses always contain ``"ok"``; on failure they carry ``"error"``.
+"""
+
+import importlib
+import json
+import os
+import socket
+import socketserver
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+from . import input as aoc_input
+from .days import get_day, parse_input, rescan_days, run_part
+from .result_cache import solver_modules
+
+SOCKET_PATH = aoc_input.DATA_DIR / "cache" / "aoc.sock"
+
+# How many parsed inputs to keep warm
+MAX_PARSED = 32
+
+# Unix domain sockets aren't available everywhere (e.g. Windows); serve() and
+# request() check for support before this is used
+_UnixStreamServer = getattr(socketserver, "UnixStreamServer", socketserver.BaseServer)
+
+
+class SolverState:
+    """Warm modules and parsed inputs, shared by every request."""
+
+    def __init__(self, max_parsed: int = MAX_PARSED):
+        self.max_parsed = max_parsed
+        # day -> source mtime of the day module and each utils module it imports
+        self.module_mtimes: dict[int, dict[str, float]] = {}
+        # (day, input path, input mtime) -> parsed input
+        self.parsed: OrderedDict[tuple[int, str, float], Any] = OrderedDict()
+
+    def module(self, day: int) -> ModuleType | None:
+        """Get a day's module, reloading it if its or its utils' source changed."""
+        module = get_day(day)
+        if module is None:
+            # The day may have been scaffolded since the daemon started
+            rescan_days()
+            module = get_day(day)
+            if module is None:
+                return None
+
+        sources = solver_modules(day)
+        mtimes = {name: os.stat(path).st_mtime for name, path in sources.items()}
+        previous = self.module_mtimes.get(day)
+        if previous is not None and previous != mtimes:
+            # Dependencies come before the day, which then binds their new code
+            for name in list(sources)[:-1]:
+                if name in sys.modules:
+                    importlib.reload(sys.modules[name])
+            module = importlib.reload(module)
+            self.parsed = OrderedDict(
+                (key, value) for key, value in self.parsed.items() if key[0] != day
+            )
+        self.module_mtimes[day] = mtimes
+        return module
+
+    def data(self, day: int, example: bool) -> tuple[Any, float, bool]:
+        """Get the parsed input for a day, parsing it only if not already warm.
+
+        Returns:
+            The parsed input, the parse time in milliseconds and whether it
+            was already warm.
+        """
+        path = aoc_input.example_path(day) if example else aoc_input.input_path(day)
+        if not example and not path.exists():
+            aoc_input.download_input(day)
+
+        key = (day, str(path), os.stat(path).st_mtime)
+        if key in self.parsed:
+            self.parsed.move_to_end(key)
+            return self.parsed[key], 0.0, True
+
+        start = time.perf_counter()
+        data = parse_input(day, path.read_text())
+        parse_ms = (time.perf_counter() - start) * 1000
+
+        self.parsed[key] = data
+        while len(self.parsed) > self.max_parsed:
+            self.parsed.popitem(last=False)
+        return data, parse_ms, False
+
+    def handle(self, request: dict) -> dict:
+        """Handle a single decoded request."""
+        op = request.get("op")
+
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid()}
+
+        if op == "solve":
+            day = int(request["day"])
+            part = int(request["part"])
+            # Before loading the input, which may mean a download
+            if part not in (1, 2):
+                return {"ok": False, "error": f"Part must be 1 or 2, got {part}"}
+            if self.module(day) is None:
+                return {"ok": False, "error": f"Day {day} is not implemented yet"}
+
+            data, parse_ms, warm = self.data(day, bool(request.get("example")))
+
+            start = time.perf_counter()
+            result = run_part(day, part, data)
+            solve_ms = (time.perf_counter() - start) * 1000
+
+            if result is not None and not isinstance(result, (int, float)):
+                result = str(result)
+            return {
+                "ok": True,
+                "result": result,
+                "parse_ms": parse_ms,
+                "solve_ms": solve_ms,
+                "warm": warm,
+            }
+
+        return {"ok": False, "error": f"Unknown op: {op!r}"}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Reads one JSON request line and writes one JSON response line."""
+
+    server: "SolverServer"
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            if request.get("op") == "shutdown":
+                response = {"ok": True}
+                self.server.shutdown_requested = True
+            else:
+                response = self.server.state.handle(request)
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class SolverServer(_UnixStreamServer):
+    """Single-threaded Unix socket server around a SolverState."""
+
+    def __init__(self, socket_path: Path):
+        self.state = SolverState()
+        self.shutdown_requested = False
+        super().__init__(str(socket_path), _Handler)
+
+
+def _check_supported() -> None:
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The solver daemon needs Unix domain sockets")
+
+
+def serve(socket_path: Path = SOCKET_PATH) -> None:
+    """Run the daemon until it receives a shutdown request or is interrupted."""
+    _check_supported()
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if socket_path.exists():
+        try:
+            request({"op": "ping"}, socket_path)
+        except OSError:
+            # Left behind by a daemon that didn't shut down cleanly
+            socket_path.unlink()
+        else:
+            raise RuntimeError(f"A daemon is already listening on {socket_path}")
+
+    server = SolverServer(socket_path)
+    try:
+        while not server.shutdown_requested:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        socket_path.unlink(missing_ok=True)
+
+
+def request(payload: dict, socket_path: Path = SOCKET_PATH) -> dict:
+    """Send one request to the daemon and return its decoded response.
+
+    Raises:
+        OSError: If no daemon is listening on the socket.
+    """
+    _check_supported()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as reader:
+            return json.loads(reader.readline())
@@ -1,60 +1,156 @@
 """Day solution modules.
 
 Each day is implemented as a separate module (day01, day02, etc.).
+
+Day modules are discovered from this package and only imported the first time
+they are looked up, so running one day never pays the import cost of another
+(e.g. numpy for day10).
+
+A module may define ``parse(input_text)``. When it does, the input is parsed
+once and the parsed value is handed to both ``part_one`` and ``part_two``
+(which must not mutate it). Parts still accept raw input text so they can be
+called directly, e.g. from tests.
+
+A module may also define ``parse_stream(lines)``, taking an iterator of input
+lines (without line endings) and returning the same value as ``parse``. Days
+that opt in can be solved from a lazily read file without holding its raw text
+(see ``aoc2025.input.get_input_lines``); the parsed value is still held whole.
 """
 
-from . import (
-    day01,
-    day02,
-    day03,
-    day04,
-    day05,
-    day06,
-    day07,
-    day08,
-    day09,
-    day10,
-    day11,
-    day12,
-)
-
-# Dictionary mapping day numbers to modules
-DAYS = {
-    1: day01,
-    2: day02,
-    3: day03,
-    4: day04,
-    5: day05,
-    6: day06,
-    7: day07,
-    8: day08,
-    9: day09,
-    10: day10,
-    11: day11,
-    12: day12,
-}
+import importlib
+import pkgutil
+import re
+from collections.abc import Iterable, Iterator, Mapping
+from functools import cache
+from types import ModuleType
+from typing import Any
 
+_DAY_MODULE = re.compile(r"^day(\d{2})$")
 
-def run_day(day: int, part: int, input_text: str) -> int | None:
-    """Run a specific day and part, returning the result.
+
+@cache
+def _discover_days() -> frozenset[int]:
+    """Scan the package for dayNN modules (cached until rescan_days is called)."""
+    days = set()
+    for info in pkgutil.iter_modules(__path__):
+        match = _DAY_MODULE.match(info.name)
+        if match:
+            days.add(int(match.group(1)))
+    return frozenset(days)
+
+
+def rescan_days() -> None:
+    """Forget the cached day list so newly added modules are discovered."""
+    _discover_days.cache_clear()
+
+
+def available_days() -> list[int]:
+    """List the day numbers that have a solution module, without importing them."""
+    return sorted(_discover_days())
+
+
+def get_day(day: int) -> ModuleType | None:
+    """Import and return the module for a day, or None if it doesn't exist."""
+    if day not in _discover_days():
+        return None
+    return importlib.import_module(f"{__name__}.day{day:02d}")
+
+
+class _LazyDays(Mapping[int, ModuleType]):
+    """Read-only mapping of day number to module that imports on access."""
+
+    def __getitem__(self, day: int) -> ModuleType:
+        module = get_day(day)
+        if module is None:
+            raise KeyError(day)
+        return module
+
+    def __contains__(self, day: object) -> bool:
+        return day in _discover_days()
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(available_days())
+
+    def __len__(self) -> int:
+        return len(_discover_days())
+
+    def __repr__(self) -> str:
+        return f"DAYS({available_days()})"
+
+
+# Mapping of day numbers to modules (modules are imported lazily)
+DAYS = _LazyDays()
+
+
+def has_parser(day: int) -> bool:
+    """Check whether a day defines a shared ``parse`` hook."""
+    module = get_day(day)
+    return module is not None and hasattr(module, "parse")
+
+
+def parse_input(day: int, input_text: str) -> Any:
+    """Parse the input for a day using its ``parse`` hook.
+
+    Returns the input text unchanged if the day has no ``parse`` hook.
+    """
+    module = get_day(day)
+    if module is None or not hasattr(module, "parse"):
+        return input_text
+    return module.parse(input_text)
+
+
+def has_stream_parser(day: int) -> bool:
+    """Check whether a day defines a ``parse_stream`` hook."""
+    module = get_day(day)
+    return module is not None and hasattr(module, "parse_stream")
+
+
+def parse_lines(day: int, lines: Iterable[str]) -> Any:
+    """Parse input given as lines, streaming it if the day supports that.
+
+    Days without a ``parse_stream`` hook fall back to joining the lines and
+    calling parse_input, which reads the whole input into memory.
+    """
+    module = get_day(day)
+    if module is not None and hasattr(module, "parse_stream"):
+        return module.parse_stream(iter(lines))
+    return parse_input(day, "".join(f"{line}\n" for line in lines))
+
+
+def run_part(day: int, part: int, data: Any) -> int | None:
+    """Run a specific day and part on input already passed through parse_input.
 
     Args:
         day: Day number (1-25)
         part: Part number (1 or 2)
-        input_text: The puzzle input as a string
+        data: The value returned by parse_input for this day
 
     Returns:
         The answer if the solution is implemented, None otherwise.
     """
-    if day not in DAYS:
+    module = get_day(day)
+
+    if module is None:
         print(f"Day {day} is not implemented yet")
         return None
 
-    module = DAYS[day]
-
     if part == 1:
-        return module.part_one(input_text)
+        return module.part_one(data)
     elif part == 2:
-        return module.part_two(input_text)
+        return module.part_two(data)
     else:
         return None
+
+
+def run_day(day: int, part: int, input_text: str) -> int | None:
+    """Run a specific day and part, returning the result.
+
+    Args:
+        day: Day number (1-25)
+        part: Part number (1 or 2)
+        input_text: The puzzle input as a string
+
+    Returns:
+        The answer if the solution is implemented, None otherwise.
+    """
+    return run_part(day, part, parse_input(day, input_text))
@@ -45,34 +45,39 @@ def part_2_naive(input: str) -> bool:
     return True
 
 
-def part_one(input_text: str) -> int | None:
-    """Solve part one."""
+def parse(input_text: str) -> list[tuple[int, int]]:
+    """Parse the comma-separated ID ranges into (lower, upper) pairs."""
     lines = input_text.strip().split("\n")
 
-    ids = lines[0].split(",")
+    ranges = []
+    for id in lines[0].split(","):
+        lower, upper = id.split("-")
+        ranges.append((int(lower), int(upper)))
+    return ranges
+
+
+def part_one(input_text: str | list[tuple[int, int]]) -> int | None:
+    """Solve part one."""
+    ranges = parse(input_text) if isinstance(input_text, str) else input_text
 
     total = 0
 
-    for id in ids:
-        lower, upper = id.split("-")
-        for i in range(int(lower), int(upper) + 1):
+    for lower, upper in ranges:
+        for i in range(lower, upper + 1):
             valid = is_valid_int(i)
             if not valid:
                 total += i
     return total
 
 
-def part_two(input_text: str) -> int | None:
+def part_two(input_text: str | list[tuple[int, int]]) -> int | None:
     """Solve part two."""
-    lines = input_text.strip().split("\n")
-
-    ids = lines[0].split(",")
+    ranges = parse(input_text) if isinstance(input_text, str) else input_text
 
     total = 0
 
-    for id in ids:
-        lower, upper = id.split("-")
-        for i in range(int(lower), int(upper) + 1):
+    for lower, upper in ranges:
+        for i in range(lower, upper + 1):
             valid = part_2_naive(str(i))
             if not valid:
                 total += i
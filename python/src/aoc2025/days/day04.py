@@ -3,60 +3,42 @@
 https://adventofcode.com/2025/day/4
 """
 
-from aoc2025.utils.grid import Grid
+import numpy as np
 
+from aoc2025.utils.array_grid import ArrayGrid, neighbor_counts
+from aoc2025.utils.peeling import peel_cells
 
-def part_one(input_text: str) -> int | None:
+
+def parse(input_text: str) -> ArrayGrid:
+    """Parse the roll grid."""
+    return ArrayGrid.from_string(input_text.strip())
+
+
+def part_one(input_text: str | ArrayGrid) -> int | None:
     """Solve part one."""
-    grid = Grid.from_string(input_text.strip())
-
-    nice_neighbours = 0
-
-    for (x, y), c in grid.iter():
-        if c == "@" and (
-            len(
-                list(
-                    filter(
-                        lambda e: grid.get(e[0], e[1]) == "@",
-                        grid.neighbors_diagonal(x, y),
-                    )
-                )
-            )
-            < 4
-        ):
-            nice_neighbours += 1
-
-    return nice_neighbours
-
-
-def part_two(input_text: str) -> int | None:
-    """Solve part two."""
-    grid = Grid.from_string(input_text.strip())
-
-    nice_neighbours = 0
-    old_val = nice_neighbours
-
-    while True:
-        to_remove = []
-        for (x, y), c in grid.iter():
-            if c == "@" and (
-                len(
-                    list(
-                        filter(
-                            lambda e: grid.get(e[0], e[1]) == "@",
-                            grid.neighbors_diagonal(x, y),
-                        )
-                    )
-                )
-                < 4
-            ):
-                nice_neighbours += 1
-                to_remove.append((x, y))
-
-        for x, y in to_remove:
-            grid.set(x, y, ".")
-
-        if len(to_remove) == 0:
-            break
-
-    return nice_neighbours
+    grid = parse(input_text) if isinstance(input_text, str) else input_text
+
+    rolls = grid.mask("@")
+    accessible = rolls & (grid.neighbor_counts(rolls) < 4)
+
+    return int(accessible.sum())
+
+
+def part_two(input_text: str | ArrayGrid) -> int | None:
+    """Solve part two.
+
+    Removing accessible rolls until none are left peels the grid down to the
+    rolls with at least 4 neighbours, i.e. its 4-core.
+    """
+    grid = parse(input_text) if isinstance(input_text, str) else input_text
+
+    # A border of empty cells lets neighbours be reached by flat index offsets
+    rolls = np.pad(grid.mask("@"), 1)
+    stride = grid.width + 2
+    offsets = [dy * stride + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+    # Count neighbours once, vectorized; peeling then only touches removed rolls
+    alive = bytearray(rolls.tobytes())
+    counts = bytearray(neighbor_counts(rolls).tobytes())
+
+    return len(peel_cells(alive, offsets, 4, counts))
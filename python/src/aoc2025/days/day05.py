@@ -3,17 +3,36 @@
 https://adventofcode.com/2025/day/5
 """
 
-from aoc2025.utils.parsing import parse_groups
+from collections.abc import Iterator
+from itertools import dropwhile, takewhile
 
 
-def part_one(input_text: str) -> int | None:
-    """Solve part one."""
-    ranges, ids = parse_groups(input_text)
+Inventory = tuple[list[tuple[int, int]], list[int]]
+
+
+def parse(input_text: str) -> Inventory:
+    """Parse the fresh ID ranges and the available IDs."""
+    return parse_stream(iter(input_text.strip().split("\n")))
 
-    ids = [int(id) for id in ids.split("\n")]
+
+def parse_stream(lines: Iterator[str]) -> Inventory:
+    """Parse the ranges up to the blank line, then the IDs, one line at a time.
+
+    Only the raw text is streamed: both parts need every range and ID, so the
+    parsed lists are still held in full.
+    """
+    # Like parse's strip, ignore blank lines before the ranges
+    lines = dropwhile(lambda line: not line.strip(), lines)
     ranges = [
-        (int(r[0]), int(r[1])) for r in [r.split("-") for r in ranges.split("\n")]
+        (int(r[0]), int(r[1])) for r in [r.split("-") for r in takewhile(bool, lines)]
     ]
+    ids = [int(id) for id in lines if id]
+    return ranges, ids
+
+
+def part_one(input_text: str | Inventory) -> int | None:
+    """Solve part one."""
+    ranges, ids = parse(input_text) if isinstance(input_text, str) else input_text
 
     fresh_ids = 0
 
@@ -26,13 +45,9 @@ def part_one(input_text: str) -> int | None:
     return fresh_ids
 
 
-def part_two(input_text: str) -> int | None:
+def part_two(input_text: str | Inventory) -> int | None:
     """Solve part two."""
-    ranges, _ = parse_groups(input_text)
-
-    ranges = [
-        (int(r[0]), int(r[1])) for r in [r.split("-") for r in ranges.split("\n")]
-    ]
+    ranges, _ = parse(input_text) if isinstance(input_text, str) else input_text
 
     fresh_ids = 0
 
@@ -25,9 +25,10 @@ def check_and_add(splitter_x, splitter_y, valid_splitters):
             # and the most recent splitter at the same x position. If not, then
             # there is no way for the beam to enter the current splitter and thus
             # no beam will be split.
+            # A neighbouring column with no reachable splitter can't feed a beam
             if (
-                -valid_splitters[splitter_x - 1][0] == y
-                or -valid_splitters[splitter_x + 1][0] == y
+                -valid_splitters.get(splitter_x - 1, [1])[0] == y
+                or -valid_splitters.get(splitter_x + 1, [1])[0] == y
             ):
                 heapq.heappush(valid_splitters[splitter_x], -splitter_y)
                 return True
@@ -37,31 +38,29 @@ def check_and_add(splitter_x, splitter_y, valid_splitters):
     return False
 
 
-def part_one(input_text: str) -> int | None:
-    """Solve part one."""
+def parse(input_text: str) -> list[tuple[int, int]]:
+    """Find the splitters a beam can reach, ordered by y, then x."""
     grid = Grid.from_string(input_text)
     splitters = grid.find_all("^")
 
     valid_beam_splitters = {}
 
-    splitters = filter(
-        lambda x: check_and_add(x[0], x[1], valid_beam_splitters), splitters
+    return list(
+        filter(lambda x: check_and_add(x[0], x[1], valid_beam_splitters), splitters)
     )
 
-    return len(list(splitters))
 
+def part_one(input_text: str | list[tuple[int, int]]) -> int | None:
+    """Solve part one."""
+    splitters = parse(input_text) if isinstance(input_text, str) else input_text
 
-def part_two(input_text: str) -> int | None:
-    """Solve part two."""
-    grid = Grid.from_string(input_text)
-    splitters = grid.find_all("^")
+    return len(splitters)
 
-    valid_beam_splitters = {}
 
-    # Filter to get reachable splitters (already ordered by y, then x)
-    splitters = list(
-        filter(lambda x: check_and_add(x[0], x[1], valid_beam_splitters), splitters)
-    )
+def part_two(input_text: str | list[tuple[int, int]]) -> int | None:
+    """Solve part two."""
+    # Reachable splitters (already ordered by y, then x)
+    splitters = parse(input_text) if isinstance(input_text, str) else input_text
 
     # Build index: map x -> list of (y, index in splitters list)
     # This preserves ordering while allowing O(log n) lookups
@@ -3,7 +3,6 @@
 https://adventofcode.com/2025/day/8
 """
 
-import heapq
 from collections import Counter, defaultdict
 from math import prod
 
@@ -11,23 +10,35 @@ from aoc2025.utils.direction import Point3, euclidean_difference
 from aoc2025.utils.parsing import parse_numbers
 
 
-def part_one(input_text: str) -> int | None:
-    """Solve part one."""
+Pairs = list[tuple[float, Point3, Point3]]
+
+
+def parse(input_text: str) -> tuple[list[Point3], Pairs]:
+    """Parse the junction boxes and every pair of them, closest first."""
     lines = map(parse_numbers, input_text.strip().split("\n"))
     lines = list(map(lambda x: Point3(x), lines))
-    size = 10 if len(lines) < 21 else 1000
 
     distances = []
     for i, p in enumerate(lines):
         for p2 in lines[i + 1 :]:
-            heapq.heappush(distances, (euclidean_difference(p, p2), p, p2))
+            distances.append((euclidean_difference(p, p2), p, p2))
+    distances.sort()
+
+    return lines, distances
+
+
+def part_one(input_text: str | tuple[list[Point3], Pairs]) -> int | None:
+    """Solve part one."""
+    lines, distances = (
+        parse(input_text) if isinstance(input_text, str) else input_text
+    )
+    size = 10 if len(lines) < 21 else 1000
 
     connections = defaultdict(int)
     circuits = defaultdict(set)
     circuit_num = 0
 
-    for i in range(size):
-        _, p1, p2 = heapq.heappop(distances)
+    for _, p1, p2 in distances[:size]:
         p1_circuit = connections[p1]
         p2_circuit = connections[p2]
 
@@ -60,20 +71,17 @@ def part_one(input_text: str) -> int | None:
     return prod(map(lambda x: x[1], totals.most_common(3)))
 
 
-def part_two(input_text: str) -> int | None:
+def part_two(input_text: str | tuple[list[Point3], Pairs]) -> int | None:
     """Solve part two."""
-    lines = map(parse_numbers, input_text.strip().split("\n"))
-    lines = list(map(lambda x: Point3(x), lines))
+    lines, distances = (
+        parse(input_text) if isinstance(input_text, str) else input_text
+    )
 
-    distances = []
     junction_boxes = set(lines)
-
-    for i, p1 in enumerate(lines):
-        for p2 in lines[i + 1 :]:
-            heapq.heappush(distances, (euclidean_difference(p1, p2), p1, p2))
+    pairs = iter(distances)
 
     while len(junction_boxes) > 0:
-        _, p1, p2 = heapq.heappop(distances)
+        _, p1, p2 = next(pairs)
 
         total = p1[0] * p2[0]
 
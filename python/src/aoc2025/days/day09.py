@@ -4,17 +4,30 @@ https://adventofcode.com/2025/day/9
 """
 
 import heapq
-from collections import deque
+from collections.abc import Iterator
 
-from aoc2025.utils.direction import Direction, Point, manhattan_distance
+from aoc2025.utils.bit_grid import BitGrid
+from aoc2025.utils.direction import Point, manhattan_distance
 from aoc2025.utils.parsing import parse_unsigned
 
 
-def part_one(input_text: str) -> int | None:
+def parse(input_text: str) -> list[Point]:
+    """Parse the red tile corners."""
+    return parse_stream(iter(input_text.strip().split("\n")))
+
+
+def parse_stream(lines: Iterator[str]) -> list[Point]:
+    """Parse the red tile corners one line at a time.
+
+    Only the raw text is streamed: both parts compare every pair of corners,
+    so the parsed list is still held in full.
+    """
+    return [Point(parse_unsigned(line)) for line in lines if line]
+
+
+def part_one(input_text: str | list[Point]) -> int | None:
     """Solve part one."""
-    corners = list(
-        map(Point, [parse_unsigned(p) for p in input_text.strip().split("\n")])
-    )
+    corners = parse(input_text) if isinstance(input_text, str) else input_text
 
     distances = []
 
@@ -57,54 +70,45 @@ def calculate_area(rectangle):
     return (abs(x1 - x2) + 1) * (abs(y1 - y2) + 1)
 
 
-def rectangle_inside(p1, p2, polygon):
+def rectangle_inside(p1, p2, polygon: BitGrid):
     x1, y1 = p1
     x2, y2 = p2
     x_min, x_max = sorted((x1, x2))
     y_min, y_max = sorted((y1, y2))
-    for x in range(x_min, x_max + 1):
-        if (x, y_min) not in polygon or (x, y_max) not in polygon:
-            return False
+    # Top and bottom edges are checked a whole row span at a time
+    if not (
+        polygon.row_all(y_min, x_min, x_max) and polygon.row_all(y_max, x_min, x_max)
+    ):
+        return False
     for y in range(y_min, y_max + 1):
-        if (x_min, y) not in polygon or (x_max, y) not in polygon:
+        if not (polygon.test(x_min, y) and polygon.test(x_max, y)):
             return False
     return True
 
 
-def flood_fill(start, limits):
-    dirs = [d.delta for d in Direction]
-    visited = {start}
-    queue = deque([start])
-
-    while queue:
-        current = queue.popleft()
+def fill_polygon(borders) -> BitGrid:
+    """Find every cell on or inside the borders.
 
-        for dx, dy in dirs:
-            p = (current[0] + dx, current[1] + dy)
-            if p in limits:
-                continue
+    Rather than guessing a point inside the polygon, flood the outside in
+    from the edges of the bounding box and take everything else.
+    """
+    width = max(x for x, _ in borders) + 1
+    height = max(y for _, y in borders) + 1
+    walls = BitGrid.from_points(width, height, borders)
 
-            if p not in visited:
-                visited.add(p)
-                queue.append(p)
+    edges = BitGrid(width, height)
+    for y in range(height):
+        edges.rows[y] = edges.full if y in (0, height - 1) else 1 | 1 << (width - 1)
 
-    return visited
+    outside = (~walls).flood_fill(edges)
+    return ~outside
 
 
-def part_two(input_text: str):
-    coordinates = [
-        tuple(parse_unsigned(line)) for line in input_text.strip().split("\n")
-    ]
+def part_two(input_text: str | list[Point]):
+    coordinates = parse(input_text) if isinstance(input_text, str) else input_text
     compressed = compress_coordinates(coordinates)
     borders = create_borders(compressed)
-    if len(coordinates) == 8:
-        start_point = Point([1, 1])
-    else:
-        start_point = (150, 150)
-
-    interior = flood_fill(start_point, borders)
-
-    polygon = borders | interior
+    polygon = fill_polygon(borders)
     max_area = 0
     for i, p1 in enumerate(compressed):
         for j, p2 in enumerate(compressed[i + 1 :], i + 1):
@@ -4,13 +4,16 @@ https://adventofcode.com/2025/day/10
 """
 
 from collections import deque
-from functools import cache
 
 import numpy as np
 
+from aoc2025.utils.pathfinding import ida_star
 
-@cache
-def parse_input(input_text):
+Machines = tuple[list[list[str]], list[list[int]], list[list[int]]]
+
+
+def parse(input_text: str) -> Machines:
+    """Parse the light diagrams, button bitmasks and joltage requirements."""
     lines = input_text.strip().split("\n")
     machines = []
     buttons = []
@@ -73,48 +76,49 @@ def bfs(start, goal, options, max_depth=5):
     return shortest_solution_path
 
 
-def bfs2(start, goal, options, max_depth=5):
-    queue = deque([(start, [0] * len(goal), [start], 0)])
-    visited = set()
-    shortest_solution_length = float("inf")
-    shortest_solution_path = []
-
-    while queue:
-        current_op, current_val, current_path, current_depth = queue.popleft()
-        if current_depth >= max_depth or current_depth >= shortest_solution_length:
-            continue
-
-        if any(y > x for x, y in zip(goal, current_val)):
-            continue
-
-        state = (tuple(current_val), current_op, current_depth)
-
-        if state in visited:
-            continue
-
-        visited.add(state)
-
-        new_val = current_val
-        for i in current_op:
-            new_val[i] += 1
-
-        if goal == new_val:
-            solution_length = len(current_path)
-            if solution_length < shortest_solution_length:
-                shortest_solution_length = solution_length
-                shortest_solution_path = current_path
-            continue
-
-        for next_op in options:
-            new_path = current_path + [next_op]
-            queue.append((next_op, new_val[:], new_path, current_depth + 1))
-
-    return shortest_solution_path
+def fewest_presses(button_bits, joltage, stats=None):
+    """Find the fewest button presses that reach the joltage counters.
 
+    Each button adds 1 to the counters whose bits it has set. Presses are
+    made in button order (pressing order doesn't matter), so a node is the
+    counters plus the last button pressed. IDA* keeps memory bounded where
+    a breadth-first search over every counter tuple ran out.
+    """
+    size = len(joltage)
+    goal = tuple(joltage)
+    # Counter k is bit size - 1 - k of a button's mask
+    buttons = [
+        [k for k in range(size) if bits >> (size - 1 - k) & 1] for bits in button_bits
+    ]
 
-def part_one(input_text: str) -> int | None:
+    def press(node):
+        counters, last = node
+        for j in range(last, len(buttons)):
+            new = list(counters)
+            for k in buttons[j]:
+                new[k] += 1
+            if all(n <= g for n, g in zip(new, goal)):
+                yield (tuple(new), j), 1
+
+    def heuristic(node):
+        # Every press adds at most 1 to each counter
+        return max(g - c for g, c in zip(goal, node[0]))
+
+    return ida_star(
+        ((0,) * size, 0),
+        press,
+        heuristic,
+        lambda node: node[0] == goal,
+        returns="cost",
+        stats=stats,
+    )
+
+
+def part_one(input_text: str | Machines) -> int | None:
     """Solve part one."""
-    machines, button_sequences, _ = parse_input(input_text)
+    machines, button_sequences, _ = (
+        parse(input_text) if isinstance(input_text, str) else input_text
+    )
 
     solutions = {}
 
@@ -147,9 +151,11 @@ def solve_linear(target, vectors):
     return np.round(np.sum(alpha))
 
 
-def part_two(input_text: str) -> int | None:
+def part_two(input_text: str | Machines) -> int | None:
     """Solve part two."""
-    _, button_sequences, joltages = parse_input(input_text)
+    _, button_sequences, joltages = (
+        parse(input_text) if isinstance(input_text, str) else input_text
+    )
 
     solutions = {}
 
@@ -160,24 +166,19 @@ def part_two(input_text: str) -> int | None:
     return sum(solutions.values()) - 1
 
 
-def part_two_bfs(input_text: str) -> int | None:
-    """Solve part two."""
-    _, button_sequences, joltages = parse_input(input_text)
+def part_two_bfs(input_text: str | Machines) -> int | None:
+    """Solve part two by searching button presses instead of solving equations.
 
-    solutions = {}
+    Returns None if any machine's counters can't be reached.
+    """
+    _, button_sequences, joltages = (
+        parse(input_text) if isinstance(input_text, str) else input_text
+    )
 
+    total = 0
     for i, joltage in enumerate(joltages):
-        shortest_solution_length = float("inf")
-        print(f"Solving machine {i}")
-        for seq in button_sequences[i]:
-            shortest_solution_path = bfs2(
-                seq, joltage, button_sequences[i], max_depth=100
-            )
-            if (
-                shortest_solution_path
-                and len(shortest_solution_path) < shortest_solution_length
-            ):
-                solutions[i] = shortest_solution_path
-                shortest_solution_length = len(shortest_solution_path)
-
-    return sum((len(s) for s in solutions.values()))
+        presses = fewest_presses(button_sequences[i], joltage)
+        if presses is None:
+            return None
+        total += presses
+    return total
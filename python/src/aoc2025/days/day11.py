@@ -3,62 +3,52 @@
 https://adventofcode.com/2025/day/11
 """
 
-from collections import deque
 from functools import cache
 
+from aoc2025.utils.graph import Graph
 
-def bfs(start, goal, nodes):
-    visited = set()
-    queue = deque([(start, [start])])
-    solutions = []
 
-    while queue:
-        current_node, current_path = queue.popleft()
+def parse(input_text: str) -> Graph[str]:
+    """Parse the device outputs into a graph."""
+    return Graph.from_adjacency(input_text)
 
-        if current_node == goal:
-            solutions.append(current_path)
-            continue
 
-        for next_node in nodes[current_node]:
-            queue.append((next_node, current_path + [next_node]))
-
-    return solutions
-
-
-def part_one(input_text: str) -> int | None:
+def part_one(input_text: str | Graph[str]) -> int | None:
     """Solve part one."""
-    lines = input_text.strip().split("\n")
-    graph = {k[:-1]: v for k, *v in [line.split(" ") for line in lines]}
-    solutions = bfs("you", "out", graph)
+    graph = parse(input_text) if isinstance(input_text, str) else input_text
 
-    return len(solutions)
+    return count_paths(graph, "you", "out")
 
 
-def count_paths(start, goal, nodes, must_visit=frozenset()):
+def count_paths(graph: Graph[str], start, goal, must_visit=frozenset()):
+    ids = graph.ids
+    if start not in ids or goal not in ids or not must_visit <= ids.keys():
+        return 0
+    goal_id = ids[goal]
+    offsets, targets = graph.offsets, graph.targets
+    # One bit per node that must be visited
+    bits = {ids[node]: 1 << i for i, node in enumerate(must_visit)}
+
     @cache
     def count_from(node, remaining):
-        if node == goal:
-            return 1 if len(remaining) == 0 else 0
-
-        if node not in nodes:
-            return 0
+        if node == goal_id:
+            return 1 if remaining == 0 else 0
 
-        new_remaining = remaining - {node}
+        new_remaining = remaining & ~bits.get(node, 0)
 
         total = 0
-        for next_node in nodes[node]:
-            total += count_from(next_node, new_remaining)
+        for edge in range(offsets[node], offsets[node + 1]):
+            total += count_from(targets[edge], new_remaining)
 
         return total
 
-    return count_from(start, must_visit)
+    return count_from(ids[start], (1 << len(bits)) - 1)
 
 
-def part_two(input_text: str) -> int | None:
+def part_two(input_text: str | Graph[str]) -> int | None:
     """Solve part two."""
-    lines = input_text.strip().split("\n")
-    graph = {k[:-1]: v for k, *v in [line.split(" ") for line in lines]}
+    graph = parse(input_text) if isinstance(input_text, str) else input_text
 
-    count = count_paths("svr", "out", graph, frozenset(["dac", "fft"]))
+    count = count_paths(graph, "svr", "out", frozenset(["dac", "fft"]))
 
     return count
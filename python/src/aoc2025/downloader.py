@@ -0,0 +1,231 @@
+"""Concurrent input downloader.
+
+Fetches many days' inputs through one pooled ``httpx.AsyncClient``:
+
+- requests are spaced out by a rate limiter, so the site is never hammered
+- transient failures (timeouts, connection errors, 429 and 5xx) are retried
+  with exponential backoff
+- files are written atomically, so an interrupted run never leaves a
+  truncated input behind
+- the ETag/Last-Modified of each download is kept in a sidecar file and sent
+  back on refresh, so unchanged inputs aren't downloaded or rewritten
+
+The site can be swapped out (e.g. for a local stand-in in tests) by setting
+``AOC_BASE_URL`` or passing ``url``.
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import httpx
+
+from . import input as aoc_input
+
+BASE_URL = "https://adventofcode.com"
+USER_AGENT = "github.com/yourusername/aoc2025 by your@email.com"
+
+# Advent of Code 2025 has twelve puzzles, unlocking at midnight EST
+DAYS_IN_EVENT = 12
+UNLOCK_TZ = timezone(timedelta(hours=-5))
+
+# Statuses worth retrying; anything else is treated as a permanent failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass
+class DownloadResult:
+    """The outcome of fetching one day's input.
+
+    ``status`` is one of "downloaded", "unchanged", "skipped" (already on
+    disk and not refreshed) or "failed".
+    """
+
+    day: int
+    status: str
+    path: Path | None = None
+    attempts: int = 0
+    error: str | None = None
+
+
+class RateLimiter:
+    """Spaces out request starts to at most ``rate`` per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate if rate > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next = 0.0
+
+    async def wait(self) -> None:
+        """Wait until the next request may start."""
+        async with self._lock:
+            now = time.monotonic()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+                now = self._next
+            self._next = now + self.interval
+
+
+def base_url() -> str:
+    """Get the site to download from (``AOC_BASE_URL`` overrides the default)."""
+    return os.environ.get("AOC_BASE_URL", BASE_URL)
+
+
+def released_days(now: datetime | None = None) -> list[int]:
+    """List the days whose puzzles have unlocked."""
+    now = now or datetime.now(timezone.utc)
+    return [
+        day
+        for day in range(1, DAYS_IN_EVENT + 1)
+        if now >= datetime(aoc_input.AOC_YEAR, 12, day, tzinfo=UNLOCK_TZ)
+    ]
+
+
+def meta_path(day: int) -> Path:
+    """Get the path of the sidecar holding a day's caching headers."""
+    return aoc_input.DATA_DIR / "cache" / "downloads" / f"{day:02d}.json"
+
+
+def _load_meta(day: int) -> dict[str, str]:
+    try:
+        return json.loads(meta_path(day).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    """Write a file via a temporary file and a rename."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+async def _fetch(
+    client: httpx.AsyncClient,
+    day: int,
+    limiter: RateLimiter,
+    refresh: bool,
+    retries: int,
+    backoff: float,
+) -> DownloadResult:
+    path = aoc_input.input_path(day)
+    if path.exists() and not refresh:
+        return DownloadResult(day, "skipped", path)
+
+    headers = {}
+    if path.exists():
+        meta = _load_meta(day)
+        if "etag" in meta:
+            headers["If-None-Match"] = meta["etag"]
+        if "last_modified" in meta:
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    url = f"/{aoc_input.AOC_YEAR}/day/{day}/input"
+    result = DownloadResult(day, "failed")
+
+    delay = backoff
+    for attempt in range(retries + 1):
+        if attempt > 0:
+            await asyncio.sleep(delay)
+            delay *= 2
+        await limiter.wait()
+        result.attempts += 1
+
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.TransportError as e:
+            result.error = f"{type(e).__name__}: {e}"
+            continue
+
+        if response.status_code in RETRY_STATUSES:
+            result.error = f"HTTP {response.status_code}"
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, int(retry_after))
+            continue
+
+        if response.status_code == 304:
+            result.status, result.path, result.error = "unchanged", path, None
+            return result
+
+        if response.status_code != 200:
+            result.error = f"HTTP {response.status_code} - {response.text.strip()}"
+            return result
+
+        meta = {
+            key: response.headers[header]
+            for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified"))
+            if header in response.headers
+        }
+        if path.exists() and path.read_bytes() == response.content:
+            result.status = "unchanged"
+        else:
+            _atomic_write(path, response.content)
+            result.status = "downloaded"
+        if meta:
+            _atomic_write(meta_path(day), json.dumps(meta).encode())
+
+        result.path, result.error = path, None
+        return result
+
+    return result
+
+
+async def download_days_async(
+    days: list[int],
+    session: str | None = None,
+    url: str | None = None,
+    refresh: bool = False,
+    concurrency: int = 4,
+    rate: float = 1.0,
+    retries: int = 3,
+    backoff: float = 1.0,
+) -> list[DownloadResult]:
+    """Download several days' inputs concurrently over one pooled client.
+
+    Args:
+        days: Day numbers to fetch
+        session: AoC session cookie (defaults to AOC_SESSION, which is only
+            required if some day needs a request)
+        url: Site to download from (defaults to base_url())
+        refresh: Re-check inputs already on disk with conditional requests
+        concurrency: Maximum simultaneous connections
+        rate: Maximum requests started per second (0 for no limit)
+        retries: Extra attempts after a transient failure
+        backoff: Delay before the first retry, doubling for each one after
+
+    Returns:
+        One result per day, in the order given.
+    """
+    if not refresh and all(aoc_input.input_path(day).exists() for day in days):
+        # Nothing to request, so no session cookie is needed
+        return [
+            DownloadResult(day, "skipped", aoc_input.input_path(day)) for day in days
+        ]
+
+    session = session or aoc_input.get_session()
+    limiter = RateLimiter(rate)
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+
+    async with httpx.AsyncClient(
+        base_url=url or base_url(),
+        cookies={"session": session},
+        headers={"User-Agent": USER_AGENT},
+        limits=limits,
+        timeout=httpx.Timeout(30.0, pool=None),
+    ) as client:
+        return await asyncio.gather(
+            *(_fetch(client, day, limiter, refresh, retries, backoff) for day in days)
+        )
+
+
+def download_days(days: list[int], **kwargs) -> list[DownloadResult]:
+    """Synchronous wrapper around download_days_async."""
+    return asyncio.run(download_days_async(days, **kwargs))
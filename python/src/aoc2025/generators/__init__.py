@@ -0,0 +1,47 @@
+"""Deterministic synthetic input generators.
+
+Each ``dayNN`` module defines ``generate(rng, scale)`` returning puzzle input
+text in the same format as the official input. ``scale=1`` produces roughly
+the official input size, ``scale=10`` about ten times that, and so on, so
+solvers can be stress-tested and benchmarked at larger sizes.
+
+Generators are discovered and imported on demand, like ``aoc2025.days``.
+"""
+
+import importlib
+import pkgutil
+import random
+import re
+
+_DAY_MODULE = re.compile(r"^day(\d{2})$")
+
+
+def available_generators() -> list[int]:
+    """List the day numbers that have a generator."""
+    days = []
+    for info in pkgutil.iter_modules(__path__):
+        match = _DAY_MODULE.match(info.name)
+        if match:
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def generate(day: int, scale: int = 1, seed: int = 0) -> str:
+    """Generate an input for a day.
+
+    Args:
+        day: Day number
+        scale: Size multiplier relative to the official input (1, 10, 100, ...)
+        seed: Random seed; the same day/scale/seed always gives the same input
+
+    Raises:
+        ValueError: If the day has no generator or the scale is not positive.
+    """
+    if day not in available_generators():
+        raise ValueError(f"No generator for day {day}")
+    if scale < 1:
+        raise ValueError(f"Scale must be at least 1, got {scale}")
+
+    module = importlib.import_module(f"{__name__}.day{day:02d}")
+    rng = random.Random(f"aoc2025-day{day:02d}-scale{scale}-seed{seed}")
+    return module.generate(rng, scale)
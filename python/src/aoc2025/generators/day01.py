@@ -0,0 +1,16 @@
+"""Day 01 generator: dial rotations.
+
+Official input: ~4,500 rotations like "L68" or "R48".
+"""
+
+import random
+
+ROTATIONS = 4500
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate one rotation per line."""
+    lines = [
+        f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(ROTATIONS * scale)
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,25 @@
+"""Day 02 generator: product ID ranges.
+
+Official input: ~35 non-overlapping "lower-upper" ranges on a single
+comma-separated line, covering ~2 million IDs in total.
+"""
+
+import random
+
+RANGES = 35
+MAX_SPAN = 120_000
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate sorted, disjoint ranges, then shuffle their order."""
+    ranges = []
+    lower = rng.randint(10, 1000)
+    for _ in range(RANGES * scale):
+        # Spread ranges over many digit lengths, like the official input
+        lower += rng.randint(1, 10 ** rng.randint(2, 8))
+        upper = lower + rng.randint(0, MAX_SPAN)
+        ranges.append(f"{lower}-{upper}")
+        lower = upper + 1
+
+    rng.shuffle(ranges)
+    return ",".join(ranges) + "\n"
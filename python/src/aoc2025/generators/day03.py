@@ -0,0 +1,18 @@
+"""Day 03 generator: battery banks.
+
+Official input: 200 banks, each a line of 100 joltage digits (1-9).
+"""
+
+import random
+
+BANKS = 200
+BANK_LENGTH = 100
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate one bank of digits per line."""
+    lines = [
+        "".join(rng.choice("123456789") for _ in range(BANK_LENGTH))
+        for _ in range(BANKS * scale)
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,20 @@
+"""Day 04 generator: paper roll grid.
+
+Official input: a ~137x137 grid of "@" (roll) and "." cells, about 70% rolls.
+"""
+
+import math
+import random
+
+SIDE = 137
+DENSITY = 0.7
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate a square grid whose area grows with the scale."""
+    side = round(SIDE * math.sqrt(scale))
+    lines = [
+        "".join("@" if rng.random() < DENSITY else "." for _ in range(side))
+        for _ in range(side)
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,31 @@
+"""Day 05 generator: fresh ingredient ID ranges and available IDs.
+
+Official input: ~180 (often overlapping) ranges of 15-digit IDs, a blank
+line, then ~1,000 available IDs.
+"""
+
+import random
+
+RANGES = 180
+IDS = 1000
+MAX_ID = 560_000_000_000_000
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate overlapping ranges followed by IDs, some inside them."""
+    ranges = []
+    for _ in range(RANGES * scale):
+        lower = rng.randint(1, MAX_ID)
+        upper = lower + rng.randint(0, MAX_ID // 200)
+        ranges.append((lower, upper))
+
+    ids = []
+    for _ in range(IDS * scale):
+        if rng.random() < 0.5:
+            lower, upper = rng.choice(ranges)
+            ids.append(rng.randint(lower, upper))
+        else:
+            ids.append(rng.randint(1, MAX_ID))
+
+    range_lines = [f"{lower}-{upper}" for lower, upper in ranges]
+    return "\n".join(range_lines) + "\n\n" + "\n".join(map(str, ids)) + "\n"
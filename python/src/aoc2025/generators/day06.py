@@ -0,0 +1,33 @@
+"""Day 06 generator: cephalopod math worksheet.
+
+Official input: 4 rows of numbers and a row of operators, ~1,000 problems
+laid out in columns separated by a blank column. Numbers within a problem
+are 1-4 digits and aligned either left or right.
+
+Read column-wise (part two), a column's digits must be contiguous, so within
+a problem the number lengths only ever grow or only ever shrink going down.
+"""
+
+import random
+
+PROBLEMS = 1000
+ROWS = 4
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate the worksheet, padding every row to the same width."""
+    rows = [[] for _ in range(ROWS)]
+    operators = []
+
+    for _ in range(PROBLEMS * scale):
+        digits = [rng.randint(1, 4) for _ in range(ROWS)]
+        numbers = [str(rng.randint(10 ** (d - 1), 10**d - 1)) for d in digits]
+        numbers.sort(key=len, reverse=rng.random() < 0.5)
+        width = max(len(n) for n in numbers)
+        align = str.ljust if rng.random() < 0.5 else str.rjust
+        for row, number in zip(rows, numbers):
+            row.append(align(number, width))
+        operators.append(rng.choice("*+").ljust(width))
+
+    lines = [" ".join(row) for row in rows] + [" ".join(operators)]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,32 @@
+"""Day 07 generator: tachyon manifold.
+
+Official input: a 141x142 grid with the start "S" centred on the top row and
+splitters ("^") on every other row, spreading out one column per splitter
+row in a triangle below the start.
+"""
+
+import math
+import random
+
+SPLITTER_ROWS = 70
+DENSITY = 0.75
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate the manifold; its area grows with the scale."""
+    splitter_rows = round(SPLITTER_ROWS * math.sqrt(scale))
+    width = 2 * splitter_rows + 1
+    centre = splitter_rows
+    blank = "." * width
+
+    lines = [blank[:centre] + "S" + blank[centre + 1 :], blank]
+    for k in range(splitter_rows):
+        row = ["."] * width
+        for x in range(centre - k, centre + k + 1, 2):
+            # The first splitter is always hit; later ones are random
+            if k == 0 or rng.random() < DENSITY:
+                row[x] = "^"
+        lines.append("".join(row))
+        lines.append(blank)
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,21 @@
+"""Day 08 generator: junction boxes.
+
+Official input: 1,000 distinct "X,Y,Z" positions with coordinates below
+100,000.
+"""
+
+import random
+
+BOXES = 1000
+MAX_COORDINATE = 99_999
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate distinct 3D positions, one per line."""
+    boxes = set()
+    while len(boxes) < BOXES * scale:
+        boxes.add(tuple(rng.randint(0, MAX_COORDINATE) for _ in range(3)))
+
+    lines = [f"{x},{y},{z}" for x, y, z in boxes]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,44 @@
+"""Day 09 generator: red tile polygon.
+
+Official input: ~500 red tile corners of a closed rectilinear polygon, listed
+in order around its perimeter, with coordinates up to ~100,000. Each corner
+turns the perimeter, so every x and y value is shared by exactly two corners.
+"""
+
+import math
+import random
+
+CORNERS = 500
+RADIUS = 48_000
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate a staircase polygon around a circle.
+
+    Points are sampled at increasing angles on a circle and joined by a
+    horizontal then a vertical step. Because the circle is convex, steps on
+    the upper and lower halves occupy disjoint x ranges, so the polygon never
+    crosses itself.
+    """
+    radius = RADIUS * scale
+    centre = radius + rng.randint(1_000, 2_000)
+
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(CORNERS * scale // 2))
+    points = []
+    seen_x, seen_y = set(), set()
+    for angle in angles:
+        x = centre + round(radius * math.cos(angle))
+        y = centre + round(radius * math.sin(angle))
+        # A repeated x or y would leave a straight "corner" on an edge
+        if x in seen_x or y in seen_y:
+            continue
+        seen_x.add(x)
+        seen_y.add(y)
+        points.append((x, y))
+
+    corners = []
+    for (x1, y1), (x2, _) in zip(points, points[1:] + points[:1]):
+        corners.append((x1, y1))
+        corners.append((x2, y1))
+
+    return "\n".join(f"{x},{y}" for x, y in corners) + "\n"
@@ -0,0 +1,53 @@
+"""Day 10 generator: factory machines.
+
+Official input: ~180 machines, each a light diagram with 4-10 lights, 3-13
+buttons wiring subsets of the lights, and a joltage requirement per light,
+e.g. ``[.##.] (3) (1,3) (2) (2,3) (0,2) (0,1) {3,5,4,7}``.
+"""
+
+import random
+
+MACHINES = 180
+MAX_PRESSES = 25
+
+
+def _machine(rng: random.Random) -> str:
+    lights = rng.randint(4, 10)
+    buttons = [
+        sorted(rng.sample(range(lights), rng.randint(1, lights - 1)))
+        for _ in range(rng.randint(3, 13))
+    ]
+    # Make sure every light is wired to at least one button
+    for light in range(lights):
+        if not any(light in button for button in buttons):
+            button = rng.choice(buttons)
+            button.append(light)
+            button.sort()
+
+    # The diagram is what some combination of presses produces, so it is solvable
+    diagram = [False] * lights
+    while not any(diagram):
+        diagram = [False] * lights
+        for button in rng.sample(buttons, rng.randint(1, len(buttons))):
+            for light in button:
+                diagram[light] = not diagram[light]
+
+    # Likewise the joltages come from a known number of presses per button
+    joltages = [0] * lights
+    for button in buttons:
+        presses = rng.randint(0, MAX_PRESSES)
+        for light in button:
+            joltages[light] += presses
+
+    return " ".join(
+        [
+            "[" + "".join("#" if on else "." for on in diagram) + "]",
+            *("(" + ",".join(map(str, button)) + ")" for button in buttons),
+            "{" + ",".join(map(str, joltages)) + "}",
+        ]
+    )
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate one machine per line."""
+    return "\n".join(_machine(rng) for _ in range(MACHINES * scale)) + "\n"
@@ -0,0 +1,58 @@
+"""Day 11 generator: device graph.
+
+Official input: a DAG of ~600 devices with three-letter names, one
+"name: outputs..." line per device. Paths run from "svr" through "fft" and
+"dac" to "out", and "you" sits close enough to "out" that its paths can be
+enumerated one by one.
+"""
+
+import random
+import string
+
+DEVICES = 600
+
+# Depth of the graph; larger scales make layers wider, not the graph deeper
+LAYERS = 24
+
+RESERVED = {"svr", "fft", "dac", "you", "out"}
+
+
+def _names(rng: random.Random, count: int) -> list[str]:
+    length = 3
+    while len(string.ascii_lowercase) ** length - len(RESERVED) < count:
+        length += 1
+    names = set()
+    while len(names) < count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=length))
+        if name not in RESERVED:
+            names.add(name)
+    return list(names)
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate a layered graph.
+
+    Devices only link to the next layer, so every path from "svr" to "out"
+    crosses every layer; the whole layer before "fft" and "dac" links to
+    them, which keeps both on some of those paths.
+    """
+    names = _names(rng, DEVICES * scale - len(RESERVED))
+    rng.shuffle(names)
+
+    inner = LAYERS - 2
+    layers = [names[i::inner] for i in range(inner)]
+    layers[inner // 3].append("fft")
+    layers[2 * inner // 3].append("dac")
+    layers[inner - 4].append("you")
+    layers = [["svr"], *layers, ["out"]]
+
+    lines = []
+    for layer, next_layer in zip(layers, layers[1:]):
+        required = [name for name in next_layer if name in ("fft", "dac")]
+        for name in layer:
+            outputs = rng.sample(next_layer, min(len(next_layer), rng.randint(1, 4)))
+            outputs += [r for r in required if r not in outputs]
+            lines.append(f"{name}: {' '.join(outputs)}")
+
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
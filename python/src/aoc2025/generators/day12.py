@@ -0,0 +1,41 @@
+"""Day 12 generator: present shapes and tree regions.
+
+Official input: six numbered 3x3 present shapes, then ~1,000 regions like
+"41x37: 24 31 27 30 25 28" giving a region's size and how many of each shape
+must fit in it. Some regions have room for their presents and some don't.
+"""
+
+import random
+
+SHAPES = 6
+REGIONS = 1000
+
+
+def _shape(rng: random.Random) -> list[str]:
+    cells = set(rng.sample(range(9), rng.randint(5, 7)))
+    # Keep the centre filled, like every official shape
+    cells.add(4)
+    return [
+        "".join("#" if r * 3 + c in cells else "." for c in range(3))
+        for r in range(3)
+    ]
+
+
+def generate(rng: random.Random, scale: int) -> str:
+    """Generate the shapes, then regions filled to 70-120% of their area."""
+    shapes = [_shape(rng) for _ in range(SHAPES)]
+    areas = [sum(row.count("#") for row in shape) for shape in shapes]
+
+    blocks = [f"{i}:\n" + "\n".join(shape) for i, shape in enumerate(shapes)]
+
+    regions = []
+    for _ in range(REGIONS * scale):
+        width, height = rng.randint(35, 50), rng.randint(35, 50)
+        target = width * height * rng.uniform(0.7, 1.2)
+        # Roughly even counts per shape, scaled to cover the target area
+        weights = [rng.uniform(0.8, 1.2) for _ in range(SHAPES)]
+        per_weight = target / sum(w * a for w, a in zip(weights, areas))
+        counts = [round(w * per_weight) for w in weights]
+        regions.append(f"{width}x{height}: {' '.join(map(str, counts))}")
+
+    return "\n\n".join(blocks) + "\n\n" + "\n".join(regions) + "\n"
@@ -3,39 +3,106 @@
 Downloads puzzle inputs from adventofcode.com using the AOC_SESSION environment variable.
 """
 
+import mmap
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
-import httpx
-
 AOC_YEAR = 2025
 
 # Path to data directory (relative to this file's location)
 DATA_DIR = Path(__file__).parent.parent.parent.parent / "data"
 
+# Optional .env file in the project root holding AOC_SESSION
+ENV_PATH = DATA_DIR.parent / ".env"
+
 
 def input_path(day: int) -> Path:
     """Get the path to the input file for a given day."""
     return DATA_DIR / "inputs" / f"{day:02d}.txt"
 
 
+def example_path(day: int) -> Path:
+    """Get the path to the example input file for a given day."""
+    return DATA_DIR / "examples" / f"{day:02d}.txt"
+
+
+def get_example(day: int) -> str:
+    """Get the example input for a given day."""
+    return example_path(day).read_text()
+
+
 def get_input(day: int) -> str:
     """Get the input for a given day, downloading if necessary."""
-    path = input_path(day)
+    return _resolve(day, example=False).read_text()
+
 
-    if path.exists():
-        return path.read_text()
-    else:
+def _resolve(day: int, example: bool) -> Path:
+    """Get the path to a day's example or input, downloading the input if needed."""
+    if example:
+        return example_path(day)
+
+    path = input_path(day)
+    if not path.exists():
         print("📥 Input not found, downloading...")
         download_input(day)
-        return path.read_text()
+    return path
 
 
-def download_input(day: int) -> str:
-    """Download the input for a given day from adventofcode.com.
+def get_input_mmap(day: int, example: bool = False) -> mmap.mmap:
+    """Memory-map the input for a given day as read-only bytes.
 
-    Returns the path to the saved file.
+    The OS pages the file in on demand, so even very large inputs can be
+    scanned (e.g. with ``re.finditer`` on bytes patterns) without reading the
+    whole file into memory. Close the map when done, or use it as a context
+    manager.
+
+    Raises:
+        ValueError: If the input file is empty (empty files can't be mapped).
     """
+    with open(_resolve(day, example), "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def get_input_lines(day: int, example: bool = False) -> Iterator[str]:
+    """Lazily iterate over the lines of a day's input, without line endings.
+
+    Only one line is held in memory at a time. The file is closed once the
+    iterator is exhausted (or garbage collected).
+    """
+    path = _resolve(day, example)
+
+    def lines() -> Iterator[str]:
+        with open(path) as f:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+    return lines()
+
+
+def get_input_groups(day: int, example: bool = False) -> Iterator[list[str]]:
+    """Lazily iterate over a day's input as groups of lines split on blank lines.
+
+    Only the current group is held in memory.
+    """
+    # Imported here so the CLI doesn't load every utils module at startup
+    from .utils.parsing import iter_groups
+
+    return iter_groups(get_input_lines(day, example))
+
+
+def get_session() -> str:
+    """Get the AoC session cookie from AOC_SESSION (or the .env file).
+
+    Raises:
+        ValueError: If no session cookie is configured.
+    """
+    # Imported here so that solving an already-downloaded day doesn't pay for
+    # python-dotenv at startup
+    from dotenv import load_dotenv
+
+    load_dotenv(ENV_PATH)
+
     session = os.environ.get("AOC_SESSION")
     if not session:
         raise ValueError(
@@ -43,25 +110,22 @@ def download_input(day: int) -> str:
             'Set it with: $env:AOC_SESSION="your_session_cookie_value"\n'
             "Get the value from your browser's cookies at adventofcode.com"
         )
+    return session
 
-    url = f"https://adventofcode.com/{AOC_YEAR}/day/{day}/input"
-
-    response = httpx.get(
-        url,
-        cookies={"session": session},
-        headers={"User-Agent": "github.com/yourusername/aoc2025 by your@email.com"},
-    )
-
-    if response.status_code != 200:
-        raise RuntimeError(
-            f"Failed to download input: HTTP {response.status_code} - {response.text}"
-        )
 
-    content = response.text
-    path = input_path(day)
+def download_input(day: int, refresh: bool = True) -> str:
+    """Download the input for a given day from adventofcode.com.
 
-    # Ensure the directory exists
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
+    Goes through the pooled downloader, so it gets the same retries, atomic
+    write and conditional request as ``aoc download --all``.
 
-    return str(path)
+    Returns the path to the saved file.
+    """
+    # Imported here so that solving an already-downloaded day doesn't pay for
+    # httpx at startup
+    from .downloader import download_days
+
+    (result,) = download_days([day], refresh=refresh)
+    if result.status == "failed":
+        raise RuntimeError(f"Failed to download input: {result.error}")
+    return str(result.path)
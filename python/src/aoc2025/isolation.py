@@ -0,0 +1,161 @@
+"""Run a day/part in a worker subprocess with time and memory budgets.
+
+The worker applies an address-space rlimit to itself and sends periodic
+heartbeats (elapsed time and peak RSS) back to the parent. If the part runs
+past its timeout it is killed and the last heartbeat is reported, so a
+runaway solver can't hang a batch run.
+"""
+
+import multiprocessing
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from .days import get_day, run_day
+
+# Seconds between heartbeats from the worker
+HEARTBEAT_INTERVAL = 0.25
+
+# Grace period for a killed worker to exit
+KILL_GRACE = 1.0
+
+
+@dataclass
+class IsolatedResult:
+    """The outcome of running a part in a worker subprocess.
+
+    ``status`` is one of "ok", "timeout", "memory" or "error".
+    """
+
+    day: int
+    part: int
+    status: str
+    result: Any = None
+    elapsed_ms: float = 0.0
+    peak_rss_kb: int | None = None
+    error: str | None = None
+
+
+def parse_memory_size(text: str) -> int:
+    """Parse a size like "512M", "2G" or "1048576" into bytes."""
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    text = text.strip().upper().removesuffix("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    # ru_maxrss is in KiB on Linux (bytes on macOS, close enough for a report)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _worker(
+    conn: Connection, day: int, part: int, input_text: str, max_memory: int | None
+) -> None:
+    """Subprocess entry point: apply limits, solve, report back."""
+    lock = threading.Lock()
+    done = threading.Event()
+
+    def send(message: tuple) -> None:
+        with lock:
+            conn.send(message)
+
+    def heartbeat() -> None:
+        while not done.wait(HEARTBEAT_INTERVAL):
+            elapsed = (time.perf_counter() - start) * 1000
+            send(("progress", elapsed, _peak_rss_kb()))
+
+    # Import before limiting memory so the limit only has to cover solving
+    get_day(day)
+    if max_memory is not None and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (max_memory, max_memory))
+
+    start = time.perf_counter()
+    threading.Thread(target=heartbeat, daemon=True).start()
+    try:
+        result = run_day(day, part, input_text)
+        message = ("ok", result, None)
+    except MemoryError:
+        message = ("memory", None, "MemoryError")
+    except Exception as e:
+        message = ("error", None, f"{type(e).__name__}: {e}")
+    done.set()
+
+    elapsed = (time.perf_counter() - start) * 1000
+    send((*message, elapsed, _peak_rss_kb()))
+
+
+def run_isolated(
+    day: int,
+    part: int,
+    input_text: str,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> IsolatedResult:
+    """Run a day/part in a subprocess, killing it if it breaches its budget.
+
+    Args:
+        day: Day number
+        part: Part number (1 or 2)
+        input_text: The puzzle input
+        timeout: Wall-clock limit in seconds (None for no limit)
+        max_memory: Address-space limit in bytes (None for no limit;
+            ignored where the resource module is unavailable)
+
+    Returns:
+        The result, or the status and last known progress if the part failed.
+    """
+    parent_conn, child_conn = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_worker, args=(child_conn, day, part, input_text, max_memory)
+    )
+    process.start()
+    child_conn.close()
+
+    outcome = IsolatedResult(day, part, status="error")
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    try:
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                outcome.status = "timeout"
+                outcome.error = f"Timed out after {timeout}s"
+                break
+            if not parent_conn.poll(remaining):
+                continue
+            try:
+                message = parent_conn.recv()
+            except EOFError:
+                # Died without reporting back, e.g. killed by the kernel
+                outcome.status = "error"
+                outcome.error = None
+                break
+
+            kind = message[0]
+            if kind == "progress":
+                _, outcome.elapsed_ms, outcome.peak_rss_kb = message
+                continue
+
+            _, result, error, outcome.elapsed_ms, outcome.peak_rss_kb = message
+            outcome.status, outcome.result, outcome.error = kind, result, error
+            break
+    finally:
+        if process.is_alive():
+            process.kill()
+        process.join(KILL_GRACE)
+        parent_conn.close()
+
+    if outcome.error is None and outcome.status == "error":
+        outcome.error = f"Worker died (exit code {process.exitcode})"
+    return outcome
@@ -0,0 +1,176 @@
+"""Run many day/part solutions at once across a process pool.
+
+Tasks are scheduled longest-expected-first using the timings recorded by the
+previous run, so the slowest day starts immediately instead of last.
+"""
+
+import contextlib
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+
+from .days import get_day, run_day
+from .input import DATA_DIR
+
+# Per day/part timings from the last run, used for scheduling
+TIMINGS_PATH = DATA_DIR / "cache" / "timings.json"
+
+
+@dataclass
+class TaskResult:
+    """The outcome of solving one day/part in a worker."""
+
+    day: int
+    part: int
+    result: int | None
+    wall_ms: float
+    cpu_ms: float
+    error: str | None = None
+
+
+def _timing_key(day: int, part: int) -> str:
+    return f"{day:02d}-{part}"
+
+
+def load_timings() -> dict[str, float]:
+    """Load the previous run's wall-clock timings, keyed by "DD-P"."""
+    try:
+        return json.loads(TIMINGS_PATH.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_timings(results: list[TaskResult]) -> None:
+    """Merge the timings from a run into the timings file."""
+    timings = load_timings()
+    for r in results:
+        if r.error is None:
+            timings[_timing_key(r.day, r.part)] = r.wall_ms
+
+    TIMINGS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    TIMINGS_PATH.write_text(json.dumps(timings, indent=2, sort_keys=True))
+
+
+def schedule(tasks: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Order (day, part) tasks longest-expected-first.
+
+    Tasks with no previous timing go first, since they may be the slowest.
+    """
+    timings = load_timings()
+    return sorted(
+        tasks,
+        key=lambda t: timings.get(_timing_key(*t), float("inf")),
+        reverse=True,
+    )
+
+
+def _solve_task(
+    day: int,
+    part: int,
+    input_text: str,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> TaskResult:
+    """Worker entry point: solve one part, discarding anything it prints.
+
+    With a timeout or memory limit the part runs in its own budgeted
+    subprocess, so a runaway day is killed instead of holding up the pool.
+    """
+    if timeout is not None or max_memory is not None:
+        return _solve_isolated_task(day, part, input_text, timeout, max_memory)
+
+    # Import outside the timed region so timings reflect solving, not importing
+    get_day(day)
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    error = None
+    result = None
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            result = run_day(day, part, input_text)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+    return TaskResult(
+        day=day,
+        part=part,
+        result=result,
+        wall_ms=(time.perf_counter() - wall_start) * 1000,
+        cpu_ms=(time.process_time() - cpu_start) * 1000,
+        error=error,
+    )
+
+
+def _solve_isolated_task(
+    day: int,
+    part: int,
+    input_text: str,
+    timeout: float | None,
+    max_memory: int | None,
+) -> TaskResult:
+    from .isolation import run_isolated
+
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        outcome = run_isolated(day, part, input_text, timeout, max_memory)
+
+    return TaskResult(
+        day=day,
+        part=part,
+        result=outcome.result,
+        wall_ms=outcome.elapsed_ms,
+        # The work happened in a grandchild, so wall time is the best estimate
+        cpu_ms=outcome.elapsed_ms,
+        error=None if outcome.status == "ok" else f"{outcome.status}: {outcome.error}",
+    )
+
+
+def solve_all(
+    inputs: dict[int, str],
+    tasks: list[tuple[int, int]],
+    jobs: int | None = None,
+    timeout: float | None = None,
+    max_memory: int | None = None,
+) -> Iterator[TaskResult]:
+    """Solve day/part tasks in a process pool, yielding results as they finish.
+
+    Args:
+        inputs: Mapping of day number to puzzle input
+        tasks: The (day, part) pairs to solve
+        jobs: Number of worker processes (defaults to the CPU count)
+        timeout: Per-part wall-clock limit in seconds
+        max_memory: Per-part memory limit in bytes
+
+    Yields:
+        A TaskResult per task, in completion order. If a worker dies (e.g.
+        killed for running out of memory), its task and any the broken pool
+        can no longer run are reported as errors rather than raised.
+    """
+    if not tasks:
+        return
+    tasks = schedule(tasks)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                _solve_task, day, part, inputs[day], timeout, max_memory
+            ): (day, part)
+            for day, part in tasks
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                day, part = futures[future]
+                yield TaskResult(
+                    day=day,
+                    part=part,
+                    result=None,
+                    wall_ms=0.0,
+                    cpu_ms=0.0,
+                    error=f"{type(e).__name__}: {e}",
+                )
@@ -0,0 +1,179 @@
+"""Profiling helpers for day solutions.
+
+Three modes are supported:
+
+- cprofile: deterministic profile, saved as a pstats dump
+- sample: signal-based sampling profiler, saved as collapsed stacks (for
+  flamegraph.pl / inferno) and speedscope JSON
+- memory: tracemalloc peak usage and the largest allocation sites
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import signal
+import time
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from types import FrameType
+from typing import Any, Callable
+
+from .days import parse_input, run_part
+from .input import DATA_DIR
+
+PROFILE_DIR = DATA_DIR / "cache" / "profiles"
+
+# (function name, file, first line) identifying a sampled frame
+Frame = tuple[str, str, int]
+
+
+def run_cprofile(
+    func: Callable[[], Any], out_path: Path, top: int = 15
+) -> tuple[Any, str]:
+    """Run a function under cProfile and save the stats.
+
+    Args:
+        func: The function to profile
+        out_path: Where to write the pstats dump (load with pstats or snakeviz)
+        top: How many functions to include in the returned summary
+
+    Returns:
+        The function's result and a summary sorted by cumulative time.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    profiler.dump_stats(out_path)
+
+    summary = io.StringIO()
+    stats = pstats.Stats(profiler, stream=summary)
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    return result, summary.getvalue()
+
+
+class SamplingProfiler:
+    """Statistical profiler driven by SIGPROF.
+
+    Every ``interval`` seconds of CPU time the interpreter is interrupted and
+    the current Python stack is recorded. Only available where
+    ``signal.setitimer`` exists (not on Windows).
+    """
+
+    def __init__(self, interval: float = 0.001):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError(
+                "Sampling needs signal.setitimer, which this platform lacks"
+            )
+        self.interval = interval
+        self.samples: Counter[tuple[Frame, ...]] = Counter()
+        self.elapsed = 0.0
+
+    def run(self, func: Callable[[], Any]) -> Any:
+        """Run a function while sampling its stack."""
+        stop_code = self.run.__code__
+
+        def handler(signum: int, frame: FrameType | None) -> None:
+            stack = []
+            while frame is not None and frame.f_code is not stop_code:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+        previous = signal.signal(signal.SIGPROF, handler)
+        start = time.perf_counter()
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        try:
+            return func()
+        finally:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            self.elapsed = time.perf_counter() - start
+            signal.signal(signal.SIGPROF, previous)
+
+    @staticmethod
+    def _frame_name(frame: Frame) -> str:
+        name, filename, line = frame
+        return f"{name} ({Path(filename).name}:{line})"
+
+    def collapsed(self) -> str:
+        """Format the samples as collapsed stacks, one "a;b;c count" per line."""
+        lines = [
+            ";".join(self._frame_name(f) for f in stack) + f" {count}"
+            for stack, count in self.samples.most_common()
+        ]
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str) -> dict:
+        """Format the samples as a speedscope "sampled" profile."""
+        frames: list[Frame] = []
+        index: dict[Frame, int] = {}
+        samples = []
+        weights = []
+
+        for stack, count in self.samples.items():
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append(frame)
+            samples.append([index[f] for f in stack])
+            weights.append(count * self.interval)
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "aoc2025",
+            "name": name,
+            "activeProfileIndex": 0,
+            "shared": {
+                "frames": [
+                    {"name": n, "file": f, "line": line} for n, f, line in frames
+                ]
+            },
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "seconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def save(self, collapsed_path: Path, speedscope_path: Path, name: str) -> None:
+        """Write both the collapsed stacks and the speedscope JSON."""
+        collapsed_path.parent.mkdir(parents=True, exist_ok=True)
+        collapsed_path.write_text(self.collapsed())
+        speedscope_path.write_text(json.dumps(self.speedscope(name)))
+
+
+def run_memory(
+    day: int, part: int, input_text: str, top: int = 10
+) -> tuple[Any, int, list[tracemalloc.Statistic]]:
+    """Solve a part under tracemalloc.
+
+    The snapshot is taken before the parsed input is released, so large
+    parsed structures show up among the allocation sites.
+
+    Returns:
+        The result, the peak traced memory in bytes, and the largest
+        allocation sites still live when the part returned.
+    """
+    tracemalloc.start(25)
+    try:
+        data = parse_input(day, input_text)
+        result = run_part(day, part, data)
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__)]
+    )
+    return result, peak, snapshot.statistics("lineno")[:top]
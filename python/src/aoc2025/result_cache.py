@@ -0,0 +1,195 @@
+"""Persistent cache of solution results.
+
+Results are keyed on the day, the part, a hash of the input and a hash of the
+solver's source (the day module plus every ``aoc2025.utils`` module it pulls
+in), so editing a day or a utility it uses invalidates just the affected
+entries. The least recently used entries are evicted once the cache is full.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from .input import DATA_DIR
+
+CACHE_DIR = DATA_DIR / "cache" / "results"
+STATS_FILE = "stats.json"
+MAX_ENTRIES = 500
+
+# Root of the aoc2025 package, used to find module sources without importing
+PACKAGE_DIR = Path(__file__).parent
+
+
+def _module_path(module: str) -> Path | None:
+    """Map a dotted aoc2025 module name to its source file."""
+    parts = module.split(".")
+    if parts[0] != "aoc2025":
+        return None
+    base = PACKAGE_DIR.joinpath(*parts[1:])
+    if (base / "__init__.py").exists():
+        return base / "__init__.py"
+    if base.with_suffix(".py").exists():
+        return base.with_suffix(".py")
+    return None
+
+
+def _utils_imports(path: Path, module: str) -> set[str]:
+    """Find the aoc2025.utils modules imported by a source file."""
+    package = module if path.name == "__init__.py" else module.rpartition(".")[0]
+    found = set()
+
+    for node in ast.walk(ast.parse(path.read_text())):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base = package.rsplit(".", node.level - 1)[0]
+                name = f"{base}.{node.module}" if node.module else base
+            else:
+                name = node.module or ""
+            # "from pkg import mod" may name submodules as well as attributes
+            names = [name] + [f"{name}.{alias.name}" for alias in node.names]
+        else:
+            continue
+
+        for name in names:
+            if name.startswith("aoc2025.utils") and _module_path(name):
+                found.add(name)
+
+    return found
+
+
+def solver_modules(day: int) -> dict[str, Path]:
+    """Find the source files of a day module and the utils modules it depends on.
+
+    Returns:
+        Mapping of dotted module name to source file, with each module after
+        the modules it imports, so reloading them in order picks up every
+        change.
+    """
+    order: dict[str, Path] = {}
+    seen: set[str] = set()
+
+    def visit(module: str) -> None:
+        seen.add(module)
+        path = _module_path(module)
+        if path is None:
+            return
+        for dependency in sorted(_utils_imports(path, module)):
+            if dependency not in seen:
+                visit(dependency)
+        order[module] = path
+
+    visit(f"aoc2025.days.day{day:02d}")
+    return order
+
+
+def solver_hash(day: int) -> str:
+    """Hash the source of a day module and the utils modules it depends on."""
+    digest = hashlib.sha256()
+    for module, path in sorted(solver_modules(day).items()):
+        digest.update(module.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(day: int, part: int, input_text: str) -> str:
+    """Build the content-addressed key for a day/part/input."""
+    input_hash = hashlib.sha256(input_text.encode()).hexdigest()
+    key = f"{day}:{part}:{input_hash}:{solver_hash(day)}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class ResultCache:
+    """On-disk LRU cache of solution results, one JSON file per entry."""
+
+    def __init__(self, directory: Path = CACHE_DIR, max_entries: int = MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, day: int, part: int, input_text: str) -> int | None:
+        """Look up a cached result, or None on a miss."""
+        path = self._entry_path(cache_key(day, part, input_text))
+        try:
+            result = json.loads(path.read_text())["result"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            self.misses += 1
+            return None
+
+        # Refresh the modification time, which is what LRU eviction goes by
+        os.utime(path)
+        self.hits += 1
+        return result
+
+    def put(self, day: int, part: int, input_text: str, result: int | None) -> None:
+        """Store a result. Missing (None) and non-JSON results are not cached."""
+        if result is None:
+            return
+        try:
+            content = json.dumps({"day": day, "part": part, "result": result})
+        except TypeError:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(cache_key(day, part, input_text))
+        # A temp file per writer, so concurrent puts of one key (e.g. from
+        # solve --all --jobs N) don't clobber each other's before the rename
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(content)
+        os.replace(tmp.name, path)
+        self._evict()
+
+    def entries(self) -> list[Path]:
+        """List the cache entries, least recently used first."""
+        if not self.directory.exists():
+            return []
+        mtimes = {}
+        for p in self.directory.glob("*.json"):
+            if p.name == STATS_FILE:
+                continue
+            try:
+                mtimes[p] = p.stat().st_mtime
+            except FileNotFoundError:
+                # Evicted by a concurrent writer since the glob
+                continue
+        return sorted(mtimes, key=mtimes.__getitem__)
+
+    def _evict(self) -> None:
+        """Remove least recently used entries beyond max_entries."""
+        entries = self.entries()
+        for path in entries[: max(0, len(entries) - self.max_entries)]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> int:
+        """Remove every entry and the stats. Returns the number of entries removed."""
+        entries = self.entries()
+        for path in entries:
+            path.unlink(missing_ok=True)
+        (self.directory / STATS_FILE).unlink(missing_ok=True)
+        return len(entries)
+
+    def load_stats(self) -> dict[str, int]:
+        """Load the cumulative hit/miss counts."""
+        try:
+            return json.loads((self.directory / STATS_FILE).read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"hits": 0, "misses": 0}
+
+    def save_stats(self) -> None:
+        """Add this session's hits and misses to the cumulative counts."""
+        stats = self.load_stats()
+        stats["hits"] = stats.get("hits", 0) + self.hits
+        stats["misses"] = stats.get("misses", 0) + self.misses
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / STATS_FILE).write_text(json.dumps(stats))
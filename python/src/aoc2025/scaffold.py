@@ -38,16 +38,9 @@ def scaffold_day(day: int) -> None:
         example_path.write_text("# Paste example input here\n")
         print(f"  📄 Created: {example_path}")
 
-    # Print instructions for manual step
+    # No registration needed: aoc2025.days discovers dayNN modules on demand
     print()
-    print("📝 Manual step required:")
-    print("   Add the import to src/aoc2025/days/__init__.py:")
-    print()
-    print(f"   from . import day{day_str}")
-    print()
-    print("   And add to the DAYS dict:")
-    print()
-    print(f"   {day}: day{day_str},")
+    print(f"📝 Day {day} will be picked up automatically by `aoc solve {day}`.")
 
 
 def _generate_day_template(day: int) -> str:
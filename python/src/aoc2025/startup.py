@@ -0,0 +1,101 @@
+"""Import-time (cold start) measurement.
+
+Each module is imported in a fresh interpreter with ``-X importtime``, after
+the CLI entry point, so the numbers reflect what a single ``aoc solve``
+invocation actually pays: the CLI, the ``aoc2025`` packages and the day module.
+"""
+
+import subprocess
+import sys
+from dataclasses import dataclass
+
+
+@dataclass
+class ImportTiming:
+    """Import cost of a single module, in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int = 0
+
+
+# Written to stderr once interpreter startup is done, to split its imports
+# (site, encodings, ...) from the ones being measured
+_MARKER = "-- aoc2025 startup --"
+
+
+def measure_import(*modules: str) -> list[ImportTiming]:
+    """Import modules in a fresh interpreter and return every import they triggered.
+
+    Args:
+        modules: Dotted module names to import in order, e.g. "aoc2025.cli",
+            "aoc2025.days.day10"
+
+    Returns:
+        One entry per module the imports triggered, in the order the
+        interpreter finished them. Parent packages (e.g. "aoc2025") are
+        separate entries at depth 0.
+    """
+    code = f"import sys; print({_MARKER!r}, file=sys.stderr, flush=True)\n"
+    code += "".join(f"import {module}\n" for module in modules)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import {', '.join(modules)}:\n{result.stderr}")
+
+    _, _, measured = result.stderr.partition(_MARKER)
+    return _parse_importtime(measured)
+
+
+def _parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the stderr produced by ``python -X importtime``."""
+    timings = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            # Header line
+            continue
+        # Nesting is shown by indenting the name two spaces per level
+        name = fields[2][1:]
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(name.lstrip())) // 2,
+            )
+        )
+    return timings
+
+
+def startup_report(
+    modules: list[str], top: int = 5, entry: str = "aoc2025.cli"
+) -> list[tuple[str, int, list[ImportTiming]]]:
+    """Measure the cold import cost of several modules.
+
+    Each module is imported in its own fresh interpreter after the entry
+    point, so its total is everything a cold run of it pays, including the
+    entry point and parent packages.
+
+    Args:
+        modules: Dotted module names to measure
+        top: How many of the heaviest imports to keep per module
+        entry: Module imported first, as the ``aoc`` script does
+
+    Returns:
+        List of (module, cumulative_us, heaviest_imports) tuples.
+    """
+    report = []
+    for module in modules:
+        imports = [entry] if module == entry else [entry, module]
+        timings = measure_import(*imports)
+        total = sum(t.cumulative_us for t in timings if t.depth == 0)
+        heaviest = sorted(timings, key=lambda t: t.self_us, reverse=True)[:top]
+        report.append((module, total, heaviest))
+    return report
@@ -1,13 +1,50 @@
 """Utility modules for Advent of Code 2025.
 
 Common utilities, data structures, and algorithms.
+
+NumPy-backed utilities (``ArrayGrid``) are imported on first access, so days
+that don't use them don't pay for importing numpy.
 """
 
+import importlib
+
 from .arrays import rotate_180, rotate_left, rotate_right, transpose
+from .bit_grid import BitGrid
 from .direction import Direction, Point, manhattan_distance, move_point
+from .flat_grid import FlatGrid
+from .graph import Graph
 from .grid import Grid
-from .parsing import parse_grid, parse_groups, parse_lines, parse_numbers
-from .pathfinding import astar, bfs, dijkstra, flood_fill
+from .parsing import (
+    iter_groups,
+    parse_grid,
+    parse_groups,
+    parse_lines,
+    parse_numbers,
+)
+from .pathfinding import (
+    BucketQueue,
+    IndexedHeap,
+    LazyHeap,
+    Search,
+    SearchStats,
+    astar,
+    beam_search,
+    bfs,
+    bidirectional_astar,
+    bidirectional_bfs,
+    dijkstra,
+    distance_map,
+    flood_fill,
+    ida_star,
+    iter_astar,
+    iter_bfs,
+    iter_dijkstra,
+    jump_point_search,
+    reconstruct_path,
+    weighted_distance_map,
+)
+from .peeling import peel, peel_cells
+from .sparse_grid import SparseGrid
 
 __all__ = [
     # Arrays
@@ -20,16 +57,53 @@ __all__ = [
     "Point",
     "manhattan_distance",
     "move_point",
+    # Graph
+    "Graph",
     # Grid
     "Grid",
+    "ArrayGrid",
+    "BitGrid",
+    "FlatGrid",
+    "SparseGrid",
     # Parsing
     "parse_numbers",
     "parse_grid",
     "parse_lines",
     "parse_groups",
+    "iter_groups",
     # Pathfinding
     "bfs",
     "dijkstra",
     "astar",
     "flood_fill",
+    "BucketQueue",
+    "IndexedHeap",
+    "LazyHeap",
+    "Search",
+    "SearchStats",
+    "beam_search",
+    "bidirectional_astar",
+    "bidirectional_bfs",
+    "distance_map",
+    "ida_star",
+    "iter_astar",
+    "iter_bfs",
+    "iter_dijkstra",
+    "jump_point_search",
+    "reconstruct_path",
+    "weighted_distance_map",
+    # Peeling
+    "peel",
+    "peel_cells",
 ]
+
+
+# Attribute name -> submodule, for exports that are imported on first access
+_LAZY = {"ArrayGrid": "array_grid"}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,195 @@
+"""NumPy-backed grid for character grids.
+
+Provides an ArrayGrid class with the same interface as Grid[str], plus
+vectorized operations (masks and neighbour counts) that work on the whole
+grid at once instead of cell by cell.
+"""
+
+from typing import Iterator
+
+import numpy as np
+
+# Offsets (dy, dx) of the 4 cardinal and 4 diagonal neighbours
+_CARDINAL = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+_DIAGONAL = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+
+class ArrayGrid:
+    """A 2D grid of characters stored as a uint8 array.
+
+    ``data[y, x]`` holds the byte value of the character at (x, y), so
+    numpy operations can be applied to ``data`` directly.
+    """
+
+    def __init__(self, data: np.ndarray):
+        """Create a grid from a 2D uint8 array.
+
+        Args:
+            data: Array where data[y, x] is the byte value at position (x, y)
+        """
+        self.data = data
+        self.height, self.width = data.shape
+
+    @classmethod
+    def from_string(cls, input_text: str) -> "ArrayGrid":
+        """Parse a grid from a multi-line string.
+
+        The text is reinterpreted as a byte array and reshaped, so no per-cell
+        Python objects are created.
+
+        Raises:
+            ValueError: If the lines are not all the same length.
+        """
+        raw = bytearray(input_text.strip().replace("\r\n", "\n").encode())
+        width = raw.find(b"\n")
+        if width == -1:
+            width = len(raw)
+        # Append the newline the last line is missing, so every row is width + 1
+        raw.append(ord("\n"))
+        if len(raw) % (width + 1):
+            raise ValueError("All grid lines must be the same length")
+
+        rows = np.frombuffer(raw, dtype=np.uint8).reshape(-1, width + 1)
+        if not (rows[:, width] == ord("\n")).all():
+            raise ValueError("All grid lines must be the same length")
+        return cls(rows[:, :width])
+
+    @classmethod
+    def filled(cls, width: int, height: int, value: str) -> "ArrayGrid":
+        """Create a grid filled with a single character."""
+        return cls(np.full((height, width), ord(value), dtype=np.uint8))
+
+    def copy(self) -> "ArrayGrid":
+        """Return a grid with its own copy of the data."""
+        return ArrayGrid(self.data.copy())
+
+    def get(self, x: int, y: int) -> str | None:
+        """Get the character at (x, y), or None if out of bounds."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return chr(self.data[y, x])
+        return None
+
+    def set(self, x: int, y: int, value: str) -> bool:
+        """Set the character at (x, y). Returns True if successful."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.data[y, x] = ord(value)
+            return True
+        return False
+
+    def neighbors(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Get the 4 cardinal neighbors (N, S, E, W) of a position."""
+        return self._neighbors(x, y, _CARDINAL)
+
+    def neighbors_diagonal(self, x: int, y: int) -> list[tuple[int, int]]:
+        """Get all 8 neighbors including diagonals."""
+        return self._neighbors(x, y, _CARDINAL + _DIAGONAL)
+
+    def _neighbors(
+        self, x: int, y: int, offsets: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        return [
+            (x + dx, y + dy)
+            for dy, dx in offsets
+            if 0 <= x + dx < self.width and 0 <= y + dy < self.height
+        ]
+
+    def mask(self, value: str) -> np.ndarray:
+        """Get a boolean array that is True wherever the grid holds value."""
+        return self.data == ord(value)
+
+    def count(self, value: str) -> int:
+        """Count the cells holding value."""
+        return int(np.count_nonzero(self.mask(value)))
+
+    def neighbor_counts(
+        self, value: str | np.ndarray, diagonal: bool = True
+    ) -> np.ndarray:
+        """Count, for every cell at once, how many neighbours match.
+
+        Args:
+            value: A character to match, or a boolean mask of matching cells
+            diagonal: Count all 8 neighbours instead of the 4 cardinal ones
+
+        Returns:
+            A uint8 array the shape of the grid. Cells beyond the edge never
+            match.
+        """
+        mask = self.mask(value) if isinstance(value, str) else value
+        return neighbor_counts(mask, diagonal)
+
+    def iter(self) -> Iterator[tuple[tuple[int, int], str]]:
+        """Iterate over all positions and characters."""
+        for y, row in enumerate(self.data.tolist()):
+            for x, value in enumerate(row):
+                yield (x, y), chr(value)
+
+    def find(self, value: str) -> tuple[int, int] | None:
+        """Find the first position (in row order) with the given value."""
+        flat = self.mask(value).ravel()
+        index = int(flat.argmax())
+        if not flat[index]:
+            return None
+        y, x = divmod(index, self.width)
+        return (x, y)
+
+    def find_all(self, value: str) -> list[tuple[int, int]]:
+        """Find all positions (in row order) with the given value."""
+        ys, xs = np.nonzero(self.mask(value))
+        return list(zip(xs.tolist(), ys.tolist()))
+
+    def rotate_right(self) -> "ArrayGrid":
+        """Rotate the grid 90 degrees clockwise.
+
+        Returns a view: no data is copied, and writes show through to the
+        original grid.
+        """
+        return ArrayGrid(np.rot90(self.data, k=-1))
+
+    def rotate_left(self) -> "ArrayGrid":
+        """Rotate the grid 90 degrees counter-clockwise.
+
+        Returns a view: no data is copied, and writes show through to the
+        original grid.
+        """
+        return ArrayGrid(np.rot90(self.data, k=1))
+
+    def row(self, y: int) -> list[str] | None:
+        """Get an entire row by index.
+
+        Args:
+            y: The row index (0-indexed from top)
+
+        Returns:
+            A copy of the row as a list, or None if out of bounds.
+        """
+        if 0 <= y < self.height:
+            return list(self.data[y].tobytes().decode())
+        return None
+
+    def __str__(self) -> str:
+        """Convert grid to string for display."""
+        return "\n".join(row.tobytes().decode() for row in self.data)
+
+    def __repr__(self) -> str:
+        return f"ArrayGrid({self.width}x{self.height})"
+
+
+def neighbor_counts(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    """Count the True neighbours of every cell of a boolean mask.
+
+    Pads the mask with a border of False and sums shifted slices of it, one
+    per neighbour offset.
+
+    Args:
+        mask: 2D boolean array
+        diagonal: Count all 8 neighbours instead of the 4 cardinal ones
+
+    Returns:
+        A uint8 array the shape of the mask.
+    """
+    padded = np.pad(mask.astype(np.uint8), 1)
+    height, width = mask.shape
+    counts = np.zeros(mask.shape, dtype=np.uint8)
+    for dy, dx in _CARDINAL + (_DIAGONAL if diagonal else []):
+        counts += padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+    return counts
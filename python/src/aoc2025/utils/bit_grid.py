@@ -0,0 +1,230 @@
+"""Boolean grid stored as one int bitmask per row.
+
+Provides a BitGrid class for occupancy grids. Bit ``x`` of ``rows[y]`` is the
+cell at (x, y), so a whole row is combined, shifted or counted with a single
+big-int operation, and a cell costs one bit instead of a list slot.
+"""
+
+from typing import Iterable, Iterator
+
+
+class BitGrid:
+    """A 2D boolean grid with one Python int per row."""
+
+    __slots__ = ("rows", "width", "height", "full")
+
+    def __init__(self, width: int, height: int, rows: list[int] | None = None):
+        """Create a grid, empty unless rows are given.
+
+        Args:
+            width: Number of columns
+            height: Number of rows
+            rows: Bitmask per row; bit x of rows[y] is the cell at (x, y)
+        """
+        self.width = width
+        self.height = height
+        self.full = (1 << width) - 1
+        self.rows = rows if rows is not None else [0] * height
+
+    @classmethod
+    def from_string(cls, input_text: str, on: str = "#") -> "BitGrid":
+        """Parse a grid from a multi-line string, setting cells equal to ``on``."""
+        lines = input_text.strip().splitlines()
+        width = len(lines[0]) if lines else 0
+        # Reverse each line so that column x ends up as bit x
+        rows = [
+            int("".join("1" if c == on else "0" for c in reversed(line)) or "0", 2)
+            for line in lines
+        ]
+        return cls(width, len(lines), rows)
+
+    @classmethod
+    def from_points(
+        cls, width: int, height: int, points: Iterable[tuple[int, int]]
+    ) -> "BitGrid":
+        """Create a grid with the given (x, y) cells set."""
+        grid = cls(width, height)
+        for x, y in points:
+            grid.rows[y] |= 1 << x
+        return grid
+
+    def copy(self) -> "BitGrid":
+        """Return a grid with its own copy of the rows."""
+        return BitGrid(self.width, self.height, self.rows[:])
+
+    def test(self, x: int, y: int) -> bool:
+        """Check whether (x, y) is set. Out of bounds cells are never set."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return bool(self.rows[y] >> x & 1)
+        return False
+
+    def set(self, x: int, y: int) -> bool:
+        """Set the cell at (x, y). Returns True if it is inside the grid."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.rows[y] |= 1 << x
+            return True
+        return False
+
+    def clear(self, x: int, y: int) -> bool:
+        """Clear the cell at (x, y). Returns True if it is inside the grid."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.rows[y] &= ~(1 << x)
+            return True
+        return False
+
+    def row_all(self, y: int, x_min: int, x_max: int) -> bool:
+        """Check whether every cell from x_min to x_max (inclusive) of row y is set."""
+        span = (1 << (x_max - x_min + 1)) - 1
+        return (self.rows[y] >> x_min) & span == span
+
+    def count(self) -> int:
+        """Count the set cells."""
+        return sum(row.bit_count() for row in self.rows)
+
+    def points(self) -> Iterator[tuple[int, int]]:
+        """Iterate over the set cells in row order."""
+        for y, row in enumerate(self.rows):
+            while row:
+                low = row & -row
+                yield (low.bit_length() - 1, y)
+                row ^= low
+
+    def _neighbor_planes(self, diagonal: bool) -> list[list[int]]:
+        """Count each cell's set neighbours as bit planes.
+
+        Returns four bitmasks per row; bit x of plane i is bit i of the
+        neighbour count of (x, y). The counts are accumulated with
+        ripple-carry adders over whole rows at once.
+        """
+        full = self.full
+        rows = self.rows
+        planes = []
+        for y in range(self.height):
+            above = rows[y - 1] if y > 0 else 0
+            row = rows[y]
+            below = rows[y + 1] if y + 1 < self.height else 0
+
+            # Shifting left moves the neighbour at x - 1 onto bit x
+            inputs = [above, below, (row << 1) & full, row >> 1]
+            if diagonal:
+                inputs += [
+                    (above << 1) & full,
+                    above >> 1,
+                    (below << 1) & full,
+                    below >> 1,
+                ]
+
+            bits = [0, 0, 0, 0]
+            for carry in inputs:
+                for i in range(4):
+                    bits[i], carry = bits[i] ^ carry, bits[i] & carry
+                    if not carry:
+                        break
+            planes.append(bits)
+        return planes
+
+    def neighbors_fewer_than(self, k: int, diagonal: bool = True) -> "BitGrid":
+        """Get the cells with fewer than k set neighbours (set or not themselves).
+
+        Args:
+            k: Neighbour count threshold (0-9)
+            diagonal: Count all 8 neighbours instead of the 4 cardinal ones
+        """
+        full = self.full
+        rows = []
+        for bits in self._neighbor_planes(diagonal):
+            fewer = 0
+            for count in range(k):
+                equal = full
+                for i, plane in enumerate(bits):
+                    equal &= plane if count >> i & 1 else ~plane
+                fewer |= equal
+            rows.append(fewer & full)
+        return BitGrid(self.width, self.height, rows)
+
+    def _spread(self, row: int, passable: int) -> int:
+        """Grow a row's set bits to both ends of their runs of passable bits.
+
+        A Kogge-Stone fill: step i moves bits 2**i places along runs that are
+        at least that long, so any run is covered in log2(width) steps.
+        """
+        up = down = row
+        up_runs = down_runs = passable
+        shift = 1
+        while shift < self.width:
+            up |= up_runs & (up << shift)
+            up_runs &= up_runs << shift
+            down |= down_runs & (down >> shift)
+            down_runs &= down_runs >> shift
+            shift <<= 1
+        return up | down
+
+    def flood_fill(self, seeds: "BitGrid") -> "BitGrid":
+        """Grow seeds through this grid's set cells (4-connected).
+
+        Rows are always filled along their whole runs at once, so only
+        vertical moves take sweeps. Each round sweeps down then up the
+        grid, taking in cells from the rows above and below, until nothing
+        changes.
+
+        Args:
+            seeds: Cells to start from; seeds outside this grid are dropped
+
+        Returns:
+            Every set cell connected to a seed.
+        """
+        passable = self.rows
+        filled = [self._spread(s & p, p) for s, p in zip(seeds.rows, passable)]
+        height = self.height
+        sweeps = (range(height), range(height - 1, -1, -1))
+
+        changed = True
+        while changed:
+            changed = False
+            for sweep in sweeps:
+                for y in sweep:
+                    row = filled[y]
+                    grown = row
+                    if y > 0:
+                        grown |= filled[y - 1]
+                    if y + 1 < height:
+                        grown |= filled[y + 1]
+                    grown &= passable[y]
+                    if grown != row:
+                        filled[y] = self._spread(grown, passable[y])
+                        changed = True
+
+        return BitGrid(self.width, self.height, filled)
+
+    def __and__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(
+            self.width, self.height, [a & b for a, b in zip(self.rows, other.rows)]
+        )
+
+    def __or__(self, other: "BitGrid") -> "BitGrid":
+        return BitGrid(
+            self.width, self.height, [a | b for a, b in zip(self.rows, other.rows)]
+        )
+
+    def __invert__(self) -> "BitGrid":
+        full = self.full
+        return BitGrid(self.width, self.height, [~row & full for row in self.rows])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitGrid):
+            return NotImplemented
+        return (self.width, self.height, self.rows) == (
+            other.width,
+            other.height,
+            other.rows,
+        )
+
+    def __str__(self) -> str:
+        """Convert grid to string for display, "#" for set and "." for clear."""
+        return "\n".join(
+            format(row, f"0{self.width}b")[::-1].replace("1", "#").replace("0", ".")
+            for row in self.rows
+        )
+
+    def __repr__(self) -> str:
+        return f"BitGrid({self.width}x{self.height}, {self.count()} set)"
@@ -0,0 +1,244 @@
+"""Flat bytearray grid for tight scalar loops.
+
+Provides a FlatGrid class that stores a character grid in one bytearray with
+a one-cell sentinel border, and addresses cells by a single integer index.
+Moving to a neighbour is adding an offset from ``n4``/``n8``, and the border
+makes bounds checks unnecessary: a step off the grid lands on a border cell,
+which never matches a real value.
+
+    grid = FlatGrid.from_string(text)
+    rolls = grid.byte("@")
+    for i in grid.find_all("@"):
+        around = sum(grid.cells[i + d] == rolls for d in grid.n8)
+"""
+
+import re
+from array import array
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class FlatGrid:
+    """A 2D grid of characters stored row by row in a padded bytearray."""
+
+    __slots__ = ("cells", "width", "height", "stride", "border", "n4", "n8")
+
+    def __init__(self, width: int, height: int, border: str = "\0"):
+        """Create a grid of border cells; use from_string or filled to fill it.
+
+        Args:
+            width: Width without the border
+            height: Height without the border
+            border: Sentinel character surrounding the grid; it must not
+                appear in the grid itself
+        """
+        self.width = width
+        self.height = height
+        self.stride = width + 2
+        self.border = ord(border)
+        self.cells = bytearray([self.border]) * (self.stride * (height + 2))
+
+        stride = self.stride
+        # N, S, W, E
+        self.n4 = (-stride, stride, -1, 1)
+        # N, S, W, E, NW, NE, SW, SE
+        self.n8 = self.n4 + (-stride - 1, -stride + 1, stride - 1, stride + 1)
+
+    @classmethod
+    def from_string(cls, input_text: str, border: str = "\0") -> "FlatGrid":
+        """Parse a grid from a multi-line string.
+
+        Raises:
+            ValueError: If the lines are not all the same length, or contain
+                characters that don't fit in one byte.
+        """
+        lines = input_text.strip().splitlines()
+        grid = cls(len(lines[0]) if lines else 0, len(lines), border)
+        for y, line in enumerate(lines):
+            # Check the encoded length too: a multi-byte character would grow
+            # cells and shift every later row
+            encoded = line.encode()
+            if not len(line) == len(encoded) == grid.width:
+                raise ValueError(
+                    "All grid lines must be the same length, one byte per character"
+                )
+            start = grid.index(0, y)
+            grid.cells[start : start + grid.width] = encoded
+        return grid
+
+    @classmethod
+    def filled(
+        cls, width: int, height: int, value: str, border: str = "\0"
+    ) -> "FlatGrid":
+        """Create a grid filled with a single character.
+
+        Raises:
+            ValueError: If value is not a single one-byte character.
+        """
+        grid = cls(width, height, border)
+        if len(value.encode()) != 1:
+            raise ValueError(f"Fill value must be one byte, got {value!r}")
+        row = value.encode() * width
+        for y in range(height):
+            start = grid.index(0, y)
+            grid.cells[start : start + width] = row
+        return grid
+
+    def copy(self) -> "FlatGrid":
+        """Return a grid with its own copy of the cells."""
+        grid = FlatGrid(self.width, self.height, chr(self.border))
+        grid.cells[:] = self.cells
+        return grid
+
+    def index(self, x: int, y: int) -> int:
+        """Get the flat index of (x, y)."""
+        return (y + 1) * self.stride + x + 1
+
+    def coords(self, index: int) -> tuple[int, int]:
+        """Get the (x, y) position of a flat index."""
+        y, x = divmod(index, self.stride)
+        return (x - 1, y - 1)
+
+    @staticmethod
+    def byte(value: str) -> int:
+        """Get the cell value for a character, for comparing against cells."""
+        return ord(value)
+
+    def in_bounds(self, index: int) -> bool:
+        """Check whether a flat index is a grid cell rather than the border."""
+        return self.cells[index] != self.border
+
+    def get(self, x: int, y: int) -> str | None:
+        """Get the character at (x, y), or None if out of bounds."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return chr(self.cells[self.index(x, y)])
+        return None
+
+    def set(self, x: int, y: int, value: str) -> bool:
+        """Set the character at (x, y). Returns True if successful."""
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.cells[self.index(x, y)] = ord(value)
+            return True
+        return False
+
+    def neighbors(self, index: int) -> list[int]:
+        """Get the indices of the 4 cardinal neighbours inside the grid."""
+        cells, border = self.cells, self.border
+        return [index + d for d in self.n4 if cells[index + d] != border]
+
+    def neighbors_diagonal(self, index: int) -> list[int]:
+        """Get the indices of all 8 neighbours inside the grid."""
+        cells, border = self.cells, self.border
+        return [index + d for d in self.n8 if cells[index + d] != border]
+
+    def indices(self) -> Iterator[int]:
+        """Iterate over the flat index of every cell, in row order."""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find(self, value: str) -> int | None:
+        """Find the index of the first cell with the given value."""
+        index = self.cells.find(value.encode())
+        return index if index != -1 else None
+
+    def find_all(self, value: str) -> list[int]:
+        """Find the indices of all cells with the given value."""
+        pattern = re.escape(value.encode())
+        return [m.start() for m in re.finditer(pattern, self.cells)]
+
+    # Quoted because the set() method shadows the builtin in the class body
+    def flood_fill(self, start: int, passable: str) -> "set[int]":
+        """Find every index reachable from start through passable cells.
+
+        Args:
+            start: Flat index to start from
+            passable: Characters that can be moved through (4-connected)
+        """
+        # The border is never passable, which keeps the fill on the grid
+        open_cells = set(passable.encode()) - {self.border}
+        cells = self.cells
+        offsets = self.n4
+        seen = {start}
+        queue = deque([start])
+
+        while queue:
+            current = queue.popleft()
+            for d in offsets:
+                n = current + d
+                if n not in seen and cells[n] in open_cells:
+                    seen.add(n)
+                    queue.append(n)
+
+        return seen
+
+    def distance_map(
+        self,
+        sources: Iterable[int],
+        passable: str,
+        diagonal: bool = False,
+        labels: bool = False,
+    ) -> array | tuple[array, array]:
+        """Distance from the nearest source to every reachable cell.
+
+        A single BFS seeded with all the sources, recording distances in a
+        flat array laid out like ``cells`` rather than in a dict.
+
+        Args:
+            sources: Flat indices to measure from
+            passable: Characters that can be moved through
+            diagonal: Move to all 8 neighbours instead of the 4 cardinal ones
+            labels: Also return the index of each cell's nearest source; ties
+                go to the source listed first
+
+        Returns:
+            The distance of every index, -1 where unreached, and with labels
+            the nearest source of every index, also -1 where unreached.
+        """
+        # 1 for passable cells; the border is never passable
+        table = bytearray(256)
+        for byte in passable.encode():
+            table[byte] = 1
+        table[self.border] = 0
+        is_open = self.cells.translate(table)
+
+        offsets = self.n8 if diagonal else self.n4
+        dist = array("i", [-1]) * len(self.cells)
+        nearest = array("i", [-1]) * len(self.cells)
+        queue = deque()
+        for source in sources:
+            if dist[source] == -1:
+                dist[source] = 0
+                nearest[source] = source
+                queue.append(source)
+
+        while queue:
+            current = queue.popleft()
+            steps = dist[current] + 1
+            origin = nearest[current]
+            for d in offsets:
+                n = current + d
+                if is_open[n] and dist[n] == -1:
+                    dist[n] = steps
+                    nearest[n] = origin
+                    queue.append(n)
+
+        return (dist, nearest) if labels else dist
+
+    def row(self, y: int) -> list[str] | None:
+        """Get an entire row by index.
+
+        Returns:
+            A copy of the row as a list, or None if out of bounds.
+        """
+        if 0 <= y < self.height:
+            start = self.index(0, y)
+            return list(self.cells[start : start + self.width].decode())
+        return None
+
+    def __str__(self) -> str:
+        """Convert grid to string for display."""
+        return "\n".join("".join(self.row(y)) for y in range(self.height))
+
+    def __repr__(self) -> str:
+        return f"FlatGrid({self.width}x{self.height})"
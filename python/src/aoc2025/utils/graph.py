@@ -0,0 +1,316 @@
+"""Compressed sparse row graphs.
+
+Provides a Graph class that interns node labels to dense ids ``0..n-1`` and
+stores adjacency in compressed sparse row (CSR) form: the edges of node ``i``
+are ``targets[offsets[i]:offsets[i + 1]]``, with matching ``weights``, all in
+flat ``array`` buffers. Searches then index arrays and bytearrays by node id
+instead of calling a neighbour function and hashing node objects into sets
+and dicts.
+
+    graph = Graph.from_adjacency(text)
+    dist, parent = graph.bfs(graph.ids["you"])
+"""
+
+from array import array
+from collections import deque
+from heapq import heappop, heappush
+from itertools import accumulate, chain
+from typing import Callable, Generic, Hashable, Iterable, Sequence, TypeVar
+
+from .grid import Grid
+
+L = TypeVar("L", bound=Hashable)
+V = TypeVar("V")
+
+# Distance and parent of nodes a search didn't reach
+UNREACHED = -1
+
+
+class Graph(Generic[L]):
+    """A directed graph with dense integer node ids and CSR adjacency."""
+
+    __slots__ = ("labels", "ids", "offsets", "targets", "weights")
+
+    def __init__(
+        self,
+        labels: list[L],
+        offsets: array,
+        targets: array,
+        weights: array | None = None,
+    ):
+        """Create a graph from CSR buffers; usually built with a from_* method.
+
+        Args:
+            labels: Label of each node id
+            offsets: len(labels) + 1 edge offsets; node i's edges are
+                offsets[i] to offsets[i + 1]
+            targets: Target node id of each edge
+            weights: Cost of each edge, or None if every edge costs 1
+        """
+        self.labels = labels
+        self.ids = {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_edges(
+        cls,
+        edges: Iterable[tuple[L, L] | tuple[L, L, int]],
+        nodes: Iterable[L] = (),
+        undirected: bool = False,
+    ) -> "Graph[L]":
+        """Build a graph from (source, target) or (source, target, cost) edges.
+
+        Args:
+            edges: The edges; the graph is weighted if any edge has a cost
+            nodes: Nodes to include even if no edge mentions them; ids are
+                assigned in order of first appearance, these first
+            undirected: Also add every edge in the opposite direction
+        """
+        # Ids in order of first appearance; setdefault interns without a
+        # Python-level call per label
+        ids: dict[L, int] = {}
+        for label in nodes:
+            ids.setdefault(label, len(ids))
+
+        sources: list[int] = []
+        targets: list[int] = []
+        weights: list[int] = []
+        weighted = False
+        for edge in edges:
+            source = ids.setdefault(edge[0], len(ids))
+            target = ids.setdefault(edge[1], len(ids))
+            cost = 1
+            if len(edge) > 2:
+                cost = edge[2]
+                weighted = True
+            sources.append(source)
+            targets.append(target)
+            weights.append(cost)
+            if undirected:
+                sources.append(target)
+                targets.append(source)
+                weights.append(cost)
+
+        return cls._from_arrays(
+            list(ids), sources, targets, weights if weighted else None
+        )
+
+    @classmethod
+    def _from_arrays(
+        cls,
+        labels: list[L],
+        sources: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[int] | None,
+    ) -> "Graph[L]":
+        """Put parallel per-edge sequences into CSR order, grouped by source.
+
+        A stable sort keeps each node's edges in their original order.
+        """
+        counts = [0] * (len(labels) + 1)
+        for source in sources:
+            counts[source + 1] += 1
+        offsets = array("i", accumulate(counts))
+
+        order = sorted(range(len(sources)), key=sources.__getitem__)
+        csr_targets = array("i", map(targets.__getitem__, order))
+        csr_weights = None
+        if weights is not None:
+            csr_weights = array("q", map(weights.__getitem__, order))
+
+        return cls(labels, offsets, csr_targets, csr_weights)
+
+    @classmethod
+    def from_adjacency(cls, input_text: str, sep: str = ":") -> "Graph[str]":
+        """Parse lines of the form ``node: target target ...``.
+
+        Targets that never get a line of their own become nodes without
+        outgoing edges. A node with several lines gets the edges of all of
+        them.
+        """
+        lines = input_text.strip().splitlines()
+        rows = [line.split(sep, 1) for line in lines if line.strip()]
+        # Sources get the first ids and node i's targets are per_node[i], so
+        # the edges are already in CSR order
+        ids: dict[str, int] = {}
+        per_node: list[list[str]] = []
+        for source, rest in rows:
+            node = ids.setdefault(source.strip(), len(ids))
+            if node == len(per_node):
+                per_node.append(rest.split())
+            else:
+                per_node[node].extend(rest.split())
+        flat = list(chain.from_iterable(per_node))
+        for target in flat:
+            if target not in ids:
+                ids[target] = len(ids)
+
+        # Targets without a line of their own have no edges
+        degrees = chain([0], map(len, per_node), [0] * (len(ids) - len(per_node)))
+        offsets = array("i", accumulate(degrees))
+        return cls(list(ids), offsets, array("i", map(ids.__getitem__, flat)))
+
+    @classmethod
+    def from_grid(
+        cls,
+        grid: Grid[V],
+        passable: Callable[[V], bool],
+        diagonal: bool = False,
+    ) -> "Graph[tuple[int, int]]":
+        """Build the graph of moves between passable cells of a grid.
+
+        Nodes are (x, y) positions, numbered in row order.
+
+        Args:
+            grid: The grid
+            passable: Function that returns True for cells that can be entered
+            diagonal: Connect all 8 neighbours instead of the 4 cardinal ones
+        """
+        open_cells = [pos for pos, value in grid.iter() if passable(value)]
+        ids = {pos: i for i, pos in enumerate(open_cells)}
+        step = grid.neighbors_diagonal if diagonal else grid.neighbors
+
+        # Cells are visited in id order, so edges come out in CSR order
+        offsets, targets = array("i", [0]), array("i")
+        for pos in open_cells:
+            targets.extend([ids[n] for n in step(*pos) if n in ids])
+            offsets.append(len(targets))
+        return cls(open_cells, offsets, targets)
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of (directed) edges."""
+        return len(self.targets)
+
+    def neighbors(self, node: int) -> array:
+        """Get the ids of a node's edge targets."""
+        return self.targets[self.offsets[node] : self.offsets[node + 1]]
+
+    def edges(self, node: int) -> Iterable[tuple[int, int]]:
+        """Get (target id, cost) for each of a node's edges."""
+        start, end = self.offsets[node], self.offsets[node + 1]
+        if self.weights is None:
+            return ((target, 1) for target in self.targets[start:end])
+        return zip(self.targets[start:end], self.weights[start:end])
+
+    def reverse(self) -> "Graph[L]":
+        """Get the graph with every edge reversed."""
+        sources = array("i", bytes(4 * self.edge_count))
+        offsets = self.offsets
+        for node in range(len(self)):
+            for edge in range(offsets[node], offsets[node + 1]):
+                sources[edge] = node
+        return self._from_arrays(self.labels, self.targets, sources, self.weights)
+
+    def bfs(self, start: int, target: int | None = None) -> tuple[array, array]:
+        """Unweighted distances from start, by breadth-first search.
+
+        Args:
+            start: Node id to start from
+            target: Node id to stop at once reached, or None to search
+                everything reachable
+
+        Returns:
+            (dist, parent) arrays indexed by node id. Nodes that weren't
+            reached have UNREACHED for both, as does the start's parent.
+        """
+        n = len(self)
+        offsets, targets = self.offsets, self.targets
+        dist = array("q", [UNREACHED]) * n
+        parent = array("i", [UNREACHED]) * n
+        seen = bytearray(n)
+
+        seen[start] = 1
+        dist[start] = 0
+        queue = deque([start])
+
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                break
+            steps = dist[node] + 1
+            for edge in range(offsets[node], offsets[node + 1]):
+                next_node = targets[edge]
+                if not seen[next_node]:
+                    seen[next_node] = 1
+                    dist[next_node] = steps
+                    parent[next_node] = node
+                    queue.append(next_node)
+
+        return dist, parent
+
+    def dijkstra(self, start: int, target: int | None = None) -> tuple[array, array]:
+        """Weighted distances from start, by Dijkstra's algorithm.
+
+        Args:
+            start: Node id to start from
+            target: Node id to stop at once settled, or None to search
+                everything reachable
+
+        Returns:
+            (dist, parent) arrays indexed by node id, as for bfs. With a
+            target, nodes still on the frontier have tentative distances.
+        """
+        if self.weights is None:
+            return self.bfs(start, target)
+
+        n = len(self)
+        offsets, targets, weights = self.offsets, self.targets, self.weights
+        dist = array("q", [UNREACHED]) * n
+        parent = array("i", [UNREACHED]) * n
+        done = bytearray(n)
+
+        dist[start] = 0
+        heap = [(0, start)]
+
+        while heap:
+            cost, node = heappop(heap)
+            if done[node]:
+                continue
+            done[node] = 1
+            if node == target:
+                break
+            for edge in range(offsets[node], offsets[node + 1]):
+                next_node = targets[edge]
+                new_cost = cost + weights[edge]
+                if not done[next_node] and (
+                    dist[next_node] == UNREACHED or new_cost < dist[next_node]
+                ):
+                    dist[next_node] = new_cost
+                    parent[next_node] = node
+                    heappush(heap, (new_cost, next_node))
+
+        return dist, parent
+
+    @staticmethod
+    def path(parent: array, end: int) -> list[int]:
+        """Rebuild the node ids from the start to end from a parent array."""
+        path = [end]
+        while parent[path[-1]] != UNREACHED:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+    def shortest_path(self, start: L, target: L) -> tuple[list[L], int] | None:
+        """Find a shortest path between two labels.
+
+        Uses dijkstra for weighted graphs and bfs otherwise.
+
+        Returns:
+            Tuple of (path of labels, total_cost), or None if no path exists.
+        """
+        start_id, target_id = self.ids[start], self.ids[target]
+        dist, parent = self.dijkstra(start_id, target_id)
+        if dist[target_id] == UNREACHED:
+            return None
+        labels = self.labels
+        return ([labels[i] for i in self.path(parent, target_id)], dist[target_id])
+
+    def __repr__(self) -> str:
+        kind = "weighted" if self.weights is not None else "unweighted"
+        return f"Graph({len(self)} nodes, {self.edge_count} {kind} edges)"
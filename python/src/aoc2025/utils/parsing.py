@@ -4,6 +4,7 @@ Common functions for parsing puzzle inputs.
 """
 
 import re
+from collections.abc import Iterable, Iterator
 
 
 def parse_numbers(text: str) -> list[int]:
@@ -31,6 +32,23 @@ def parse_groups(text: str) -> list[str]:
     return [group.strip() for group in text.split("\n\n") if group.strip()]
 
 
+def iter_groups(lines: Iterable[str]) -> Iterator[list[str]]:
+    """Lazily split lines into groups separated by blank lines.
+
+    The streaming counterpart of parse_groups: consumes one group at a time
+    and skips empty groups.
+    """
+    group = []
+    for line in lines:
+        if line.strip():
+            group.append(line)
+        elif group:
+            yield group
+            group = []
+    if group:
+        yield group
+
+
 def parse_line_numbers(line: str) -> list[int]:
     """Parse a line of space-separated numbers."""
     return [int(x) for x in line.split() if x.lstrip("-").isdigit()]
@@ -3,89 +3,365 @@
 Common graph traversal and pathfinding algorithms.
 """
 
+from array import array
 from collections import deque
-from heapq import heappop, heappush
-from typing import Callable, Hashable, Iterable, TypeVar
+from dataclasses import dataclass
+from heapq import heappop, heappush, nsmallest
+from itertools import count
+from typing import Any, Callable, Generic, Hashable, Iterable, Literal, TypeVar
+
+from .grid import Grid
 
 T = TypeVar("T", bound=Hashable)
 
+# What a search returns: the path, just the cost, or the predecessor tree
+Returns = Literal["path", "cost", "parents"]
+_RETURNS = ("path", "cost", "parents")
+
+# Predecessor of every node reached; the start maps to None
+Parents = dict[T, T | None]
+
+
+@dataclass
+class SearchStats:
+    """Counters filled in by searches that take a ``stats`` argument."""
+
+    # Nodes whose successors were generated
+    expanded: int = 0
+    # Most nodes held at once (frontier, current path and tables). A count of
+    # entries, not bytes: use tracemalloc to measure memory itself
+    peak_node_count: int = 0
+
+
+def _check_returns(returns: str) -> None:
+    if returns not in _RETURNS:
+        raise ValueError(f"returns must be one of {_RETURNS}, got {returns!r}")
+
+
+class LazyHeap(Generic[T]):
+    """Binary heap (heapq) with lazy deletion.
+
+    Lowering an item's priority pushes a second entry; the search skips the
+    stale one when it is popped, so the heap grows with every relaxation.
+    """
+
+    __slots__ = ("_heap", "_order")
+
+    def __init__(self):
+        self._heap: list[tuple[int, int, T]] = []
+        # Tie-breaker, so equal priorities never compare the items themselves.
+        # Newest first, which sends A* down one path among equal estimates.
+        self._order = count(0, -1)
+
+    def push(self, item: T, priority: int) -> None:
+        """Add an item, or another entry for it."""
+        heappush(self._heap, (priority, next(self._order), item))
+
+    def pop(self) -> tuple[int, T]:
+        """Remove and return the (priority, item) with the lowest priority."""
+        priority, _, item = heappop(self._heap)
+        return priority, item
+
+    def peek(self) -> tuple[int, T]:
+        """Return the (priority, item) that pop would remove, without removing it."""
+        priority, _, item = self._heap[0]
+        return priority, item
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class BucketQueue(Generic[T]):
+    """Dial's bucket queue for small non-negative integer priorities.
+
+    Items are appended to a list per priority and a cursor walks up through
+    the buckets, so push and pop are O(1) apart from skipping empty buckets.
+    Popped priorities must never decrease, which holds for Dijkstra and for
+    A* with a consistent heuristic. Memory grows with the largest priority.
+    """
+
+    __slots__ = ("_buckets", "_cursor", "_size")
+
+    def __init__(self):
+        self._buckets: list[list[T]] = []
+        self._cursor = 0
+        self._size = 0
+
+    def push(self, item: T, priority: int) -> None:
+        """Add an item, or another entry for it.
+
+        Raises:
+            ValueError: If priority is below the last popped priority.
+        """
+        if priority < self._cursor:
+            raise ValueError(
+                f"priority {priority} is below the current bucket {self._cursor}"
+            )
+        buckets = self._buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority - len(buckets) + 1))
+        buckets[priority].append(item)
+        self._size += 1
+
+    def pop(self) -> tuple[int, T]:
+        """Remove and return a (priority, item) with the lowest priority."""
+        if not self._size:
+            raise IndexError("pop from an empty queue")
+        buckets = self._buckets
+        cursor = self._cursor
+        while not buckets[cursor]:
+            cursor += 1
+        self._cursor = cursor
+        self._size -= 1
+        return cursor, buckets[cursor].pop()
+
+    def peek(self) -> tuple[int, T]:
+        """Return the (priority, item) that pop would remove, without removing it."""
+        if not self._size:
+            raise IndexError("peek at an empty queue")
+        buckets = self._buckets
+        while not buckets[self._cursor]:
+            self._cursor += 1
+        return self._cursor, buckets[self._cursor][-1]
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class IndexedHeap(Generic[T]):
+    """Binary heap with decrease-key.
+
+    Each item is in the heap at most once, with its slot tracked in a dict:
+    pushing an item that is already queued lowers its priority in place
+    instead of adding an entry, so the heap never holds more than the
+    frontier.
+    """
+
+    __slots__ = ("_items", "_priorities", "_slots")
+
+    def __init__(self):
+        self._items: list[T] = []
+        self._priorities: list[int] = []
+        self._slots: dict[T, int] = {}
+
+    def push(self, item: T, priority: int) -> None:
+        """Add an item, or lower its priority if it is queued with a higher one."""
+        slot = self._slots.get(item)
+        if slot is None:
+            slot = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+        elif priority < self._priorities[slot]:
+            self._priorities[slot] = priority
+        else:
+            return
+        self._sift_up(slot, item, priority)
+
+    def pop(self) -> tuple[int, T]:
+        """Remove and return the (priority, item) with the lowest priority."""
+        items, priorities = self._items, self._priorities
+        top = (priorities[0], items[0])
+        del self._slots[items[0]]
+
+        item, priority = items.pop(), priorities.pop()
+        if items:
+            self._sift_down(item, priority)
+        return top
+
+    def peek(self) -> tuple[int, T]:
+        """Return the (priority, item) that pop would remove, without removing it."""
+        return self._priorities[0], self._items[0]
+
+    def _sift_up(self, slot: int, item: T, priority: int) -> None:
+        """Move item up from slot until its parent has a lower priority."""
+        items, priorities, slots = self._items, self._priorities, self._slots
+        while slot:
+            parent = (slot - 1) >> 1
+            if priorities[parent] <= priority:
+                break
+            items[slot] = items[parent]
+            priorities[slot] = priorities[parent]
+            slots[items[slot]] = slot
+            slot = parent
+        items[slot] = item
+        priorities[slot] = priority
+        slots[item] = slot
+
+    def _sift_down(self, item: T, priority: int) -> None:
+        """Place item in the root slot and move it down to its place."""
+        items, priorities, slots = self._items, self._priorities, self._slots
+        size = len(items)
+        slot = 0
+        while True:
+            child = 2 * slot + 1
+            if child >= size:
+                break
+            if child + 1 < size and priorities[child + 1] < priorities[child]:
+                child += 1
+            if priority <= priorities[child]:
+                break
+            items[slot] = items[child]
+            priorities[slot] = priorities[child]
+            slots[items[slot]] = slot
+            slot = child
+        items[slot] = item
+        priorities[slot] = priority
+        slots[item] = slot
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+# Priority queue backends for dijkstra and astar
+Queue = Literal["heap", "bucket", "indexed"]
+QUEUES = {"heap": LazyHeap, "bucket": BucketQueue, "indexed": IndexedHeap}
+
+
+def _make_queue(queue: str) -> "LazyHeap | BucketQueue | IndexedHeap":
+    if queue not in QUEUES:
+        raise ValueError(f"queue must be one of {tuple(QUEUES)}, got {queue!r}")
+    return QUEUES[queue]()
+
+
+def reconstruct_path(parents: "Parents[T]", end: T) -> list[T]:
+    """Rebuild the path from the start to end by following predecessors.
+
+    Args:
+        parents: Predecessor map from a search, with the start mapping to None
+        end: Node to walk back from; must be in parents
+
+    Returns:
+        List of nodes from start to end (inclusive).
+    """
+    path = [end]
+    node = parents[end]
+    while node is not None:
+        path.append(node)
+        node = parents[node]
+    path.reverse()
+    return path
+
 
 def bfs(
     start: T,
     neighbors: Callable[[T], Iterable[T]],
     goal: Callable[[T], bool],
-) -> list[T] | None:
+    returns: Returns = "path",
+) -> "list[T] | int | tuple[Parents[T], T] | None":
     """Breadth-first search for unweighted shortest path.
 
+    Only a predecessor per node is stored; the path is rebuilt once the goal
+    is found.
+
     Args:
         start: Starting node
         neighbors: Function that returns neighbors of a node
         goal: Function that returns True if node is the goal
+        returns: "path" for the list of nodes, "cost" for the number of
+            steps, or "parents" for (predecessor map, goal node)
 
     Returns:
-        List of nodes from start to goal (inclusive), or None if no path exists.
+        List of nodes from start to goal (inclusive), the step count, or the
+        predecessor map of every node reached with the goal node; None if no
+        path exists.
+
+    Raises:
+        ValueError: If returns is not a known mode.
     """
+    _check_returns(returns)
+    parents: Parents[T] = {start: None}
+
+    def found(end: T, steps: int):
+        if returns == "cost":
+            return steps
+        if returns == "parents":
+            return (parents, end)
+        return reconstruct_path(parents, end)
+
     if goal(start):
-        return [start]
+        return found(start, 0)
 
-    queue: deque[tuple[T, list[T]]] = deque([(start, [start])])
-    visited: set[T] = {start}
+    queue: deque[tuple[T, int]] = deque([(start, 0)])
 
     while queue:
-        current, path = queue.popleft()
+        current, steps = queue.popleft()
 
         for next_node in neighbors(current):
-            if next_node in visited:
+            if next_node in parents:
                 continue
-
-            new_path = path + [next_node]
+            parents[next_node] = current
 
             if goal(next_node):
-                return new_path
+                return found(next_node, steps + 1)
 
-            visited.add(next_node)
-            queue.append((next_node, new_path))
+            queue.append((next_node, steps + 1))
 
     return None
 
 
+def _weighted_result(parents: "Parents[T]", end: T, cost: int, returns: Returns):
+    if returns == "cost":
+        return cost
+    if returns == "parents":
+        return (parents, end, cost)
+    return (reconstruct_path(parents, end), cost)
+
+
 def dijkstra(
     start: T,
     neighbors: Callable[[T], Iterable[tuple[T, int]]],
     goal: Callable[[T], bool],
-) -> tuple[list[T], int] | None:
+    returns: Returns = "path",
+    queue: Queue = "heap",
+) -> "tuple[list[T], int] | int | tuple[Parents[T], T, int] | None":
     """Dijkstra's algorithm for weighted shortest path.
 
     Args:
         start: Starting node
         neighbors: Function that returns (neighbor, cost) tuples
         goal: Function that returns True if node is the goal
+        returns: "path" for (path, total_cost), "cost" for just the total
+            cost, or "parents" for (predecessor map, goal node, total_cost)
+        queue: Priority queue backend: "heap" (heapq, lazy deletion),
+            "bucket" (Dial's buckets, for small non-negative integer costs)
+            or "indexed" (binary heap with decrease-key)
 
     Returns:
-        Tuple of (path, total_cost), or None if no path exists.
+        The result selected by returns, or None if no path exists.
+
+    Raises:
+        ValueError: If returns or queue is not a known mode.
     """
+    _check_returns(returns)
+    frontier = _make_queue(queue)
+    parents: Parents[T] = {start: None}
+
     if goal(start):
-        return ([start], 0)
+        return _weighted_result(parents, start, 0, returns)
 
-    # Priority queue: (cost, node, path)
-    heap: list[tuple[int, T, list[T]]] = [(0, start, [start])]
+    # Stale queue entries (from the lazy backends) are skipped when popped
+    frontier.push(start, 0)
+    best: dict[T, int] = {start: 0}
     visited: set[T] = set()
 
-    while heap:
-        cost, current, path = heappop(heap)
+    while frontier:
+        cost, current = frontier.pop()
 
         if current in visited:
             continue
         visited.add(current)
 
         if goal(current):
-            return (path, cost)
+            return _weighted_result(parents, current, cost, returns)
 
         for next_node, edge_cost in neighbors(current):
-            if next_node not in visited:
-                new_cost = cost + edge_cost
-                new_path = path + [next_node]
-                heappush(heap, (new_cost, next_node, new_path))
+            if next_node in visited:
+                continue
+            new_cost = cost + edge_cost
+            if next_node not in best or new_cost < best[next_node]:
+                best[next_node] = new_cost
+                parents[next_node] = current
+                frontier.push(next_node, new_cost)
 
     return None
 
@@ -95,7 +371,9 @@ def astar(
     neighbors: Callable[[T], Iterable[tuple[T, int]]],
     heuristic: Callable[[T], int],
     goal: Callable[[T], bool],
-) -> tuple[list[T], int] | None:
+    returns: Returns = "path",
+    queue: Queue = "heap",
+) -> "tuple[list[T], int] | int | tuple[Parents[T], T, int] | None":
     """A* search algorithm for weighted shortest path with heuristic.
 
     Args:
@@ -103,37 +381,267 @@ def astar(
         neighbors: Function that returns (neighbor, cost) tuples
         heuristic: Function estimating cost from node to goal (must not overestimate)
         goal: Function that returns True if node is the goal
+        returns: "path" for (path, total_cost), "cost" for just the total
+            cost, or "parents" for (predecessor map, goal node, total_cost)
+        queue: Priority queue backend, as for dijkstra; "bucket" needs a
+            consistent heuristic so that estimates never decrease
 
     Returns:
-        Tuple of (path, total_cost), or None if no path exists.
+        The result selected by returns, or None if no path exists.
+
+    Raises:
+        ValueError: If returns or queue is not a known mode.
     """
+    _check_returns(returns)
+    frontier = _make_queue(queue)
+    parents: Parents[T] = {start: None}
+
     if goal(start):
-        return ([start], 0)
+        return _weighted_result(parents, start, 0, returns)
 
-    # Priority queue: (estimated_total, actual_cost, node, path)
-    heap: list[tuple[int, int, T, list[T]]] = [(heuristic(start), 0, start, [start])]
+    # Prioritised by estimated total; the actual cost so far is in best
+    frontier.push(start, heuristic(start))
+    best: dict[T, int] = {start: 0}
     visited: set[T] = set()
 
-    while heap:
-        _, cost, current, path = heappop(heap)
+    while frontier:
+        _, current = frontier.pop()
 
         if current in visited:
             continue
         visited.add(current)
+        cost = best[current]
 
         if goal(current):
-            return (path, cost)
+            return _weighted_result(parents, current, cost, returns)
 
         for next_node, edge_cost in neighbors(current):
-            if next_node not in visited:
-                new_cost = cost + edge_cost
-                new_path = path + [next_node]
-                estimated = new_cost + heuristic(next_node)
-                heappush(heap, (estimated, new_cost, next_node, new_path))
+            if next_node in visited:
+                continue
+            new_cost = cost + edge_cost
+            if next_node not in best or new_cost < best[next_node]:
+                best[next_node] = new_cost
+                parents[next_node] = current
+                frontier.push(next_node, new_cost + heuristic(next_node))
 
     return None
 
 
+def _join(forward: "Parents[T]", backward: "Parents[T]", meet: T) -> list[T]:
+    """Join the path start -> meet with the path meet -> target.
+
+    backward maps each node to its successor towards the target.
+    """
+    path = reconstruct_path(forward, meet)
+    node = backward[meet]
+    while node is not None:
+        path.append(node)
+        node = backward[node]
+    return path
+
+
+def _check_path_or_cost_returns(returns: str) -> None:
+    if returns not in ("path", "cost"):
+        raise ValueError(f"returns must be 'path' or 'cost', got {returns!r}")
+
+
+def _expand_layer(
+    layer: list[T],
+    neighbors: Callable[[T], Iterable[T]],
+    parents: "Parents[T]",
+    depth: dict[T, int],
+    other_depth: dict[T, int],
+) -> tuple[list[T], tuple[int, T] | None]:
+    """Expand one whole BFS layer of one side of a bidirectional search.
+
+    Returns:
+        The next layer, and the shortest (length, node) meeting the other
+        side found in this layer, if any.
+    """
+    next_layer = []
+    meeting = None
+    for node in layer:
+        steps = depth[node] + 1
+        for next_node in neighbors(node):
+            if next_node in depth:
+                continue
+            parents[next_node] = node
+            depth[next_node] = steps
+            next_layer.append(next_node)
+            if next_node in other_depth:
+                length = steps + other_depth[next_node]
+                if meeting is None or length < meeting[0]:
+                    meeting = (length, next_node)
+    return next_layer, meeting
+
+
+def bidirectional_bfs(
+    start: T,
+    target: T,
+    neighbors: Callable[[T], Iterable[T]],
+    reverse_neighbors: Callable[[T], Iterable[T]] | None = None,
+    returns: Literal["path", "cost"] = "path",
+) -> list[T] | int | None:
+    """Breadth-first search from both ends for an unweighted shortest path.
+
+    Whole layers are expanded from whichever side has the smaller frontier.
+    Once a layer reaches the other side, the shortest of the meetings found
+    in it is a shortest path. On open graphs each side only has to go about
+    half the distance, which explores far fewer nodes than bfs.
+
+    Args:
+        start: Starting node
+        target: Node to find a path to
+        neighbors: Function that returns neighbors of a node
+        reverse_neighbors: Function that returns the nodes with an edge to a
+            node; defaults to neighbors, which is right for undirected graphs
+        returns: "path" for the list of nodes, or "cost" for the number of
+            steps
+
+    Returns:
+        List of nodes from start to target (inclusive), or the step count;
+        None if no path exists.
+
+    Raises:
+        ValueError: If returns is not "path" or "cost".
+    """
+    _check_path_or_cost_returns(returns)
+    if start == target:
+        return [start] if returns == "path" else 0
+
+    reverse = reverse_neighbors or neighbors
+    forward: Parents[T] = {start: None}
+    backward: Parents[T] = {target: None}
+    forward_depth = {start: 0}
+    backward_depth = {target: 0}
+    forward_layer, backward_layer = [start], [target]
+    meeting = None
+
+    while meeting is None:
+        if not forward_layer or not backward_layer:
+            return None
+        if len(forward_layer) <= len(backward_layer):
+            forward_layer, meeting = _expand_layer(
+                forward_layer, neighbors, forward, forward_depth, backward_depth
+            )
+        else:
+            backward_layer, meeting = _expand_layer(
+                backward_layer, reverse, backward, backward_depth, forward_depth
+            )
+
+    length, meet = meeting
+    if returns == "cost":
+        return length
+    return _join(forward, backward, meet)
+
+
+class _Side(Generic[T]):
+    """State of one direction of a bidirectional A* search."""
+
+    __slots__ = ("neighbors", "estimate", "parents", "costs", "frontier", "closed")
+
+    def __init__(
+        self,
+        origin: T,
+        neighbors: Callable[[T], Iterable[tuple[T, int]]],
+        estimate: Callable[[T], int],
+    ):
+        """Start a search from origin.
+
+        Args:
+            origin: Node this side starts from
+            neighbors: Function that returns (neighbor, cost) tuples in this
+                side's direction
+            estimate: Heuristic from a node to the other side's origin
+        """
+        self.neighbors = neighbors
+        self.estimate = estimate
+        self.parents: Parents[T] = {origin: None}
+        self.costs: dict[T, int] = {origin: 0}
+        self.frontier: LazyHeap[T] = LazyHeap()
+        self.frontier.push(origin, estimate(origin))
+        self.closed: set[T] = set()
+
+
+def bidirectional_astar(
+    start: T,
+    target: T,
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    heuristic: Callable[[T, T], int],
+    reverse_neighbors: Callable[[T], Iterable[tuple[T, int]]] | None = None,
+    returns: Literal["path", "cost"] = "path",
+) -> tuple[list[T], int] | int | None:
+    """A* search from both ends for a weighted shortest path.
+
+    Each step expands the side with the smaller open set. The best path
+    through a node reached from both sides is kept, and the search stops
+    once no open node on either side could lead to anything cheaper.
+
+    Args:
+        start: Starting node
+        target: Node to find a path to
+        neighbors: Function that returns (neighbor, cost) tuples
+        heuristic: Function estimating the cost from its first argument to
+            its second; must be consistent (e.g. Manhattan distance on a grid)
+        reverse_neighbors: Function that returns (predecessor, cost) tuples;
+            defaults to neighbors, which is right for undirected graphs
+        returns: "path" for (path, total_cost), or "cost" for the total cost
+
+    Returns:
+        The result selected by returns, or None if no path exists.
+
+    Raises:
+        ValueError: If returns is not "path" or "cost".
+    """
+    _check_path_or_cost_returns(returns)
+    if start == target:
+        return ([start], 0) if returns == "path" else 0
+
+    forward = _Side(start, neighbors, lambda n: heuristic(n, target))
+    backward = _Side(
+        target, reverse_neighbors or neighbors, lambda n: heuristic(start, n)
+    )
+    best_cost, meet = None, None
+
+    while forward.frontier and backward.frontier:
+        # No open node on either side can lead to a path cheaper than this
+        bound = max(forward.frontier.peek()[0], backward.frontier.peek()[0])
+        if best_cost is not None and bound >= best_cost:
+            break
+
+        if len(forward.frontier) <= len(backward.frontier):
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        _, current = side.frontier.pop()
+        if current in side.closed:
+            continue
+        side.closed.add(current)
+        cost = side.costs[current]
+
+        for next_node, edge_cost in side.neighbors(current):
+            if next_node in side.closed:
+                continue
+            new_cost = cost + edge_cost
+            if next_node in side.costs and new_cost >= side.costs[next_node]:
+                continue
+            side.costs[next_node] = new_cost
+            side.parents[next_node] = current
+            side.frontier.push(next_node, new_cost + side.estimate(next_node))
+
+            if next_node in other.costs:
+                total = new_cost + other.costs[next_node]
+                if best_cost is None or total < best_cost:
+                    best_cost, meet = total, next_node
+
+    if best_cost is None:
+        return None
+    if returns == "cost":
+        return best_cost
+    return (_join(forward.parents, backward.parents, meet), best_cost)
+
+
 def flood_fill(
     start: T,
     neighbors: Callable[[T], Iterable[T]],
@@ -159,3 +667,730 @@ def flood_fill(
                 queue.append(next_node)
 
     return visited
+
+
+def distance_map(
+    sources: Iterable[T],
+    neighbors: Callable[[T], Iterable[T]],
+    labels: bool = False,
+) -> "dict[T, int] | tuple[dict[T, int], dict[T, T]]":
+    """Unweighted distance from the nearest source to every reachable node.
+
+    A single BFS seeded with all the sources at distance 0, instead of one
+    search per source or target.
+
+    Args:
+        sources: Nodes to measure from
+        neighbors: Function that returns neighbors of a node
+        labels: Also return which source each node is nearest to; ties go
+            to the source listed first
+
+    Returns:
+        Map of node to distance, and with labels a map of node to its
+        nearest source.
+    """
+    dist: dict[T, int] = {}
+    nearest: dict[T, T] = {}
+    queue: deque[T] = deque()
+    for source in sources:
+        if source not in dist:
+            dist[source] = 0
+            nearest[source] = source
+            queue.append(source)
+
+    while queue:
+        current = queue.popleft()
+        steps = dist[current] + 1
+
+        for next_node in neighbors(current):
+            if next_node not in dist:
+                dist[next_node] = steps
+                nearest[next_node] = nearest[current]
+                queue.append(next_node)
+
+    return (dist, nearest) if labels else dist
+
+
+def weighted_distance_map(
+    sources: Iterable[T],
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    labels: bool = False,
+) -> "dict[T, int] | tuple[dict[T, int], dict[T, T]]":
+    """Weighted distance from the nearest source to every reachable node.
+
+    A single Dijkstra search seeded with all the sources at cost 0.
+
+    Args:
+        sources: Nodes to measure from
+        neighbors: Function that returns (neighbor, cost) tuples
+        labels: Also return which source each node is nearest to
+
+    Returns:
+        Map of node to distance, and with labels a map of node to its
+        nearest source.
+    """
+    best: dict[T, int] = {}
+    nearest: dict[T, T] = {}
+    frontier: LazyHeap[T] = LazyHeap()
+    for source in sources:
+        if source not in best:
+            best[source] = 0
+            nearest[source] = source
+            frontier.push(source, 0)
+
+    dist: dict[T, int] = {}
+    while frontier:
+        cost, current = frontier.pop()
+        if current in dist:
+            continue
+        dist[current] = cost
+
+        for next_node, edge_cost in neighbors(current):
+            new_cost = cost + edge_cost
+            if next_node not in dist and (
+                next_node not in best or new_cost < best[next_node]
+            ):
+                best[next_node] = new_cost
+                nearest[next_node] = nearest[current]
+                frontier.push(next_node, new_cost)
+
+    return (dist, nearest) if labels else dist
+
+
+class Search(Generic[T]):
+    """A search that runs one node at a time.
+
+    Iterating yields (node, cost) as each node is settled, in visitation
+    order. Stop whenever enough has been seen (e.g. after the k nearest
+    goals) and nothing more is explored; iterate again later to resume from
+    where it stopped. Several searches can be interleaved by calling next()
+    on each in turn.
+
+    With max_cost set, iteration stops before the first node costing more
+    (by estimated total for A*). That node stays on the frontier, so raising
+    max_cost and iterating again carries on.
+
+    Usually created with iter_bfs, iter_dijkstra or iter_astar.
+    """
+
+    __slots__ = (
+        "neighbors",
+        "heuristic",
+        "max_cost",
+        "costs",
+        "parents",
+        "settled",
+        "_weighted",
+        "_queue",
+    )
+
+    def __init__(
+        self,
+        starts: Iterable[T],
+        neighbors: Callable[[T], Iterable[T]] | Callable[[T], Iterable[tuple[T, int]]],
+        weighted: bool,
+        heuristic: Callable[[T], int] | None = None,
+        max_cost: int | None = None,
+    ):
+        """Start a search.
+
+        Args:
+            starts: Nodes to start from, at cost 0
+            neighbors: Function that returns neighbors of a node, or
+                (neighbor, cost) tuples if weighted
+            weighted: Settle nodes by cost (Dijkstra/A*) rather than by
+                number of steps (BFS)
+            heuristic: A* estimate of the remaining cost from a node
+            max_cost: Stop before settling anything costing more
+        """
+        self.neighbors = neighbors
+        self.heuristic = heuristic
+        self.max_cost = max_cost
+        # Best known cost of every node reached, settled or not
+        self.costs: dict[T, int] = {}
+        self.parents: Parents[T] = {}
+        self.settled: set[T] = set()
+        self._weighted = weighted
+        self._queue: LazyHeap[T] | deque[T] = LazyHeap() if weighted else deque()
+
+        for start in starts:
+            if start not in self.costs:
+                self._discover(start, None, 0)
+
+    def _discover(self, node: T, parent: T | None, cost: int) -> None:
+        self.costs[node] = cost
+        self.parents[node] = parent
+        if not self._weighted:
+            self._queue.append(node)
+        elif self.heuristic is None:
+            self._queue.push(node, cost)
+        else:
+            self._queue.push(node, cost + self.heuristic(node))
+
+    def _peek(self) -> tuple[int, T] | None:
+        """Get the (priority, node) to settle next, dropping stale entries."""
+        queue = self._queue
+        if not self._weighted:
+            return (self.costs[queue[0]], queue[0]) if queue else None
+        while queue:
+            priority, node = queue.peek()
+            if node not in self.settled:
+                return priority, node
+            queue.pop()
+        return None
+
+    def __iter__(self) -> "Search[T]":
+        return self
+
+    def __next__(self) -> tuple[T, int]:
+        upcoming = self._peek()
+        if upcoming is None:
+            raise StopIteration
+        priority, node = upcoming
+        if self.max_cost is not None and priority > self.max_cost:
+            raise StopIteration
+
+        if self._weighted:
+            self._queue.pop()
+        else:
+            self._queue.popleft()
+        self.settled.add(node)
+        cost = self.costs[node]
+
+        if self._weighted:
+            for next_node, edge_cost in self.neighbors(node):
+                new_cost = cost + edge_cost
+                if next_node not in self.settled and (
+                    next_node not in self.costs or new_cost < self.costs[next_node]
+                ):
+                    self._discover(next_node, node, new_cost)
+        else:
+            for next_node in self.neighbors(node):
+                if next_node not in self.costs:
+                    self._discover(next_node, node, cost + 1)
+
+        return node, cost
+
+    @property
+    def frontier(self) -> dict[T, int]:
+        """Nodes reached but not yet settled, with their best known cost."""
+        if not self._weighted:
+            return {node: self.costs[node] for node in self._queue}
+        return {
+            node: cost
+            for node, cost in self.costs.items()
+            if node not in self.settled
+        }
+
+    @property
+    def done(self) -> bool:
+        """Whether every reachable node has been settled."""
+        return self._peek() is None
+
+    def path(self, node: T) -> list[T]:
+        """Get the path from a start to a reached node."""
+        return reconstruct_path(self.parents, node)
+
+
+def iter_bfs(
+    start: T,
+    neighbors: Callable[[T], Iterable[T]],
+    max_cost: int | None = None,
+) -> Search[T]:
+    """Lazy breadth-first search, yielding (node, steps) in BFS order.
+
+    Running it to the end visits the same nodes as flood_fill.
+
+    Args:
+        start: Starting node
+        neighbors: Function that returns neighbors of a node
+        max_cost: Stop before any node more than this many steps away
+    """
+    return Search([start], neighbors, weighted=False, max_cost=max_cost)
+
+
+def iter_dijkstra(
+    start: T,
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    max_cost: int | None = None,
+) -> Search[T]:
+    """Lazy Dijkstra search, yielding (node, cost) in order of cost.
+
+    Args:
+        start: Starting node
+        neighbors: Function that returns (neighbor, cost) tuples
+        max_cost: Stop before any node costing more than this
+    """
+    return Search([start], neighbors, weighted=True, max_cost=max_cost)
+
+
+def iter_astar(
+    start: T,
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    heuristic: Callable[[T], int],
+    max_cost: int | None = None,
+) -> Search[T]:
+    """Lazy A* search, yielding (node, cost) in order of estimated total.
+
+    Args:
+        start: Starting node
+        neighbors: Function that returns (neighbor, cost) tuples
+        heuristic: Function estimating cost from node to goal (must be
+            consistent, so each node's yielded cost is final)
+        max_cost: Stop before any node whose estimated total exceeds this
+    """
+    return Search(
+        [start], neighbors, weighted=True, heuristic=heuristic, max_cost=max_cost
+    )
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+# Jump end not worked out yet (-1 means the jump hits a wall)
+_UNKNOWN = -2
+
+
+def jump_point_search(
+    grid: Grid[Any],
+    start: tuple[int, int],
+    goal: tuple[int, int],
+    blocked: Callable[[Any], bool],
+    diagonal: bool = False,
+    returns: Literal["path", "cost"] = "path",
+    stats: SearchStats | None = None,
+) -> tuple[list[tuple[int, int]], int] | int | None:
+    """Jump Point Search: A* for uniform-cost grids that skips symmetric paths.
+
+    Instead of queueing every neighbour, each move "jumps" in a straight (or
+    diagonal) line until it reaches the goal or a cell where the path could
+    need to turn (a forced neighbour), and only those jump points are
+    queued, and a jump point only turns towards forced neighbours. On open
+    areas and long corridors that expands a fraction of the cells plain A*
+    does, for the same cost. Each jump's end is remembered for every cell it
+    passed, so no stretch of the grid is scanned twice in one direction.
+
+    Every move costs 1. Diagonal moves may not cut corners: both cells
+    beside the move must be open.
+
+    Args:
+        grid: The grid
+        start: (x, y) to start from
+        goal: (x, y) to reach
+        blocked: Function that returns True for cells that can't be entered
+        diagonal: Allow diagonal moves (8-connected) instead of only the 4
+            cardinal ones
+        returns: "path" for (path, total_cost) with every cell along the
+            path, like astar, or "cost" for the total cost
+        stats: If given, its expanded count is increased by the number of
+            jump points expanded, and peak_node_count records the most jump points held
+
+    Returns:
+        The result selected by returns, or None if no path exists.
+
+    Raises:
+        ValueError: If returns is not "path" or "cost".
+    """
+    _check_path_or_cost_returns(returns)
+
+    # Open cells as a flat bytearray with a blocked border, like FlatGrid
+    width, height = grid.width, grid.height
+    stride = width + 2
+    walkable = bytearray(stride * (height + 2))
+    # blocked is called once per distinct value
+    is_open: dict[Any, int] = {}
+    for row in grid.data:
+        for value in set(row).difference(is_open):
+            is_open[value] = 0 if blocked(value) else 1
+    if all(isinstance(value, str) and len(value) == 1 for value in is_open):
+        # Character grids (the usual case) convert a row at a time in C
+        table = {ord(value): flag for value, flag in is_open.items()}
+        rows = ("".join(row).translate(table).encode() for row in grid.data)
+    else:
+        rows = (bytes(map(is_open.__getitem__, row)) for row in grid.data)
+    for y, row_bytes in enumerate(rows):
+        base = (y + 1) * stride + 1
+        walkable[base : base + width] = row_bytes
+
+    def index(pos: tuple[int, int]) -> int:
+        return (pos[1] + 1) * stride + pos[0] + 1
+
+    def coords(i: int) -> tuple[int, int]:
+        y, x = divmod(i, stride)
+        return (x - 1, y - 1)
+
+    origin, target = index(start), index(goal)
+    if not walkable[origin] or not walkable[target]:
+        return None
+
+    # Where a jump from each cell ends, by direction offset, filled in as
+    # jumps are made. With the goal fixed a jump's end depends only on where
+    # it starts, so every cell a scan passes gets the same answer and no
+    # stretch of the grid is scanned twice in the same direction.
+    steps = [1, -1, stride, -stride]
+    if diagonal:
+        steps += [stride + 1, stride - 1, -stride + 1, -stride - 1]
+    unknown = array("i", [_UNKNOWN]) * len(walkable)
+    jumps = {step: unknown[:] for step in steps}
+
+    def jump_straight(i: int, d: int, side: int) -> int:
+        """Jump from i in direction d; side is the perpendicular offset."""
+        known = jumps[d]
+        passed = []
+        while True:
+            end = known[i]
+            if end != _UNKNOWN:
+                break
+            passed.append(i)
+            i += d
+            if not walkable[i]:
+                end = -1
+                break
+            if i == target:
+                end = i
+                break
+            # A cell beside us that was blocked one step back is forced
+            if (walkable[i + side] and not walkable[i - d + side]) or (
+                walkable[i - side] and not walkable[i - d - side]
+            ):
+                end = i
+                break
+            if not diagonal and side == 1:
+                # Moving vertically (4-connected): turning is allowed anywhere
+                # a horizontal jump finds something
+                if jump_straight(i, 1, stride) != -1 or (
+                    jump_straight(i, -1, stride) != -1
+                ):
+                    end = i
+                    break
+        for i in passed:
+            known[i] = end
+        return end
+
+    def jump_diagonal(i: int, dx: int, dy: int) -> int:
+        """Jump from i in direction (dx, dy) offsets."""
+        known = jumps[dx + dy]
+        passed = []
+        while True:
+            end = known[i]
+            if end != _UNKNOWN:
+                break
+            passed.append(i)
+            if not (walkable[i + dx] and walkable[i + dy]):
+                end = -1
+                break
+            i += dx + dy
+            if not walkable[i]:
+                end = -1
+                break
+            if i == target:
+                end = i
+                break
+            if jump_straight(i, dx, stride) != -1 or jump_straight(i, dy, 1) != -1:
+                end = i
+                break
+        for i in passed:
+            known[i] = end
+        return end
+
+    def directions(i: int, move: tuple[int, int] | None) -> list[tuple[int, int]]:
+        """Offsets (dx, dy) worth jumping in from i, pruned by the arrival move."""
+        if move is None:
+            moves = [(1, 0), (-1, 0), (0, stride), (0, -stride)]
+            if diagonal:
+                moves += [
+                    (dx, dy)
+                    for dx in (1, -1)
+                    for dy in (stride, -stride)
+                    if walkable[i + dx] and walkable[i + dy]
+                ]
+            return moves
+
+        dx, dy = move
+        if dx and dy:
+            moves = [(dx, 0), (0, dy)]
+            if walkable[i + dx] and walkable[i + dy]:
+                moves.append((dx, dy))
+            return moves
+
+        # Straight arrival: carry on, and only turn towards a forced neighbour
+        # (one whose cell a step back is blocked, so no equally short path
+        # reaches it without passing through i). Without diagonals a vertical
+        # jump stops wherever a horizontal one would find something, so it
+        # may turn either way.
+        d, sides = (dx, (stride, -stride)) if dx else (dy, (1, -1))
+        moves = [(d, 0) if dx else (0, d)]
+        free_turns = not diagonal and not dx
+        for side in sides:
+            if walkable[i + side] and (free_turns or not walkable[i - d + side]):
+                moves.append((0, side) if dx else (side, 0))
+                if diagonal and walkable[i + d]:
+                    moves.append((d, side) if dx else (side, d))
+        return moves
+
+    gx, gy = goal[0] + 1, goal[1] + 1
+
+    def estimate(i: int) -> int:
+        y, x = divmod(i, stride)
+        if diagonal:
+            return max(abs(x - gx), abs(y - gy))
+        return abs(x - gx) + abs(y - gy)
+
+    parents: dict[int, int | None] = {origin: None}
+    # The (dx, dy) offsets of the jump that reached each point
+    arrivals: dict[int, tuple[int, int] | None] = {origin: None}
+    costs = {origin: 0}
+    closed: set[int] = set()
+    frontier: LazyHeap[int] = LazyHeap()
+    frontier.push(origin, estimate(origin))
+
+    while frontier:
+        _, current = frontier.pop()
+        if current in closed:
+            continue
+        closed.add(current)
+        cost = costs[current]
+
+        if current == target:
+            if stats is not None:
+                stats.peak_node_count = max(stats.peak_node_count, len(costs))
+            if returns == "cost":
+                return cost
+            return (_expand_jumps(reconstruct_path(parents, current), coords), cost)
+
+        if stats is not None:
+            stats.expanded += 1
+        for move in directions(current, arrivals[current]):
+            dx, dy = move
+            if dx and dy:
+                point = jump_diagonal(current, dx, dy)
+            elif dx:
+                point = jump_straight(current, dx, stride)
+            else:
+                point = jump_straight(current, dy, 1)
+            if point == -1 or point in closed:
+                continue
+            # Jumps are straight or diagonal lines, one move per step
+            new_cost = cost + (point - current) // (dx + dy)
+            if point not in costs or new_cost < costs[point]:
+                costs[point] = new_cost
+                parents[point] = current
+                arrivals[point] = move
+                frontier.push(point, new_cost + estimate(point))
+
+    return None
+
+
+def _expand_jumps(
+    points: list[int], coords: Callable[[int], tuple[int, int]]
+) -> list[tuple[int, int]]:
+    """Fill in the cells between consecutive jump points."""
+    path = [coords(points[0])]
+    for point in points[1:]:
+        x, y = path[-1]
+        tx, ty = coords(point)
+        dx, dy = _sign(tx - x), _sign(ty - y)
+        while (x, y) != (tx, ty):
+            x, y = x + dx, y + dy
+            path.append((x, y))
+    return path
+
+
+def ida_star(
+    start: T,
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    heuristic: Callable[[T], int],
+    goal: Callable[[T], bool],
+    table_size: int = 100_000,
+    returns: Literal["path", "cost"] = "path",
+    stats: SearchStats | None = None,
+) -> tuple[list[T], int] | int | None:
+    """Iterative deepening A*: optimal search in memory bounded by the table size.
+
+    Runs depth-first searches that give up on any node whose estimated
+    total exceeds a bound, raising the bound to the smallest estimate that
+    exceeded it until a goal is found. Only the current path is kept, plus a
+    transposition table of the cheapest cost each node was reached at in
+    this pass, which prunes repeat visits. Once the table is full the oldest
+    entries are dropped, so memory stays bounded (by table_size plus the
+    path's depth) but some nodes may be searched again.
+
+    Args:
+        start: Starting node
+        neighbors: Function that returns (neighbor, cost) tuples; costs must
+            be non-negative
+        heuristic: Function estimating cost from node to goal (must not
+            overestimate, and must be 0 at a goal)
+        goal: Function that returns True if node is the goal
+        table_size: Most entries kept in the transposition table
+        returns: "path" for (path, total_cost), or "cost" for the total cost
+        stats: If given, nodes expanded are added to it and peak_node_count
+            records the most path and table entries held at once
+
+    Returns:
+        The result selected by returns, or None if no path exists.
+
+    Raises:
+        ValueError: If returns is not "path" or "cost".
+    """
+    _check_path_or_cost_returns(returns)
+
+    def found(path: list[T], cost: int):
+        return cost if returns == "cost" else (path, cost)
+
+    if goal(start):
+        return found([start], 0)
+
+    bound = heuristic(start)
+    while True:
+        table: dict[T, int] = {start: 0}
+        on_path = {start}
+        # One entry per node of the current path: (node, cost, children left)
+        stack = [(start, 0, iter(neighbors(start)))]
+        next_bound = None
+        if stats is not None:
+            stats.expanded += 1
+
+        while stack:
+            node, cost, children = stack[-1]
+            for child, edge_cost in children:
+                child_cost = cost + edge_cost
+                estimate = child_cost + heuristic(child)
+                if estimate > bound:
+                    if next_bound is None or estimate < next_bound:
+                        next_bound = estimate
+                    continue
+                if child in on_path:
+                    continue
+                seen = table.get(child)
+                if seen is not None and seen <= child_cost:
+                    continue
+
+                if seen is None and len(table) >= table_size:
+                    # Dicts keep insertion order, so this drops the oldest entry
+                    del table[next(iter(table))]
+                table[child] = child_cost
+
+                if goal(child):
+                    return found([entry[0] for entry in stack] + [child], child_cost)
+
+                stack.append((child, child_cost, iter(neighbors(child))))
+                on_path.add(child)
+                if stats is not None:
+                    stats.expanded += 1
+                    stats.peak_node_count = max(
+                        stats.peak_node_count, len(stack) + len(table)
+                    )
+                break
+            else:
+                stack.pop()
+                on_path.discard(node)
+
+        if next_bound is None:
+            return None
+        bound = next_bound
+
+
+def beam_search(
+    start: T,
+    neighbors: Callable[[T], Iterable[tuple[T, int]]],
+    heuristic: Callable[[T], int],
+    goal: Callable[[T], bool],
+    width: int,
+    max_depth: int | None = None,
+    table_size: int = 100_000,
+    returns: Literal["path", "cost"] = "path",
+    stats: SearchStats | None = None,
+) -> tuple[list[T], int] | int | None:
+    """Beam search: breadth-first, keeping only the best width nodes per layer.
+
+    Each layer's children are ranked by cost so far plus heuristic and all
+    but the best width are dropped. A child is also dropped if it is in a
+    table of nodes kept in earlier layers at no greater cost, so the search
+    ends (returning None) once a layer finds nothing new. Once the table is
+    full the oldest entries are dropped, so memory stays bounded (by width
+    and table_size, plus the beam's paths when returns is "path") but old
+    nodes may be searched again; on a cycle longer than the table that can
+    go on forever, so set max_depth there. The result is not guaranteed to
+    be optimal, and a goal can be missed if every path to it is pruned.
+
+    Args:
+        start: Starting node
+        neighbors: Function that returns (neighbor, cost) tuples; costs must
+            be non-negative
+        heuristic: Function estimating cost from node to goal
+        goal: Function that returns True if node is the goal
+        width: Most nodes kept per layer
+        max_depth: Give up after this many layers; None to go on until a
+            layer finds nothing new (which may never happen if the state
+            space is infinite)
+        table_size: Most entries kept in the table of earlier layers' nodes
+        returns: "path" for (path, total_cost), or "cost" for the total cost
+        stats: If given, nodes expanded are added to it and peak_node_count
+            records the most beam, child and table entries held at once
+
+    Returns:
+        The result selected by returns for the cheapest goal in the first
+        layer that has one, or None if no goal was found.
+
+    Raises:
+        ValueError: If returns is not "path" or "cost".
+    """
+    _check_path_or_cost_returns(returns)
+
+    # Beam entries: (node, cost, path) with path as nested (node, rest) tuples;
+    # paths are only built when they are returned
+    track = returns == "path"
+    beam: list[tuple[T, int, tuple | None]] = [
+        (start, 0, (start, None) if track else None)
+    ]
+    # Cheapest cost each node was kept in the beam at, oldest first
+    kept: dict[T, int] = {start: 0}
+    depth = 0
+
+    while beam:
+        goals = [entry for entry in beam if goal(entry[0])]
+        if goals:
+            node, cost, link = min(goals, key=lambda entry: entry[1])
+            if returns == "cost":
+                return cost
+            path = []
+            while link is not None:
+                path.append(link[0])
+                link = link[1]
+            path.reverse()
+            return (path, cost)
+
+        if max_depth is not None and depth >= max_depth:
+            return None
+        depth += 1
+
+        # Cheapest way found to each child in this layer
+        children: dict[T, tuple[int, tuple | None]] = {}
+        for node, cost, link in beam:
+            if stats is not None:
+                stats.expanded += 1
+            for child, edge_cost in neighbors(node):
+                child_cost = cost + edge_cost
+                if child in kept and kept[child] <= child_cost:
+                    continue
+                if child not in children or child_cost < children[child][0]:
+                    children[child] = (child_cost, (child, link) if track else None)
+
+        if stats is not None:
+            stats.peak_node_count = max(
+                stats.peak_node_count, len(beam) + len(children) + len(kept)
+            )
+
+        best = nsmallest(
+            width, children.items(), key=lambda item: item[1][0] + heuristic(item[0])
+        )
+        beam = [(child, cost, link) for child, (cost, link) in best]
+        for child, cost, _ in beam:
+            if child not in kept and len(kept) >= table_size:
+                # Dicts keep insertion order, so this drops the oldest entry
+                del kept[next(iter(kept))]
+            kept[child] = cost
+
+    return None
@@ -0,0 +1,101 @@
+"""k-core peeling.
+
+Repeatedly removing every node with fewer than ``k`` remaining neighbours
+leaves the graph's k-core. Rather than rescanning everything after each round,
+these routines count neighbours once, keep a worklist of nodes that have
+dropped below the threshold, and only update the neighbours of each removed
+node, so the work is proportional to the number of removals.
+"""
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from typing import TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+def peel(nodes: Iterable[T], neighbors: Callable[[T], Iterable[T]], k: int) -> list[T]:
+    """Peel a graph down to its k-core.
+
+    Args:
+        nodes: The nodes initially present
+        neighbors: Function returning a node's neighbours; neighbours that
+            aren't present are ignored
+        k: Nodes with fewer than k present neighbours are removed
+
+    Returns:
+        The removed nodes in removal order. The nodes not returned form the
+        k-core.
+    """
+    present = set(nodes)
+    counts = {n: sum(1 for m in neighbors(n) if m in present) for n in present}
+
+    queue = [n for n, count in counts.items() if count < k]
+    # Nodes leave `present` as soon as they're queued, so none is queued twice
+    present.difference_update(queue)
+    removed = []
+
+    while queue:
+        node = queue.pop()
+        removed.append(node)
+        for neighbor in neighbors(node):
+            if neighbor in present:
+                counts[neighbor] -= 1
+                if counts[neighbor] < k:
+                    present.remove(neighbor)
+                    queue.append(neighbor)
+
+    return removed
+
+
+def peel_cells(
+    alive: bytearray,
+    offsets: Sequence[int],
+    k: int,
+    counts: bytearray | None = None,
+) -> list[int]:
+    """Peel flat-indexed grid cells down to their k-core.
+
+    The fast path for grids: cells are indices into a flat buffer and each
+    neighbourhood is a fixed set of index offsets (e.g. ``FlatGrid.n8``).
+
+    Args:
+        alive: 1 for present cells, 0 otherwise. Every cell within reach of
+            a present cell's offsets must be in range, e.g. thanks to a
+            border of zeros. Not modified.
+        offsets: Index offsets of a cell's neighbours
+        k: Cells with fewer than k present neighbours are removed
+        counts: Present neighbour count of every present cell, if already
+            known (e.g. from a vectorized ``neighbor_counts``). Not modified.
+
+    Returns:
+        The flat indices of the removed cells in removal order.
+    """
+    alive = bytearray(alive)
+    known = counts is not None
+    counts = bytearray(counts) if known else bytearray(len(alive))
+    queue = []
+
+    start = alive.find(1)
+    while start != -1:
+        if not known:
+            counts[start] = sum(alive[start + d] for d in offsets)
+        if counts[start] < k:
+            queue.append(start)
+        start = alive.find(1, start + 1)
+
+    for i in queue:
+        alive[i] = 0
+    removed = []
+
+    while queue:
+        i = queue.pop()
+        removed.append(i)
+        for d in offsets:
+            n = i + d
+            if alive[n]:
+                counts[n] -= 1
+                if counts[n] < k:
+                    alive[n] = 0
+                    queue.append(n)
+
+    return removed
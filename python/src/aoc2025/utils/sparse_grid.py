@@ -0,0 +1,197 @@
+"""Sparse chunked grid for huge or unbounded coordinate spaces.
+
+Provides a SparseGrid class that stores fixed-size square chunks of
+characters in a dict keyed by chunk coordinate. Only chunks that have been
+written to exist, so coordinates can be negative or in the millions without
+allocating the space in between, while cells within a chunk stay as compact
+as a dense bytearray.
+"""
+
+from typing import Iterator
+
+# Chunk side length; a power of two so chunk lookups are shifts and masks
+CHUNK_BITS = 6
+CHUNK_SIZE = 1 << CHUNK_BITS
+_MASK = CHUNK_SIZE - 1
+
+# Bounding box as (min_x, min_y, max_x, max_y), inclusive
+BBox = tuple[int, int, int, int]
+
+
+class SparseGrid:
+    """An unbounded 2D grid of characters, mostly filled with a default."""
+
+    def __init__(self, default: str = "."):
+        """Create an empty grid.
+
+        Args:
+            default: Character of every cell that hasn't been set
+        """
+        self.default = default
+        self._default_byte = ord(default)
+        self.chunks: dict[tuple[int, int], bytearray] = {}
+
+    @classmethod
+    def from_string(
+        cls, input_text: str, default: str = ".", origin: tuple[int, int] = (0, 0)
+    ) -> "SparseGrid":
+        """Parse a grid from a multi-line string, with its top left at origin."""
+        grid = cls(default)
+        ox, oy = origin
+        for y, line in enumerate(input_text.strip().splitlines()):
+            for x, value in enumerate(line):
+                if value != default:
+                    grid.set(ox + x, oy + y, value)
+        return grid
+
+    def _chunk(self, x: int, y: int) -> bytearray:
+        """Get the chunk holding (x, y), creating it if needed."""
+        # Arithmetic shifts floor, so negative coordinates get their own chunks
+        key = (x >> CHUNK_BITS, y >> CHUNK_BITS)
+        chunk = self.chunks.get(key)
+        if chunk is None:
+            chunk = bytearray([self._default_byte]) * (CHUNK_SIZE * CHUNK_SIZE)
+            self.chunks[key] = chunk
+        return chunk
+
+    def get(self, x: int, y: int) -> str:
+        """Get the character at (x, y)."""
+        chunk = self.chunks.get((x >> CHUNK_BITS, y >> CHUNK_BITS))
+        if chunk is None:
+            return self.default
+        return chr(chunk[(y & _MASK) << CHUNK_BITS | (x & _MASK)])
+
+    def set(self, x: int, y: int, value: str) -> None:
+        """Set the character at (x, y).
+
+        Setting the default in a chunk that then holds only defaults drops
+        the chunk.
+        """
+        key = (x >> CHUNK_BITS, y >> CHUNK_BITS)
+        if value == self.default:
+            chunk = self.chunks.get(key)
+            if chunk is not None:
+                chunk[(y & _MASK) << CHUNK_BITS | (x & _MASK)] = self._default_byte
+                self._drop_if_empty(key)
+            return
+        self._chunk(x, y)[(y & _MASK) << CHUNK_BITS | (x & _MASK)] = ord(value)
+
+    def _drop_if_empty(self, key: tuple[int, int]) -> None:
+        """Remove a chunk if every one of its cells is the default."""
+        chunk = self.chunks[key]
+        if chunk.count(self._default_byte) == len(chunk):
+            del self.chunks[key]
+
+    def fill_rect(self, x0: int, y0: int, x1: int, y1: int, value: str) -> None:
+        """Set every cell from (x0, y0) to (x1, y1) inclusive.
+
+        Works a chunk row at a time with slice assignment. Chunks that end up
+        entirely default are dropped.
+        """
+        x0, x1 = sorted((x0, x1))
+        y0, y1 = sorted((y0, y1))
+        byte = ord(value)
+        clearing = value == self.default
+
+        for cy in range(y0 >> CHUNK_BITS, (y1 >> CHUNK_BITS) + 1):
+            row_lo = max(y0, cy << CHUNK_BITS) & _MASK
+            row_hi = min(y1, (cy << CHUNK_BITS) + _MASK) & _MASK
+            for cx in range(x0 >> CHUNK_BITS, (x1 >> CHUNK_BITS) + 1):
+                col_lo = max(x0, cx << CHUNK_BITS) & _MASK
+                col_hi = min(x1, (cx << CHUNK_BITS) + _MASK) & _MASK
+                covers_chunk = (row_lo, row_hi, col_lo, col_hi) == (0, _MASK, 0, _MASK)
+
+                if clearing and (covers_chunk or (cx, cy) not in self.chunks):
+                    self.chunks.pop((cx, cy), None)
+                    continue
+
+                chunk = self._chunk(cx << CHUNK_BITS, cy << CHUNK_BITS)
+                if covers_chunk:
+                    chunk[:] = bytes([byte]) * len(chunk)
+                    continue
+                span = bytes([byte]) * (col_hi - col_lo + 1)
+                for row in range(row_lo, row_hi + 1):
+                    start = row << CHUNK_BITS | col_lo
+                    chunk[start : start + len(span)] = span
+                if clearing:
+                    self._drop_if_empty((cx, cy))
+
+    def iter_chunks(self) -> Iterator[tuple[tuple[int, int], bytearray]]:
+        """Iterate over the allocated chunks as ((x, y) of top left, cells).
+
+        The cell at (x + dx, y + dy) is ``cells[dy * CHUNK_SIZE + dx]``.
+        """
+        for (cx, cy), chunk in self.chunks.items():
+            yield (cx << CHUNK_BITS, cy << CHUNK_BITS), chunk
+
+    def iter(self) -> Iterator[tuple[tuple[int, int], str]]:
+        """Iterate over the positions and values of all non-default cells."""
+        default = self._default_byte
+        for (ox, oy), chunk in self.iter_chunks():
+            for i, value in enumerate(chunk):
+                if value != default:
+                    yield (ox + (i & _MASK), oy + (i >> CHUNK_BITS)), chr(value)
+
+    def count(self, value: str) -> int:
+        """Count the cells set to value (which must not be the default)."""
+        return sum(chunk.count(ord(value)) for chunk in self.chunks.values())
+
+    def find_all(self, value: str) -> list[tuple[int, int]]:
+        """Find all positions with the given (non-default) value."""
+        return [pos for pos, v in self.iter() if v == value]
+
+    def bbox(self) -> BBox | None:
+        """Get the bounding box of the non-default cells, or None if there are none.
+
+        Only chunks on the outside of the allocated chunk range are scanned
+        cell by cell.
+        """
+        empty_row = bytes([self._default_byte]) * CHUNK_SIZE
+        min_x = min_y = max_x = max_y = None
+
+        for (ox, oy), chunk in self.iter_chunks():
+            if min_x is not None and (
+                min_x <= ox
+                and min_y <= oy
+                and ox + _MASK <= max_x
+                and oy + _MASK <= max_y
+            ):
+                continue
+            rows = [
+                r
+                for r in range(CHUNK_SIZE)
+                if chunk[r << CHUNK_BITS : (r + 1) << CHUNK_BITS] != empty_row
+            ]
+            if not rows:
+                continue
+            cols = [
+                c
+                for c in range(CHUNK_SIZE)
+                if any(
+                    chunk[r << CHUNK_BITS | c] != self._default_byte for r in rows
+                )
+            ]
+            box = (ox + cols[0], oy + rows[0], ox + cols[-1], oy + rows[-1])
+            if min_x is None:
+                min_x, min_y, max_x, max_y = box
+            else:
+                min_x, min_y = min(min_x, box[0]), min(min_y, box[1])
+                max_x, max_y = max(max_x, box[2]), max(max_y, box[3])
+
+        if min_x is None:
+            return None
+        return (min_x, min_y, max_x, max_y)
+
+    def __str__(self) -> str:
+        """Render the bounding box of the non-default cells."""
+        box = self.bbox()
+        if box is None:
+            return ""
+        min_x, min_y, max_x, max_y = box
+        return "\n".join(
+            "".join(self.get(x, y) for x in range(min_x, max_x + 1))
+            for y in range(min_y, max_y + 1)
+        )
+
+    def __repr__(self) -> str:
+        return f"SparseGrid({len(self.chunks)} chunks of {CHUNK_SIZE}x{CHUNK_SIZE})"
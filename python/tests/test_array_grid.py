@@ -0,0 +1,82 @@
+"""Tests for the NumPy-backed grid."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import aoc2025
+from aoc2025.utils.array_grid import ArrayGrid, neighbor_counts
+from aoc2025.utils.grid import Grid
+
+TEXT = "..@#\n@@.#\n#.@.\n"
+
+
+@pytest.fixture
+def grids():
+    return ArrayGrid.from_string(TEXT), Grid.from_string(TEXT)
+
+
+def test_from_string_layout(grids):
+    array_grid, _ = grids
+    assert (array_grid.width, array_grid.height) == (4, 3)
+    assert array_grid.data.dtype == np.uint8
+    assert str(array_grid) == TEXT.strip()
+
+
+def test_rejects_ragged_lines():
+    with pytest.raises(ValueError):
+        ArrayGrid.from_string("abc\nde\nfgh")
+
+
+def test_matches_list_grid(grids):
+    """The scalar interface behaves like Grid[str]."""
+    array_grid, grid = grids
+    assert list(array_grid.iter()) == list(grid.iter())
+    assert array_grid.find_all("@") == grid.find_all("@")
+    assert array_grid.find("#") == grid.find("#")
+    assert array_grid.find("x") is None
+    assert array_grid.get(4, 0) is None
+    for x, y in [(0, 0), (2, 1), (3, 2)]:
+        assert set(array_grid.neighbors(x, y)) == set(grid.neighbors(x, y))
+        assert set(array_grid.neighbors_diagonal(x, y)) == set(
+            grid.neighbors_diagonal(x, y)
+        )
+    assert str(array_grid.rotate_right()) == str(grid.rotate_right())
+    assert str(array_grid.rotate_left()) == str(grid.rotate_left())
+    assert array_grid.row(1) == grid.row(1)
+
+
+def test_rotation_is_a_view(grids):
+    array_grid, _ = grids
+    rotated = array_grid.rotate_right()
+    rotated.set(0, 0, "X")
+    assert array_grid.get(0, 2) == "X"
+
+
+def test_neighbor_counts_match_loop(grids):
+    """Vectorized counts agree with counting neighbours one cell at a time."""
+    array_grid, grid = grids
+    for diagonal in (True, False):
+        counts = array_grid.neighbor_counts("@", diagonal)
+        for (x, y), _ in grid.iter():
+            around = grid.neighbors_diagonal(x, y) if diagonal else grid.neighbors(x, y)
+            expected = sum(grid.get(nx, ny) == "@" for nx, ny in around)
+            assert counts[y, x] == expected
+
+
+def test_neighbor_counts_full_mask():
+    counts = neighbor_counts(np.ones((3, 3), dtype=bool))
+    assert counts.tolist() == [[3, 5, 3], [5, 8, 5], [3, 5, 3]]
+
+
+def test_utils_import_does_not_load_numpy():
+    """ArrayGrid is exported lazily, so importing utils stays cheap."""
+    code = (
+        "import sys, aoc2025.utils as u; assert 'numpy' not in sys.modules; "
+        "u.ArrayGrid; assert 'numpy' in sys.modules"
+    )
+    src = Path(aoc2025.__file__).parent.parent
+    subprocess.run([sys.executable, "-c", code], check=True, env={"PYTHONPATH": src})
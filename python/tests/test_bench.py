@@ -0,0 +1,69 @@
+"""Tests for the benchmark helpers."""
+
+import gc
+
+import pytest
+
+from aoc2025 import bench
+from aoc2025.bench import (
+    BenchResult,
+    bench_part,
+    compare,
+    load_baseline,
+    mann_whitney_greater,
+    percentile,
+    save_baseline,
+)
+
+
+def test_percentile_interpolates():
+    """Percentiles interpolate between the closest ranks."""
+    samples = [4.0, 1.0, 3.0, 2.0, 5.0]
+    assert percentile(samples, 0) == 1.0
+    assert percentile(samples, 50) == 3.0
+    assert percentile(samples, 100) == 5.0
+    assert percentile(samples, 95) == pytest.approx(4.8)
+
+
+def test_bench_part_collects_samples(load_example):
+    """One sample is recorded per repeat and the collector is restored."""
+    result = bench_part(5, 1, load_example(5), warmups=1, repeats=4)
+    assert len(result.samples) == 4
+    assert result.min <= result.median <= result.p95
+    assert gc.isenabled()
+    assert set(result.to_dict()) >= {"day", "part", "samples", "median", "p95"}
+
+
+def test_mann_whitney_detects_slowdown():
+    """Clearly slower samples give a small p-value; equal ones don't."""
+    baseline = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98, 1.01]
+    slower = [v * 1.5 for v in baseline]
+    assert mann_whitney_greater(baseline, slower) < 0.01
+    assert mann_whitney_greater(baseline, baseline) > 0.4
+    assert mann_whitney_greater(slower, baseline) > 0.99
+
+
+def test_compare_needs_threshold_and_significance():
+    """A regression must exceed the threshold and be significant."""
+    samples = [1.0, 1.1, 0.9, 1.05, 0.95, 1.02, 0.98, 1.01]
+    baseline = {(1, 1): samples, (1, 2): samples}
+    results = [
+        BenchResult(1, 1, [v * 1.5 for v in samples]),
+        BenchResult(1, 2, [v * 1.05 for v in samples]),
+    ]
+
+    first, second = compare(baseline, results, threshold=0.1)
+    assert first.regressed
+    assert first.change == pytest.approx(0.5)
+    assert not second.regressed
+
+
+def test_baseline_round_trip(tmp_path, monkeypatch):
+    """Saved baselines load back keyed by (day, part)."""
+    monkeypatch.setattr(bench, "BASELINE_DIR", tmp_path)
+    save_baseline("main", [BenchResult(3, 2, [1.0, 2.0])])
+    save_baseline("main", [BenchResult(4, 1, [3.0])])
+    assert load_baseline("main") == {(3, 2): [1.0, 2.0], (4, 1): [3.0]}
+
+    with pytest.raises(FileNotFoundError):
+        load_baseline("missing")
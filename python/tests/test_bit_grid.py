@@ -0,0 +1,110 @@
+"""Tests for the row-bitmask boolean grid."""
+
+import random
+
+from aoc2025.utils.bit_grid import BitGrid
+from aoc2025.utils.grid import Grid
+
+TEXT = "..@#\n@@.#\n#.@.\n"
+
+
+def test_from_string_bit_order():
+    """Column x is bit x of its row."""
+    grid = BitGrid.from_string(TEXT, on="@")
+    assert grid.rows == [0b0100, 0b0011, 0b0100]
+    assert str(BitGrid.from_string(TEXT)) == "...#\n...#\n#..."
+
+
+def test_set_clear_test_count():
+    grid = BitGrid(70, 3)
+    grid.set(69, 2)
+    grid.set(0, 0)
+    assert grid.test(69, 2) and grid.test(0, 0) and not grid.test(1, 0)
+    assert not grid.test(70, 2) and not grid.test(-1, 0)
+    assert grid.count() == 2
+    grid.clear(69, 2)
+    assert list(grid.points()) == [(0, 0)]
+
+
+def test_set_clear_out_of_bounds_ignored():
+    """Cells outside the grid can't be set, so counts stay correct."""
+    grid = BitGrid(4, 2)
+    assert not grid.set(4 + 3, 1) and not grid.set(0, 2) and not grid.set(-1, 0)
+    assert not grid.clear(7, 1)
+    assert grid.rows == [0, 0]
+    assert grid.count() == 0 and (~grid).count() == 8
+
+
+def test_row_all():
+    grid = BitGrid.from_string(".###.")
+    assert grid.row_all(0, 1, 3)
+    assert not grid.row_all(0, 0, 3)
+
+
+def test_neighbour_counts_match_loop():
+    """Bit-sliced counts agree with counting one cell at a time."""
+    rng = random.Random(1)
+    text = "\n".join(
+        "".join(rng.choice("@.") for _ in range(67)) for _ in range(23)
+    )
+    grid, bits = Grid.from_string(text), BitGrid.from_string(text, on="@")
+
+    for diagonal in (True, False):
+        for k in (0, 1, 4, 9):
+            expected = set()
+            for (x, y), _ in grid.iter():
+                around = (
+                    grid.neighbors_diagonal(x, y) if diagonal else grid.neighbors(x, y)
+                )
+                if sum(grid.get(nx, ny) == "@" for nx, ny in around) < k:
+                    expected.add((x, y))
+            assert set(bits.neighbors_fewer_than(k, diagonal).points()) == expected
+
+
+def test_flood_fill_through_set_cells():
+    passable = BitGrid.from_string("##.#\n.#.#\n##.#", on="#")
+    seeds = BitGrid.from_points(4, 3, [(0, 0)])
+    filled = passable.flood_fill(seeds)
+    assert sorted(filled.points()) == [(0, 0), (0, 2), (1, 0), (1, 1), (1, 2)]
+
+
+def test_flood_fill_matches_bfs():
+    """Random grids fill the same as a cell-by-cell search, seeds anywhere."""
+    rng = random.Random(2)
+    for _ in range(20):
+        width, height = rng.randint(1, 90), rng.randint(1, 12)
+        text = "\n".join(
+            "".join(rng.choice("##.") for _ in range(width)) for _ in range(height)
+        )
+        grid, passable = Grid.from_string(text), BitGrid.from_string(text)
+        seeds = [(rng.randrange(width), rng.randrange(height)) for _ in range(3)]
+
+        expected = {pos for pos in seeds if grid.get(*pos) == "#"}
+        queue = list(expected)
+        while queue:
+            for n in grid.neighbors(*queue.pop()):
+                if grid.get(*n) == "#" and n not in expected:
+                    expected.add(n)
+                    queue.append(n)
+
+        filled = passable.flood_fill(BitGrid.from_points(width, height, seeds))
+        assert set(filled.points()) == expected
+
+
+def test_flood_fill_serpentine():
+    """A winding corridor is filled end to end."""
+    rows = ["#" * 200 if y % 2 == 0 else "." * 199 + "#" for y in range(9)]
+    rows[3] = "#" + "." * 199
+    rows[7] = "#" + "." * 199
+    passable = BitGrid.from_string("\n".join(rows))
+    filled = passable.flood_fill(BitGrid.from_points(200, 9, [(0, 0)]))
+    assert filled == passable
+
+
+def test_set_operations():
+    a = BitGrid.from_string("##..\n..##")
+    b = BitGrid.from_string("#.#.\n#.#.")
+    assert str(a & b) == "#...\n..#."
+    assert str(a | b) == "###.\n#.##"
+    assert str(~a) == "..##\n##.."
+    assert a == a.copy() and a != b
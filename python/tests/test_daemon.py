@@ -0,0 +1,99 @@
+"""Tests for the warm solver daemon."""
+
+import socket
+import threading
+
+import pytest
+
+from aoc2025 import daemon
+from aoc2025.daemon import SolverState
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="needs Unix domain sockets"
+)
+
+
+def test_parsed_input_stays_warm():
+    """The second solve of a day reuses the parsed input."""
+    state = SolverState()
+    first = state.handle({"op": "solve", "day": 5, "part": 1, "example": True})
+    second = state.handle({"op": "solve", "day": 5, "part": 2, "example": True})
+
+    assert (first["result"], first["warm"]) == (3, False)
+    assert (second["result"], second["warm"]) == (14, True)
+
+
+def test_changed_module_is_reloaded():
+    """A changed source file reloads the module and drops its parsed inputs."""
+    state = SolverState()
+    state.handle({"op": "solve", "day": 5, "part": 1, "example": True})
+
+    # Pretend the source file was edited since it was loaded
+    state.module_mtimes[5]["aoc2025.days.day05"] = 0.0
+    response = state.handle({"op": "solve", "day": 5, "part": 1, "example": True})
+    assert (response["result"], response["warm"]) == (3, False)
+
+
+def test_changed_utils_module_is_reloaded(monkeypatch):
+    """Editing a utils module a day imports reloads both, dependency first."""
+    state = SolverState()
+    state.handle({"op": "solve", "day": 4, "part": 1, "example": True})
+
+    reloaded = []
+    original = daemon.importlib.reload
+
+    def reload(module):
+        reloaded.append(module.__name__)
+        return original(module)
+
+    monkeypatch.setattr(daemon.importlib, "reload", reload)
+    state.module_mtimes[4]["aoc2025.utils.peeling"] = 0.0
+    response = state.handle({"op": "solve", "day": 4, "part": 1, "example": True})
+
+    assert (response["result"], response["warm"]) == (13, False)
+    assert reloaded.index("aoc2025.utils.peeling") < reloaded.index(
+        "aoc2025.days.day04"
+    )
+
+
+def test_unknown_day():
+    """Missing days are reported as errors."""
+    response = SolverState().handle({"op": "solve", "day": 25, "part": 1})
+    assert not response["ok"]
+
+
+def test_bad_part_rejected_before_input_is_loaded(monkeypatch):
+    """An invalid part is an error without reading or downloading the input."""
+    state = SolverState()
+
+    def data(*args):
+        raise AssertionError("input loaded")
+
+    monkeypatch.setattr(state, "data", data)
+    response = state.handle({"op": "solve", "day": 5, "part": 3})
+    assert not response["ok"]
+    assert "Part" in response["error"]
+
+
+def test_socket_round_trip(tmp_path):
+    """Requests are answered over the socket until shutdown."""
+    path = tmp_path / "aoc.sock"
+    server = threading.Thread(target=daemon.serve, args=(path,))
+    server.start()
+    try:
+        for _ in range(100):
+            if path.exists():
+                break
+            threading.Event().wait(0.01)
+
+        assert daemon.request({"op": "ping"}, path)["ok"]
+        response = daemon.request(
+            {"op": "solve", "day": 4, "part": 1, "example": True}, path
+        )
+        assert response["result"] == 13
+    finally:
+        daemon.request({"op": "shutdown"}, path)
+        server.join(timeout=5)
+
+    assert not server.is_alive()
+    assert not path.exists()
@@ -28,3 +28,12 @@ class TestPart2:
         # TODO: Update expected value from puzzle description
         result = day10.part_two(example_input)
         assert result == 33  # Replace with expected value
+
+    def test_example_search(self, example_input):
+        """Test the search-based part two with the example input."""
+        assert day10.part_two_bfs(example_input) == 33
+
+    def test_search_unsolvable_machine(self):
+        """A counter no button adds to makes the search give up cleanly."""
+        machines = ([], [[0b10], [0b01]], [[1, 1], [1, 0]])
+        assert day10.part_two_bfs(machines) is None
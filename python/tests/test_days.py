@@ -0,0 +1,76 @@
+"""Tests for the day registry."""
+
+import sys
+
+import pytest
+
+from aoc2025.days import (
+    DAYS,
+    available_days,
+    get_day,
+    has_parser,
+    has_stream_parser,
+    parse_input,
+    parse_lines,
+    run_day,
+    run_part,
+)
+
+
+def test_available_days_lists_modules():
+    """Every dayNN module is discovered."""
+    assert available_days() == list(range(1, 13))
+
+
+def test_unknown_day():
+    """Missing days are reported rather than raising."""
+    assert get_day(25) is None
+    assert 25 not in DAYS
+    assert run_day(25, 1, "") is None
+
+
+def test_lookup_imports_on_demand():
+    """Looking a day up returns its module."""
+    module = DAYS[5]
+    assert module is sys.modules["aoc2025.days.day05"]
+    assert module is get_day(5)
+
+
+def test_parse_hook_shared_between_parts(load_example):
+    """Both parts run on one parsed value without mutating it."""
+    input_text = load_example(4)
+    data = parse_input(4, input_text)
+    before = str(data)
+
+    assert run_part(4, 1, data) == run_day(4, 1, input_text)
+    assert run_part(4, 2, data) == run_day(4, 2, input_text)
+    assert str(data) == before
+
+
+def test_days_without_parse_hook_get_text(load_example):
+    """Days with no parse hook receive the raw input text."""
+    input_text = load_example(3)
+    assert not has_parser(3)
+    assert parse_input(3, input_text) is input_text
+
+
+@pytest.mark.parametrize("day", [5, 9])
+def test_stream_parser_matches_parse(load_example, day):
+    """parse_stream gives the same value as parse for days that opt in."""
+    input_text = load_example(day)
+    assert has_stream_parser(day)
+    assert parse_lines(day, input_text.splitlines()) == parse_input(day, input_text)
+
+
+@pytest.mark.parametrize("day", [5, 9])
+def test_stream_parser_skips_leading_blank_lines(load_example, day):
+    """Blank lines before the input are ignored, as parse's strip does."""
+    input_text = "\n\n" + load_example(day)
+    assert parse_lines(day, input_text.splitlines()) == parse_input(day, input_text)
+
+
+def test_parse_lines_falls_back_to_text(load_example):
+    """Days without parse_stream get the joined lines as text."""
+    input_text = load_example(6)
+    assert not has_stream_parser(6)
+    assert parse_lines(6, input_text.splitlines()) == input_text
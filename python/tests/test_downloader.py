@@ -0,0 +1,231 @@
+"""Tests for the concurrent input downloader, against a local stand-in site."""
+
+import asyncio
+import hashlib
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from aoc2025 import input as aoc_input
+from aoc2025.cli import main
+from aoc2025.downloader import (
+    RateLimiter,
+    download_days,
+    meta_path,
+    released_days,
+)
+
+INPUT_PATH = re.compile(r"^/2025/day/(\d+)/input$")
+
+
+class FakeAoC(ThreadingHTTPServer):
+    """A tiny stand-in for adventofcode.com serving inputs on localhost.
+
+    Inputs get a content-based ETag so conditional requests can be checked, and a
+    number of leading requests can be made to fail with 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FakeHandler)
+        self.inputs = {day: f"input for day {day}\n" for day in range(1, 13)}
+        self.failures = 0
+        self.requests: list[tuple[int, float]] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _FakeHandler(BaseHTTPRequestHandler):
+    server: FakeAoC
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            self._respond()
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _respond(self) -> None:
+        server = self.server
+        match = INPUT_PATH.match(self.path)
+        day = int(match.group(1)) if match else 0
+        with server.lock:
+            server.requests.append((day, time.monotonic()))
+            failing = server.failures > 0
+            server.failures -= failing
+
+        # Slow enough that concurrent requests overlap
+        time.sleep(0.05)
+        if failing:
+            self._send(503, b"try again")
+        elif self.headers.get("Cookie") != "session=test":
+            self._send(400, b"Puzzle inputs differ by user.")
+        elif day not in server.inputs:
+            self._send(404, b"Not Found")
+        else:
+            body = server.inputs[day].encode()
+            etag = f'"{hashlib.sha1(body).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self._send(304, b"", etag)
+            else:
+                self._send(200, body, etag)
+
+    def _send(self, status: int, body: bytes, etag: str | None = None) -> None:
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def site():
+    server = FakeAoC()
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Download into a temporary data directory."""
+    monkeypatch.setattr(aoc_input, "DATA_DIR", tmp_path)
+    return tmp_path
+
+
+def fetch(site, days, **kwargs):
+    kwargs = {"rate": 0, "backoff": 0.01, **kwargs}
+    return download_days(days, session="test", url=site.url, **kwargs)
+
+
+def test_downloads_concurrently_over_pooled_client(site):
+    """Missing days are fetched in parallel, up to the connection limit."""
+    results = fetch(site, list(range(1, 9)), concurrency=4)
+
+    assert [r.status for r in results] == ["downloaded"] * 8
+    assert aoc_input.input_path(3).read_text() == "input for day 3\n"
+    assert 1 < site.max_active <= 4
+
+
+def test_existing_inputs_skipped_without_request(site):
+    fetch(site, [1])
+    results = fetch(site, [1, 2])
+
+    assert [r.status for r in results] == ["skipped", "downloaded"]
+    assert [day for day, _ in site.requests] == [1, 2]
+
+
+def test_no_session_needed_when_everything_is_downloaded(monkeypatch):
+    """Skipping every day doesn't ask for a session cookie."""
+    for day in (1, 2):
+        aoc_input.input_path(day).parent.mkdir(parents=True, exist_ok=True)
+        aoc_input.input_path(day).write_text("input\n")
+
+    def no_session():
+        raise ValueError("AOC_SESSION environment variable not set.")
+
+    monkeypatch.setattr(aoc_input, "get_session", no_session)
+    results = download_days([1, 2])
+    assert [r.status for r in results] == ["skipped", "skipped"]
+
+
+def test_refresh_uses_conditional_request(site):
+    """An unchanged input gets a 304 and its file is left alone."""
+    fetch(site, [5])
+    assert "etag" in meta_path(5).read_text()
+    mtime = aoc_input.input_path(5).stat().st_mtime_ns
+
+    (result,) = fetch(site, [5], refresh=True)
+    assert result.status == "unchanged"
+    assert aoc_input.input_path(5).stat().st_mtime_ns == mtime
+
+    site.inputs[5] = "a changed input\n"
+    (result,) = fetch(site, [5], refresh=True)
+    assert result.status == "downloaded"
+    assert aoc_input.input_path(5).read_text() == "a changed input\n"
+
+
+def test_transient_failures_are_retried(site):
+    site.failures = 2
+    (result,) = fetch(site, [1], retries=3)
+    assert (result.status, result.attempts) == ("downloaded", 3)
+
+
+def test_gives_up_after_retries(site):
+    site.failures = 10
+    (result,) = fetch(site, [1], retries=1)
+
+    assert (result.status, result.attempts, result.error) == ("failed", 2, "HTTP 503")
+    assert not aoc_input.input_path(1).exists()
+
+
+def test_permanent_failures_not_retried(site):
+    (result,) = download_days([1], session="wrong", url=site.url, rate=0)
+    assert (result.status, result.attempts) == ("failed", 1)
+    assert "differ by user" in result.error
+
+
+def test_rate_limiter_spaces_requests():
+    async def starts():
+        limiter = RateLimiter(rate=20)
+
+        async def request():
+            await limiter.wait()
+            return time.monotonic()
+
+        return sorted(await asyncio.gather(*(request() for _ in range(4))))
+
+    times = asyncio.run(starts())
+    assert min(b - a for a, b in zip(times, times[1:])) >= 0.045
+
+
+def test_rate_limit_applies_to_downloads(site):
+    start = time.monotonic()
+    fetch(site, [1, 2, 3], rate=10, concurrency=3)
+    assert time.monotonic() - start >= 0.2
+
+
+def test_released_days():
+    assert released_days(datetime(2025, 11, 30, tzinfo=timezone.utc)) == []
+    # Day 3 unlocks at 05:00 UTC on 3 December
+    assert released_days(datetime(2025, 12, 3, 4, 59, tzinfo=timezone.utc)) == [1, 2]
+    assert released_days(datetime(2025, 12, 3, 5, tzinfo=timezone.utc)) == [1, 2, 3]
+    assert released_days(datetime(2026, 1, 1, tzinfo=timezone.utc)) == list(
+        range(1, 13)
+    )
+
+
+def test_cli_download_all(site, monkeypatch):
+    monkeypatch.setenv("AOC_SESSION", "test")
+    monkeypatch.setenv("AOC_BASE_URL", site.url)
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["download", "--all", "--rate", "0"])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("downloaded") == 12
+
+    result = runner.invoke(main, ["download", "--all", "--rate", "0"])
+    assert result.output.count("already downloaded") == 12
@@ -0,0 +1,100 @@
+"""Tests for the flat bytearray grid."""
+
+import pytest
+
+from aoc2025.utils.flat_grid import FlatGrid
+from aoc2025.utils.pathfinding import distance_map
+from aoc2025.utils.grid import Grid
+
+TEXT = "..@#\n@@.#\n#.@.\n"
+
+
+@pytest.fixture
+def grids():
+    return FlatGrid.from_string(TEXT), Grid.from_string(TEXT)
+
+
+def test_layout(grids):
+    flat, _ = grids
+    assert (flat.width, flat.height, flat.stride) == (4, 3, 6)
+    assert len(flat.cells) == 6 * 5
+    assert str(flat) == TEXT.strip()
+
+
+def test_index_round_trip(grids):
+    flat, _ = grids
+    for y in range(flat.height):
+        for x in range(flat.width):
+            assert flat.coords(flat.index(x, y)) == (x, y)
+
+
+def test_matches_list_grid(grids):
+    """Index-based lookups agree with Grid's coordinate-based ones."""
+    flat, grid = grids
+    assert [flat.coords(i) for i in flat.find_all("@")] == grid.find_all("@")
+    assert flat.coords(flat.find("#")) == grid.find("#")
+    assert flat.find("x") is None
+    assert flat.get(-1, 0) is None and flat.get(1, 1) == grid.get(1, 1)
+    assert flat.row(2) == grid.row(2)
+
+    for i in flat.indices():
+        x, y = flat.coords(i)
+        assert {flat.coords(n) for n in flat.neighbors(i)} == set(grid.neighbors(x, y))
+        assert {flat.coords(n) for n in flat.neighbors_diagonal(i)} == set(
+            grid.neighbors_diagonal(x, y)
+        )
+
+
+def test_offsets_reach_border_not_other_rows():
+    """Stepping off an edge lands on the border, never on the next row."""
+    flat = FlatGrid.filled(3, 2, ".")
+    right_edge = flat.index(2, 0)
+    assert not flat.in_bounds(right_edge + 1)
+    assert all(flat.in_bounds(right_edge + d) for d in (-1, flat.stride))
+
+
+def test_flood_fill_stays_inside():
+    flat = FlatGrid.from_string("..#.\n..#.\n###.")
+    region = flat.flood_fill(flat.index(0, 0), ".")
+    assert sorted(flat.coords(i) for i in region) == [(0, 0), (0, 1), (1, 0), (1, 1)]
+    # Even with every character passable the border stops the fill
+    assert len(flat.flood_fill(flat.index(0, 0), ".#\0")) == 12
+
+
+def test_distance_map_matches_generic_distance_map():
+    text = "S..#....\n.#.#.##.\n.#...#..\n.####.#.\n......#T"
+    flat = FlatGrid.from_string(text)
+    sources = [flat.find("S"), flat.find("T")]
+    dist, nearest = flat.distance_map(sources, ".ST", labels=True)
+
+    def neighbors(i):
+        return [n for n in flat.neighbors(i) if flat.cells[n] != ord("#")]
+
+    expected, expected_nearest = distance_map(sources, neighbors, labels=True)
+    reached = {i: d for i, d in enumerate(dist) if d != -1}
+    assert reached == expected
+    assert {i: nearest[i] for i in reached} == expected_nearest
+    assert dist[flat.index(3, 0)] == -1 and nearest[flat.index(3, 0)] == -1
+
+    diagonal = flat.distance_map(sources[:1], ".ST", diagonal=True)
+    assert dist[flat.index(2, 1)] == 3
+    assert diagonal[flat.index(2, 1)] == 2
+
+
+def test_copy_is_independent(grids):
+    flat, _ = grids
+    copy = flat.copy()
+    copy.set(0, 0, "@")
+    assert flat.get(0, 0) == "." and copy.get(0, 0) == "@"
+
+
+def test_rejects_ragged_lines():
+    with pytest.raises(ValueError):
+        FlatGrid.from_string("abc\nde")
+
+
+def test_rejects_multibyte_characters():
+    with pytest.raises(ValueError):
+        FlatGrid.from_string("abc\naé\nabc")
+    with pytest.raises(ValueError):
+        FlatGrid.filled(3, 3, "é")
@@ -0,0 +1,48 @@
+"""Tests for the synthetic input generators."""
+
+import pytest
+
+from aoc2025.days import run_day
+from aoc2025.generators import available_generators, generate
+
+
+def test_every_day_has_a_generator():
+    """Each implemented day can be stress-tested."""
+    assert available_generators() == list(range(1, 13))
+
+
+@pytest.mark.parametrize("day", range(1, 13))
+def test_deterministic(day):
+    """The same seed always gives the same input; another seed doesn't."""
+    assert generate(day, seed=1) == generate(day, seed=1)
+    assert generate(day, seed=1) != generate(day, seed=2)
+
+
+@pytest.mark.parametrize("day", [1, 3, 5, 12])
+def test_scale_grows_input(day):
+    """Scale 10 gives roughly ten times as much input."""
+    ratio = len(generate(day, scale=10)) / len(generate(day))
+    assert 8 < ratio < 12
+
+
+# Days whose solvers are fast enough at official size to run in the suite
+@pytest.mark.parametrize("day", [1, 3, 5, 6, 7, 9, 11, 12])
+def test_solvable(day):
+    """Generated inputs parse and solve."""
+    text = generate(day)
+    assert run_day(day, 1, text) is not None
+    assert run_day(day, 2, text) is not None
+
+
+def test_day09_polygon_is_rectilinear():
+    """Consecutive corners share an x or a y, including the wrap-around."""
+    corners = [tuple(map(int, line.split(","))) for line in generate(9).split()]
+    for (x1, y1), (x2, y2) in zip(corners, corners[1:] + corners[:1]):
+        assert (x1 == x2) != (y1 == y2)
+
+
+def test_rejects_unknown_day_and_bad_scale():
+    with pytest.raises(ValueError):
+        generate(25)
+    with pytest.raises(ValueError):
+        generate(1, scale=0)
@@ -0,0 +1,98 @@
+"""Tests for the CSR graph."""
+
+import random
+
+from aoc2025.utils.graph import UNREACHED, Graph
+from aoc2025.utils.grid import Grid
+from aoc2025.utils.pathfinding import bfs, dijkstra
+
+
+def test_from_adjacency():
+    graph = Graph.from_adjacency("aaa: you hhh\nyou: bbb ccc\nbbb: out\n")
+    assert graph.labels == ["aaa", "you", "bbb", "hhh", "ccc", "out"]
+    assert list(graph.offsets) == [0, 2, 4, 5, 5, 5, 5]
+    names = [graph.labels[i] for i in graph.neighbors(graph.ids["you"])]
+    assert names == ["bbb", "ccc"]
+    assert graph.neighbors(graph.ids["out"]).tolist() == []
+    assert graph.weights is None
+
+
+def test_from_adjacency_merges_repeated_sources():
+    graph = Graph.from_adjacency("a: b\nc: a\na: c d\n")
+    assert graph.labels == ["a", "c", "b", "d"]
+    names = {
+        label: [graph.labels[i] for i in graph.neighbors(graph.ids[label])]
+        for label in graph.labels
+    }
+    assert names == {"a": ["b", "c", "d"], "c": ["a"], "b": [], "d": []}
+
+
+def test_from_edges_keeps_edge_order_and_weights():
+    graph = Graph.from_edges([("b", "a", 5), ("a", "c", 2), ("b", "c", 1)])
+    b = graph.ids["b"]
+    assert [(graph.labels[t], w) for t, w in graph.edges(b)] == [("a", 5), ("c", 1)]
+    assert graph.edge_count == 3
+
+    undirected = Graph.from_edges([(1, 2), (2, 3)], nodes=[9], undirected=True)
+    assert undirected.labels == [9, 1, 2, 3]
+    assert sorted(undirected.neighbors(undirected.ids[2])) == [1, 3]
+    assert undirected.neighbors(0).tolist() == []
+
+
+def test_reverse():
+    graph = Graph.from_edges([("a", "b", 3), ("a", "c", 4), ("c", "b", 1)])
+    reverse = graph.reverse()
+    b = reverse.ids["b"]
+    assert sorted((reverse.labels[t], w) for t, w in reverse.edges(b)) == [
+        ("a", 3),
+        ("c", 1),
+    ]
+
+
+def test_from_grid_and_shortest_path():
+    grid = Grid.from_string("..#\n.##\n...")
+    graph = Graph.from_grid(grid, lambda c: c != "#")
+    assert len(graph) == 6
+    path, cost = graph.shortest_path((1, 0), (2, 2))
+    assert path == [(1, 0), (0, 0), (0, 1), (0, 2), (1, 2), (2, 2)]
+    assert cost == 5
+
+    diagonal = Graph.from_grid(grid, lambda c: c != "#", diagonal=True)
+    assert diagonal.shortest_path((1, 0), (2, 2))[1] == 3
+
+    walled = Graph.from_grid(Grid.from_string(".#."), lambda c: c != "#")
+    assert walled.shortest_path((0, 0), (2, 0)) is None
+
+
+def test_bfs_and_dijkstra_match_pathfinding():
+    rng = random.Random(6)
+    for _ in range(50):
+        edges = [
+            (rng.randrange(30), rng.randrange(30), rng.randint(1, 9))
+            for _ in range(80)
+        ]
+        graph = Graph.from_edges(edges, nodes=range(30))
+        start = graph.ids[0]
+        dist, parent = graph.dijkstra(start)
+        unweighted, _ = Graph.from_edges([e[:2] for e in edges], range(30)).bfs(start)
+
+        adjacency = {n: [] for n in range(30)}
+        for a, b, w in edges:
+            adjacency[a].append((b, w))
+
+        for node in range(30):
+            target = graph.ids[node]
+            expected = dijkstra(
+                0, adjacency.__getitem__, lambda n: n == node, returns="cost"
+            )
+            assert dist[target] == (UNREACHED if expected is None else expected)
+            steps = bfs(
+                0,
+                lambda n: [b for b, _ in adjacency[n]],
+                lambda n: n == node,
+                returns="cost",
+            )
+            assert unweighted[target] == (UNREACHED if steps is None else steps)
+            if expected is not None:
+                path = graph.path(parent, target)
+                assert path[0] == start and path[-1] == target
@@ -0,0 +1,48 @@
+"""Tests for streaming and memory-mapped input access."""
+
+import pytest
+
+from aoc2025 import input as aoc_input
+from aoc2025.utils.parsing import iter_groups, parse_groups
+
+TEXT = "1-3\n5-8\n\n2\n7\n\n\n9\n"
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the input helpers at a temporary data directory."""
+    monkeypatch.setattr(aoc_input, "DATA_DIR", tmp_path)
+    (tmp_path / "inputs").mkdir()
+    (tmp_path / "inputs" / "05.txt").write_text(TEXT)
+    return tmp_path
+
+
+def test_mmap_matches_file(data_dir):
+    """The mapped bytes are the file's contents."""
+    with aoc_input.get_input_mmap(5) as mapped:
+        assert mapped[:] == TEXT.encode()
+        assert mapped.find(b"5-8") == 4
+
+
+def test_lines_are_lazy_and_stripped(data_dir):
+    """Lines come without their endings, one at a time."""
+    lines = aoc_input.get_input_lines(5)
+    assert next(lines) == "1-3"
+    assert list(lines) == ["5-8", "", "2", "7", "", "", "9"]
+
+
+def test_groups_match_parse_groups(data_dir):
+    """Streaming groups agree with parse_groups, skipping empty groups."""
+    groups = ["\n".join(g) for g in aoc_input.get_input_groups(5)]
+    assert groups == parse_groups(TEXT)
+
+
+def test_iter_groups_handles_missing_trailing_blank():
+    assert list(iter_groups(["a", "b", "", "c"])) == [["a", "b"], ["c"]]
+    assert list(iter_groups([])) == []
+
+
+def test_example_flag_reads_examples(data_dir):
+    (data_dir / "examples").mkdir()
+    (data_dir / "examples" / "05.txt").write_text("x\ny\n")
+    assert list(aoc_input.get_input_lines(5, example=True)) == ["x", "y"]
@@ -0,0 +1,51 @@
+"""Tests for running parts in budgeted subprocesses."""
+
+import multiprocessing
+import time
+
+import pytest
+
+from aoc2025 import isolation
+from aoc2025.isolation import parse_memory_size, run_isolated
+
+# Patched solvers only reach the worker when it is forked from this process
+needs_fork = pytest.mark.skipif(
+    multiprocessing.get_start_method() != "fork", reason="needs fork start method"
+)
+
+
+def test_parse_memory_size():
+    """Sizes accept K/M/G suffixes."""
+    assert parse_memory_size("1024") == 1024
+    assert parse_memory_size("2K") == 2048
+    assert parse_memory_size("512M") == 512 * 1024**2
+    assert parse_memory_size("1.5gb") == int(1.5 * 1024**3)
+
+
+def test_runs_within_budget(load_example):
+    """A well-behaved part returns its result."""
+    outcome = run_isolated(5, 1, load_example(5), timeout=10)
+    assert (outcome.status, outcome.result) == ("ok", 3)
+
+
+@needs_fork
+def test_timeout_reports_progress(monkeypatch):
+    """A runaway part is killed and its last heartbeat is reported."""
+    monkeypatch.setattr(isolation, "HEARTBEAT_INTERVAL", 0.05)
+    monkeypatch.setattr(isolation, "run_day", lambda *args: time.sleep(60))
+
+    start = time.monotonic()
+    outcome = run_isolated(5, 1, "", timeout=0.5)
+    assert time.monotonic() - start < 5
+    assert outcome.status == "timeout"
+    assert outcome.elapsed_ms > 0
+
+
+@needs_fork
+@pytest.mark.skipif(isolation.resource is None, reason="needs resource module")
+def test_memory_limit(monkeypatch):
+    """Allocating past the memory limit is reported as a memory breach."""
+    monkeypatch.setattr(isolation, "run_day", lambda *args: bytearray(2 * 1024**3))
+
+    outcome = run_isolated(5, 1, "", timeout=10, max_memory=512 * 1024**2)
+    assert outcome.status == "memory"
@@ -0,0 +1,50 @@
+"""Tests for running days across a process pool."""
+
+import os
+
+import pytest
+
+from aoc2025 import parallel
+
+
+@pytest.fixture
+def timings_path(tmp_path, monkeypatch):
+    """Point the timings file at a temporary location."""
+    path = tmp_path / "timings.json"
+    monkeypatch.setattr(parallel, "TIMINGS_PATH", path)
+    return path
+
+
+def test_schedule_longest_first(timings_path):
+    """Known slow tasks go first, but unknown tasks go before them."""
+    timings_path.write_text('{"01-1": 1.0, "02-1": 50.0, "03-1": 5.0}')
+    order = parallel.schedule([(1, 1), (2, 1), (3, 1), (4, 1)])
+    assert order == [(4, 1), (2, 1), (3, 1), (1, 1)]
+
+
+def test_solve_all(timings_path, load_example):
+    """Every day/part is solved and timings are recorded for the next run."""
+    inputs = {4: load_example(4), 5: load_example(5)}
+    tasks = [(day, part) for day in inputs for part in (1, 2)]
+    results = list(parallel.solve_all(inputs, tasks, jobs=2))
+
+    answers = {(r.day, r.part): r.result for r in results}
+    assert answers == {(4, 1): 13, (4, 2): 43, (5, 1): 3, (5, 2): 14}
+
+    parallel.save_timings(results)
+    assert set(parallel.load_timings()) == {"04-1", "04-2", "05-1", "05-2"}
+
+
+def _die(*args):
+    """Stand-in worker task that kills its process."""
+    os._exit(1)
+
+
+def test_solve_all_worker_dies(timings_path, monkeypatch):
+    """A dead worker is reported as each task's failure instead of raised."""
+    monkeypatch.setattr(parallel, "_solve_task", _die)
+    results = list(parallel.solve_all({1: "", 2: ""}, [(1, 1), (2, 1)], jobs=1))
+
+    assert sorted((r.day, r.part) for r in results) == [(1, 1), (2, 1)]
+    assert all(r.result is None for r in results)
+    assert all(r.error.startswith("BrokenProcessPool") for r in results)
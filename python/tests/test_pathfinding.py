@@ -0,0 +1,659 @@
+"""Tests for the pathfinding utilities."""
+
+import random
+
+import pytest
+
+from aoc2025.utils.grid import Grid
+from aoc2025.utils.pathfinding import (
+    QUEUES,
+    BucketQueue,
+    SearchStats,
+    IndexedHeap,
+    astar,
+    beam_search,
+    bfs,
+    bidirectional_astar,
+    bidirectional_bfs,
+    dijkstra,
+    distance_map,
+    flood_fill,
+    ida_star,
+    iter_astar,
+    iter_bfs,
+    iter_dijkstra,
+    jump_point_search,
+    reconstruct_path,
+    weighted_distance_map,
+)
+
+MAZE = """\
+S.#.....
+.##.###.
+....#...
+.####.#.
+......#E"""
+
+
+@pytest.fixture
+def maze():
+    grid = Grid.from_string(MAZE)
+    start, end = grid.find("S"), grid.find("E")
+
+    def neighbors(pos):
+        return [n for n in grid.neighbors(*pos) if grid.get(*n) != "#"]
+
+    def weighted(pos):
+        return [(n, 1) for n in neighbors(pos)]
+
+    def heuristic(pos):
+        return abs(pos[0] - end[0]) + abs(pos[1] - end[1])
+
+    return start, end, neighbors, weighted, heuristic
+
+
+def _is_walk(path, neighbors):
+    return all(b in neighbors(a) for a, b in zip(path, path[1:]))
+
+
+def test_bfs_path(maze):
+    start, end, neighbors, _, _ = maze
+    path = bfs(start, neighbors, lambda p: p == end)
+    assert path[0] == start and path[-1] == end
+    assert len(path) == 16
+    assert _is_walk(path, neighbors)
+
+
+def test_bfs_cost_and_parents(maze):
+    start, end, neighbors, _, _ = maze
+    assert bfs(start, neighbors, lambda p: p == end, returns="cost") == 15
+
+    parents, found = bfs(start, neighbors, lambda p: p == end, returns="parents")
+    assert found == end
+    assert parents[start] is None
+    assert reconstruct_path(parents, end) == bfs(start, neighbors, lambda p: p == end)
+
+
+def test_searches_at_goal_and_unreachable(maze):
+    start, _, neighbors, weighted, heuristic = maze
+    assert bfs(start, neighbors, lambda p: p == start) == [start]
+    assert dijkstra(start, weighted, lambda p: p == start) == ([start], 0)
+    assert dijkstra(start, weighted, lambda p: p == start, returns="cost") == 0
+
+    wall = (2, 0)
+    assert bfs(start, neighbors, lambda p: p == wall) is None
+    assert dijkstra(start, weighted, lambda p: p == wall) is None
+    assert astar(start, weighted, heuristic, lambda p: p == wall) is None
+
+
+def test_dijkstra_prefers_cheaper_longer_route():
+    # a -> b -> d costs 10 directly, a -> c -> e -> d costs 3
+    edges = {
+        "a": [("b", 1), ("c", 1)],
+        "b": [("d", 9)],
+        "c": [("e", 1)],
+        "e": [("d", 1)],
+        "d": [],
+    }
+    assert dijkstra("a", edges.__getitem__, lambda n: n == "d") == (
+        ["a", "c", "e", "d"],
+        3,
+    )
+    parents, end, cost = dijkstra(
+        "a", edges.__getitem__, lambda n: n == "d", returns="parents"
+    )
+    assert (end, cost) == ("d", 3)
+    assert reconstruct_path(parents, "d") == ["a", "c", "e", "d"]
+
+
+def test_astar_matches_dijkstra(maze):
+    start, end, neighbors, weighted, heuristic = maze
+    path, cost = astar(start, weighted, heuristic, lambda p: p == end)
+    assert cost == dijkstra(start, weighted, lambda p: p == end, returns="cost")
+    assert cost == len(path) - 1
+    assert _is_walk(path, neighbors)
+
+
+def test_unknown_returns_mode(maze):
+    start, end, neighbors, _, _ = maze
+    with pytest.raises(ValueError, match="returns"):
+        bfs(start, neighbors, lambda p: p == end, returns="nodes")
+
+
+def test_long_path_is_rebuilt_once():
+    # A 20k step corridor: copying the path per push would be quadratic
+    n = 20_000
+    path = bfs(0, lambda i: [i + 1] if i < n else [], lambda i: i == n)
+    assert path == list(range(n + 1))
+
+
+def test_flood_fill(maze):
+    start, _, neighbors, _, _ = maze
+    reached = flood_fill(start, neighbors)
+    assert start in reached
+    assert (7, 4) in reached
+    assert (2, 0) not in reached
+
+
+@pytest.mark.parametrize("queue", list(QUEUES))
+def test_queue_backends_pop_in_priority_order(queue):
+    rng = random.Random(11)
+    frontier = QUEUES[queue]()
+    pushed, popped = [], []
+    for item in range(500):
+        if pushed and rng.random() < 0.4:
+            popped.append(frontier.pop())
+        # Never below the last popped priority, as in Dijkstra
+        low = popped[-1][0] if popped else 0
+        priority = low + rng.randint(0, 9)
+        frontier.push(item, priority)
+        pushed.append((priority, item))
+    while frontier:
+        popped.append(frontier.pop())
+
+    priorities = [priority for priority, _ in popped]
+    assert priorities == sorted(priorities)
+    assert sorted(popped) == sorted(pushed)
+
+
+def test_indexed_heap_decrease_key():
+    heap = IndexedHeap()
+    heap.push("a", 5)
+    heap.push("b", 3)
+    heap.push("a", 1)
+    heap.push("b", 7)  # Not lower, ignored
+    assert len(heap) == 2
+    assert heap.pop() == (1, "a")
+    assert heap.pop() == (3, "b")
+    assert not heap
+
+
+def test_bucket_queue_rejects_lower_priority():
+    buckets = BucketQueue()
+    buckets.push("a", 4)
+    assert buckets.pop() == (4, "a")
+    with pytest.raises(ValueError):
+        buckets.push("b", 3)
+    with pytest.raises(IndexError):
+        buckets.pop()
+
+
+@pytest.mark.parametrize("queue", list(QUEUES))
+def test_weighted_searches_agree_across_queues(queue):
+    rng = random.Random(2)
+    size = 30
+    weights = [[rng.randint(1, 9) for _ in range(size)] for _ in range(size)]
+    end = (size - 1, size - 1)
+
+    def neighbors(pos):
+        x, y = pos
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if 0 <= nx < size and 0 <= ny < size:
+                yield (nx, ny), weights[ny][nx]
+
+    def heuristic(pos):
+        return (size - 1 - pos[0]) + (size - 1 - pos[1])
+
+    def at_end(pos):
+        return pos == end
+
+    expected = dijkstra((0, 0), neighbors, at_end, returns="cost")
+    path, cost = dijkstra((0, 0), neighbors, at_end, queue=queue)
+    assert cost == expected
+    assert cost == sum(weights[y][x] for x, y in path[1:])
+    assert astar((0, 0), neighbors, heuristic, at_end, queue=queue)[1] == expected
+
+
+def test_unknown_queue():
+    with pytest.raises(ValueError, match="queue"):
+        dijkstra(0, lambda n: [], lambda n: False, queue="fibonacci")
+
+
+def _random_digraph(rng, nodes, edges, max_weight):
+    graph = {n: [] for n in range(nodes)}
+    reverse = {n: [] for n in range(nodes)}
+    for _ in range(edges):
+        a, b, w = rng.randrange(nodes), rng.randrange(nodes), rng.randint(1, max_weight)
+        graph[a].append((b, w))
+        reverse[b].append((a, w))
+    return graph, reverse
+
+
+def test_bidirectional_bfs_matches_bfs_on_directed_graphs():
+    rng = random.Random(8)
+    for _ in range(200):
+        graph, reverse = _random_digraph(rng, 40, 70, 1)
+
+        def forward(n):
+            return [m for m, _ in graph[n]]
+
+        def backward(n):
+            return [m for m, _ in reverse[n]]
+
+        start, target = rng.randrange(40), rng.randrange(40)
+        expected = bfs(start, forward, lambda n: n == target, returns="cost")
+        path = bidirectional_bfs(start, target, forward, backward)
+        if expected is None:
+            assert path is None
+            continue
+        assert len(path) - 1 == expected
+        assert path[0] == start and path[-1] == target
+        assert _is_walk(path, forward)
+        assert (
+            bidirectional_bfs(start, target, forward, backward, returns="cost")
+            == expected
+        )
+
+
+def test_bidirectional_astar_matches_dijkstra_on_directed_graphs():
+    rng = random.Random(9)
+    for _ in range(200):
+        graph, reverse = _random_digraph(rng, 40, 90, 9)
+        start, target = rng.randrange(40), rng.randrange(40)
+        expected = dijkstra(
+            start, graph.__getitem__, lambda n: n == target, returns="cost"
+        )
+        result = bidirectional_astar(
+            start, target, graph.__getitem__, lambda a, b: 0, reverse.__getitem__
+        )
+        if expected is None:
+            assert result is None
+            continue
+        path, cost = result
+        assert cost == expected
+        assert path[0] == start and path[-1] == target
+        cheapest = {}
+        for a in graph:
+            for b, w in graph[a]:
+                cheapest[a, b] = min(w, cheapest.get((a, b), w))
+        assert cost == sum(cheapest[pair] for pair in zip(path, path[1:]))
+
+
+def test_bidirectional_searches_explore_less_on_open_grid():
+    # Away from the edges, each side covers a diamond of half the radius
+    size = 201
+    start, target = (50, 100), (150, 100)
+    expanded = []
+
+    def neighbors(pos):
+        expanded.append(pos)
+        x, y = pos
+        return [
+            (nx, ny)
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))
+            if 0 <= nx < size and 0 <= ny < size
+        ]
+
+    assert len(bfs(start, neighbors, lambda p: p == target)) == 101
+    one_sided = len(expanded)
+    expanded.clear()
+    assert len(bidirectional_bfs(start, target, neighbors)) == 101
+    assert len(expanded) < one_sided * 0.6
+
+    def manhattan(a, b):
+        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+    def weighted(pos):
+        return [(n, 1) for n in neighbors(pos)]
+
+    path, cost = bidirectional_astar(start, target, weighted, manhattan)
+    assert cost == 100 == len(path) - 1
+
+
+def test_bidirectional_at_target_and_unknown_returns():
+    assert bidirectional_bfs(3, 3, lambda n: []) == [3]
+    assert bidirectional_astar(3, 3, lambda n: [], lambda a, b: 0) == ([3], 0)
+    with pytest.raises(ValueError, match="returns"):
+        bidirectional_bfs(1, 2, lambda n: [], returns="parents")
+
+
+def test_bidirectional_astar_with_heuristic_on_weighted_grids():
+    rng = random.Random(4)
+    size = 25
+    for _ in range(20):
+        weights = [[rng.randint(1, 9) for _ in range(size)] for _ in range(size)]
+
+        def into(pos):
+            x, y = pos
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < size and 0 <= ny < size:
+                    yield (nx, ny), weights[ny][nx]
+
+        def out_of(pos):
+            # Entering a cell costs its weight, so edges into pos cost its weight
+            x, y = pos
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < size and 0 <= ny < size:
+                    yield (nx, ny), weights[y][x]
+
+        def manhattan(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+        start = (rng.randrange(size), rng.randrange(size))
+        target = (rng.randrange(size), rng.randrange(size))
+        expected = dijkstra(start, into, lambda p: p == target, returns="cost")
+        path, cost = bidirectional_astar(start, target, into, manhattan, out_of)
+        assert cost == expected
+        assert cost == sum(weights[y][x] for x, y in path[1:])
+
+
+def test_distance_map_matches_bfs_per_node(maze):
+    start, end, neighbors, _, _ = maze
+    dist = distance_map([start], neighbors)
+    assert dist[end] == 15
+    for node, steps in dist.items():
+        assert bfs(start, neighbors, lambda p: p == node, returns="cost") == steps
+    assert (2, 0) not in dist
+
+
+def test_distance_map_labels_nearest_source(maze):
+    start, end, neighbors, weighted, _ = maze
+    sources = [start, end]
+    dist, nearest = distance_map(sources, neighbors, labels=True)
+    wdist, wnearest = weighted_distance_map(sources, weighted, labels=True)
+    assert wdist == dist
+
+    for node, steps in dist.items():
+        to_source = {
+            s: bfs(s, neighbors, lambda p: p == node, returns="cost") for s in sources
+        }
+        assert steps == min(to_source.values())
+        assert to_source[nearest[node]] == steps
+        assert to_source[wnearest[node]] == steps
+
+
+def test_weighted_distance_map_matches_dijkstra():
+    rng = random.Random(12)
+    edges = {n: [] for n in range(40)}
+    for _ in range(120):
+        a, b = rng.randrange(40), rng.randrange(40)
+        edges[a].append((b, rng.randint(1, 9)))
+    sources = [0, 17]
+    dist = weighted_distance_map(sources, edges.__getitem__)
+
+    for node in range(40):
+        costs = [
+            dijkstra(s, edges.__getitem__, lambda n: n == node, returns="cost")
+            for s in sources
+        ]
+        costs = [c for c in costs if c is not None]
+        assert dist.get(node) == (min(costs) if costs else None)
+
+
+def test_iter_bfs_yields_in_distance_order(maze):
+    start, end, neighbors, _, _ = maze
+    visited = list(iter_bfs(start, neighbors))
+    assert visited[0] == (start, 0)
+    assert dict(visited) == distance_map([start], neighbors)
+    costs = [cost for _, cost in visited]
+    assert costs == sorted(costs)
+    assert {node for node, _ in visited} == flood_fill(start, neighbors) | {start}
+
+
+def test_iter_dijkstra_k_nearest_goals_stops_early():
+    # Every integer is a node; the goals are the multiples of 7
+    expanded = []
+
+    def neighbors(n):
+        expanded.append(n)
+        return [(n + 1, 1), (n - 1, 1), (n * 2, 3)]
+
+    search = iter_dijkstra(10, neighbors)
+    goals = []
+    for node, cost in search:
+        if node % 7 == 0:
+            goals.append((node, cost))
+            if len(goals) == 3:
+                break
+    # 7 = 10 - 3, 14 = 10 + 4 and 21 = 10 * 2 + 1
+    assert sorted(goals) == [(7, 3), (14, 4), (21, 4)]
+    assert len(expanded) < 30
+    assert search.path(21) == [10, 20, 21]
+    assert all(cost >= 4 for cost in search.frontier.values())
+
+
+def test_search_cost_bound_and_resume(maze):
+    start, _, neighbors, weighted, _ = maze
+    search = iter_dijkstra(start, weighted, max_cost=3)
+    first = list(search)
+    expected = distance_map([start], neighbors)
+    assert sorted(cost for _, cost in first) == sorted(
+        cost for cost in expected.values() if cost <= 3
+    )
+    assert not search.done
+    assert set(search.frontier.values()) == {4}
+
+    search.max_cost = None
+    rest = list(search)
+    assert search.done
+    assert dict(first + rest) == expected
+
+
+def test_interleaved_searches_and_astar(maze):
+    start, end, neighbors, weighted, heuristic = maze
+    forward, backward = iter_bfs(start, neighbors), iter_bfs(end, neighbors)
+    meet = None
+    while meet is None:
+        for search, other in ((forward, backward), (backward, forward)):
+            node, _ = next(search)
+            if node in other.settled:
+                meet = node
+                break
+    assert meet in forward.settled and meet in backward.settled
+
+    for node, cost in iter_astar(start, weighted, heuristic):
+        if node == end:
+            assert cost == 15
+            break
+    else:
+        pytest.fail("A* never reached the end")
+
+
+def _grid_neighbors(grid, diagonal):
+    """Weighted neighbours of a grid with "#" walls, without corner cutting."""
+
+    def is_open(x, y):
+        return grid.get(x, y) not in (None, "#")
+
+    def neighbors(pos):
+        x, y = pos
+        moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+        if diagonal:
+            moves += [
+                (dx, dy)
+                for dx in (1, -1)
+                for dy in (1, -1)
+                if is_open(x + dx, y) and is_open(x, y + dy)
+            ]
+        return [((x + dx, y + dy), 1) for dx, dy in moves if is_open(x + dx, y + dy)]
+
+    return neighbors
+
+
+def test_jump_point_search_on_maze(maze):
+    start, end, neighbors, _, _ = maze
+    grid = Grid.from_string(MAZE)
+    path, cost = jump_point_search(grid, start, end, lambda c: c == "#")
+    assert cost == 15 and len(path) == 16
+    assert _is_walk(path, neighbors)
+    assert jump_point_search(grid, start, (2, 0), lambda c: c == "#") is None
+
+
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_jump_point_search_matches_astar(diagonal):
+    rng = random.Random(13)
+    for _ in range(300):
+        width, height = rng.randint(1, 12), rng.randint(1, 12)
+        density = rng.choice([0, 0.15, 0.3])
+        grid = Grid(
+            [
+                ["#" if rng.random() < density else "." for _ in range(width)]
+                for _ in range(height)
+            ]
+        )
+        start = (rng.randrange(width), rng.randrange(height))
+        end = (rng.randrange(width), rng.randrange(height))
+        grid.set(*start, ".")
+        grid.set(*end, ".")
+        neighbors = _grid_neighbors(grid, diagonal)
+
+        expected = dijkstra(start, neighbors, lambda p: p == end, returns="cost")
+        result = jump_point_search(grid, start, end, lambda c: c == "#", diagonal)
+        if expected is None:
+            assert result is None
+            continue
+        path, cost = result
+        assert cost == expected == len(path) - 1
+        assert path[0] == start and path[-1] == end
+        assert all((b, 1) in neighbors(a) for a, b in zip(path, path[1:]))
+
+
+def test_jump_point_search_expands_less_in_open_field():
+    grid = Grid.filled(60, 60, ".")
+    end = (59, 40)
+    stats = SearchStats()
+    cost = jump_point_search(
+        grid, (0, 0), end, lambda c: c == "#", returns="cost", stats=stats
+    )
+    expanded = []
+
+    def neighbors(pos):
+        expanded.append(pos)
+        return _grid_neighbors(grid, False)(pos)
+
+    assert cost == astar(
+        (0, 0), neighbors, lambda p: 0, lambda p: p == end, returns="cost"
+    )
+    assert stats.expanded * 10 < len(expanded)
+
+
+def test_jump_point_search_prunes_scattered_walls():
+    """Straight jumps only turn at forced neighbours, even 8-connected."""
+    rng = random.Random(0)
+    grid = Grid(
+        [["#" if rng.random() < 0.05 else "." for _ in range(101)] for _ in range(101)]
+    )
+    start, end = (0, 0), (100, 100)
+    grid.set(*start, ".")
+    grid.set(*end, ".")
+    stats = SearchStats()
+    cost = jump_point_search(grid, start, end, lambda c: c == "#", True, "cost", stats)
+    expanded = []
+
+    def neighbors(pos):
+        expanded.append(pos)
+        return _grid_neighbors(grid, True)(pos)
+
+    def heuristic(pos):
+        return max(end[0] - pos[0], end[1] - pos[1])
+
+    assert cost == astar(start, neighbors, heuristic, lambda p: p == end, "cost")
+    assert stats.expanded * 5 < len(expanded) * 2
+
+
+def test_jump_point_search_non_character_cells():
+    grid = Grid([[0, 0, 0], [1, 1, 0], [0, 0, 0]])
+    path, cost = jump_point_search(grid, (0, 0), (0, 2), lambda v: v == 1)
+    assert cost == 6 == len(path) - 1
+
+
+@pytest.mark.parametrize("table_size", [100_000, 4, 1])
+def test_ida_star_matches_dijkstra(table_size):
+    # Small graphs: with a tiny table and no heuristic the search is exponential
+    rng = random.Random(14)
+    for _ in range(150):
+        graph = {n: [] for n in range(12)}
+        for _ in range(25):
+            graph[rng.randrange(12)].append((rng.randrange(12), rng.randint(0, 9)))
+        start, target = rng.randrange(12), rng.randrange(12)
+
+        expected = dijkstra(
+            start, graph.__getitem__, lambda n: n == target, returns="cost"
+        )
+        result = ida_star(
+            start,
+            graph.__getitem__,
+            lambda n: 0,
+            lambda n: n == target,
+            table_size=table_size,
+        )
+        if expected is None:
+            assert result is None
+            continue
+        path, cost = result
+        assert cost == expected
+        assert path[0] == start and path[-1] == target
+
+
+def test_ida_star_memory_stays_bounded(maze):
+    start, end, _, weighted, heuristic = maze
+    stats = SearchStats()
+    cost = ida_star(
+        start,
+        weighted,
+        heuristic,
+        lambda p: p == end,
+        table_size=5,
+        returns="cost",
+        stats=stats,
+    )
+    assert cost == 15
+    assert stats.expanded > 0
+    # The current path (at most 16 nodes) plus the table
+    assert stats.peak_node_count <= 16 + 5
+
+
+def test_beam_search(maze):
+    start, end, _, weighted, heuristic = maze
+    stats = SearchStats()
+    path, cost = beam_search(
+        start, weighted, heuristic, lambda p: p == end, width=4, stats=stats
+    )
+    assert cost == 15 == len(path) - 1
+    assert path[0] == start and path[-1] == end
+    # The beam, its children and every node kept in the 15 layers
+    assert stats.peak_node_count <= 4 + 4 * 4 + 4 * 16
+
+    # A small table bounds memory however deep the search goes
+    stats = SearchStats()
+    path, cost = beam_search(
+        start, weighted, heuristic, lambda p: p == end, 4, table_size=8, stats=stats
+    )
+    assert cost == 15 == len(path) - 1
+    assert stats.peak_node_count <= 4 + 4 * 4 + 8
+    cost = beam_search(
+        start, weighted, heuristic, lambda p: p == end, 4, returns="cost"
+    )
+    assert cost == 15
+
+    # A width of 1 is greedy: it may dead-end, but never loops past max_depth
+    greedy = beam_search(
+        start, weighted, heuristic, lambda p: p == end, width=1, max_depth=50
+    )
+    assert greedy is None or greedy[1] >= 15
+    assert (
+        beam_search(start, weighted, heuristic, lambda p: False, 3, max_depth=10)
+        is None
+    )
+
+
+def test_beam_search_unreachable_goal_on_cycle():
+    """With no max_depth, the search still ends once nothing new is found."""
+    stats = SearchStats()
+    result = beam_search(
+        0, lambda n: [((n + 1) % 3, 1)], lambda n: 0, lambda n: n == 99, 2, stats=stats
+    )
+    assert result is None
+    assert stats.expanded == 3
+
+    # A table too small for the cycle forgets it, so only max_depth stops it
+    result = beam_search(
+        0,
+        lambda n: [((n + 1) % 3, 1)],
+        lambda n: 0,
+        lambda n: n == 99,
+        2,
+        max_depth=20,
+        table_size=2,
+    )
+    assert result is None
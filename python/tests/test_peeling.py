@@ -0,0 +1,69 @@
+"""Tests for k-core peeling."""
+
+import random
+
+from aoc2025.utils.flat_grid import FlatGrid
+from aoc2025.utils.peeling import peel, peel_cells
+
+
+def _peel_by_rounds(nodes, neighbors, k):
+    """Reference: remove every node below the threshold, round after round."""
+    present = set(nodes)
+    while True:
+        below = {n for n in present if sum(m in present for m in neighbors(n)) < k}
+        if not below:
+            return present
+        present -= below
+
+
+def test_peel_graph_leaves_k_core():
+    # A triangle with a tail: the tail peels away, the triangle is a 2-core
+    edges = {1: [2, 3], 2: [1, 3], 3: [1, 2, 4], 4: [3, 5], 5: [4]}
+    removed = peel(edges, edges.__getitem__, 2)
+    assert removed == [5, 4]
+
+
+def test_peel_ignores_missing_neighbors():
+    edges = {"a": ["b", "x"], "b": ["a", "y"]}
+    assert sorted(peel(edges, edges.__getitem__, 2)) == ["a", "b"]
+    assert peel(edges, edges.__getitem__, 1) == []
+
+
+def test_peel_cells_matches_rounds_on_random_grids():
+    rng = random.Random(5)
+    for _ in range(20):
+        text = "\n".join(
+            "".join(rng.choice("@@.") for _ in range(15)) for _ in range(12)
+        )
+        grid = FlatGrid.from_string(text)
+        rolls = set(grid.find_all("@"))
+        alive = bytearray(len(grid.cells))
+        for i in rolls:
+            alive[i] = 1
+
+        for k, offsets in ((4, grid.n8), (2, grid.n4)):
+            removed = peel_cells(alive, offsets, k)
+            assert len(removed) == len(set(removed))
+            core = _peel_by_rounds(
+                rolls, lambda i: [i + d for d in offsets if i + d in rolls], k
+            )
+            assert set(removed) == rolls - core
+
+
+def test_peel_cells_does_not_modify_input():
+    grid = FlatGrid.from_string(".@.\n@@@\n.@.")
+    alive = bytearray(c == ord("@") for c in grid.cells)
+    before = bytes(alive)
+    assert len(peel_cells(alive, grid.n8, 4)) == 5
+    assert bytes(alive) == before
+
+
+def test_peel_cells_with_precomputed_counts():
+    grid = FlatGrid.from_string("@@@@\n@@@@\n@..@")
+    alive = bytearray(c == ord("@") for c in grid.cells)
+    counts = bytearray(len(alive))
+    for i in grid.find_all("@"):
+        counts[i] = sum(alive[i + d] for d in grid.n8)
+    assert sorted(peel_cells(alive, grid.n8, 3, counts)) == sorted(
+        peel_cells(alive, grid.n8, 3)
+    )
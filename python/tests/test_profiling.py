@@ -0,0 +1,48 @@
+"""Tests for the profiling helpers."""
+
+import json
+import pstats
+import signal
+
+import pytest
+
+from aoc2025.profiling import SamplingProfiler, run_cprofile, run_memory
+
+
+def busy_loop() -> int:
+    """Burn enough CPU time to be sampled."""
+    total = 0
+    for i in range(300_000):
+        total += i % 7
+    return total
+
+
+def test_cprofile_dump(tmp_path):
+    """The pstats dump is written and loadable."""
+    path = tmp_path / "out.pstats"
+    result, summary = run_cprofile(busy_loop, path)
+    assert result == busy_loop()
+    assert "busy_loop" in summary
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+@pytest.mark.skipif(not hasattr(signal, "setitimer"), reason="needs setitimer")
+def test_sampling_profile(tmp_path):
+    """Samples are attributed to the profiled function and exported."""
+    profiler = SamplingProfiler(interval=0.0005)
+    assert profiler.run(busy_loop) == busy_loop()
+    assert sum(profiler.samples.values()) > 0
+    assert all(stack[0][0] == "busy_loop" for stack in profiler.samples)
+
+    profiler.save(tmp_path / "c.txt", tmp_path / "s.json", "busy")
+    assert (tmp_path / "c.txt").read_text().startswith("busy_loop (")
+    speedscope = json.loads((tmp_path / "s.json").read_text())
+    assert speedscope["profiles"][0]["type"] == "sampled"
+
+
+def test_memory_profile(load_example):
+    """Peak memory and allocation sites are reported."""
+    result, peak, sites = run_memory(8, 1, load_example(8))
+    assert result == 40
+    assert peak > 0
+    assert sites
@@ -0,0 +1,75 @@
+"""Tests for the on-disk result cache."""
+
+import os
+import threading
+
+import pytest
+
+from aoc2025 import result_cache
+from aoc2025.result_cache import ResultCache, cache_key
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A result cache in a temporary directory."""
+    return ResultCache(tmp_path, max_entries=2)
+
+
+def test_hit_and_miss(cache):
+    """Results are returned on a hit and counted."""
+    assert cache.get(1, 1, "input") is None
+    cache.put(1, 1, "input", 42)
+    assert cache.get(1, 1, "input") == 42
+    assert cache.get(1, 1, "other input") is None
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_none_results_not_cached(cache):
+    """Unimplemented parts are never cached."""
+    cache.put(1, 1, "input", None)
+    assert cache.entries() == []
+
+
+def test_lru_eviction(cache):
+    """The least recently used entry is evicted once the cache is full."""
+    cache.put(1, 1, "a", 1)
+    cache.put(1, 1, "b", 2)
+    # Age both entries, then make "a" the most recently used one
+    for path in cache.entries():
+        os.utime(path, (1000, 1000))
+    assert cache.get(1, 1, "a") == 1
+
+    cache.put(1, 1, "c", 3)
+    assert cache.get(1, 1, "a") == 1
+    assert cache.get(1, 1, "b") is None
+    assert cache.get(1, 1, "c") == 3
+
+
+def test_key_depends_on_utils_source(monkeypatch):
+    """Changing a utils module a day imports changes its cache keys."""
+    before = cache_key(4, 1, "input")
+    original = result_cache._module_path
+
+    def patched(module):
+        path = original(module)
+        if module == "aoc2025.utils.array_grid":
+            return result_cache.PACKAGE_DIR / "utils" / "parsing.py"
+        return path
+
+    monkeypatch.setattr(result_cache, "_module_path", patched)
+    assert cache_key(4, 1, "input") != before
+
+
+def test_concurrent_puts_of_one_key(tmp_path):
+    """Writers of the same key don't share a temp file."""
+    cache = ResultCache(tmp_path)
+    threads = [
+        threading.Thread(target=cache.put, args=(1, 1, "input", n)) for n in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert cache.get(1, 1, "input") in range(8)
+    assert list(tmp_path.glob("*.tmp")) == []
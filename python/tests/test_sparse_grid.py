@@ -0,0 +1,84 @@
+"""Tests for the sparse chunked grid."""
+
+import random
+
+from aoc2025.utils.sparse_grid import CHUNK_SIZE, SparseGrid
+
+
+def test_get_set_with_negative_and_huge_coordinates():
+    grid = SparseGrid()
+    points = [(0, 0), (-1, -1), (-CHUNK_SIZE, 5), (3_000_000, -7_000_000)]
+    for i, (x, y) in enumerate(points):
+        grid.set(x, y, chr(ord("a") + i))
+
+    for i, (x, y) in enumerate(points):
+        assert grid.get(x, y) == chr(ord("a") + i)
+    assert grid.get(1, 0) == "."
+    assert len(grid.chunks) == 4
+
+
+def test_setting_default_does_not_allocate():
+    grid = SparseGrid()
+    grid.set(10**9, 10**9, ".")
+    assert grid.chunks == {}
+
+
+def test_from_string_and_str_round_trip():
+    text = "#..\n.#.\n..#"
+    grid = SparseGrid.from_string(text, origin=(-2, -70))
+    assert grid.bbox() == (-2, -70, 0, -68)
+    assert str(grid) == text
+    assert grid.find_all("#") == [(-2, -70), (-1, -69), (0, -68)]
+
+
+def test_fill_rect_matches_cell_by_cell():
+    rng = random.Random(3)
+    grid, expected = SparseGrid(), {}
+    for _ in range(30):
+        x0, x1 = sorted(rng.randint(-150, 150) for _ in range(2))
+        y0, y1 = sorted(rng.randint(-150, 150) for _ in range(2))
+        value = rng.choice("#@.")
+        grid.fill_rect(x1, y1, x0, y0, value)
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                expected[(x, y)] = value
+
+    cells = {p: v for p, v in expected.items() if v != "."}
+    assert dict(grid.iter()) == cells
+    assert grid.count("#") == sum(v == "#" for v in cells.values())
+
+    xs = [x for x, _ in cells]
+    ys = [y for _, y in cells]
+    assert grid.bbox() == (min(xs), min(ys), max(xs), max(ys))
+
+
+def test_clearing_whole_chunks_frees_them():
+    grid = SparseGrid()
+    grid.fill_rect(0, 0, 4 * CHUNK_SIZE - 1, CHUNK_SIZE - 1, "#")
+    assert len(grid.chunks) == 4
+    grid.fill_rect(0, 0, 4 * CHUNK_SIZE - 1, CHUNK_SIZE - 1, ".")
+    assert grid.chunks == {}
+    assert grid.bbox() is None
+
+
+def test_partial_clears_free_chunks_left_blank():
+    grid = SparseGrid()
+    grid.set(5, 5, "#")
+    grid.fill_rect(0, 0, 10, 10, ".")
+    assert grid.chunks == {}
+    assert grid.bbox() is None
+
+    grid.set(5, 5, "#")
+    grid.set(6, 5, "#")
+    grid.set(5, 5, ".")
+    assert len(grid.chunks) == 1
+    grid.set(6, 5, ".")
+    assert grid.chunks == {}
+
+
+def test_iter_chunks_origins():
+    grid = SparseGrid()
+    grid.set(-1, CHUNK_SIZE, "#")
+    ((origin, cells),) = grid.iter_chunks()
+    assert origin == (-CHUNK_SIZE, CHUNK_SIZE)
+    assert cells[CHUNK_SIZE - 1] == ord("#")